@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Diff of two versions of a 100k cues file: one cue out of ten retimed, one
+out of fifty retexted, some removed and inserted.
+
+    $ python benchmarks/bench_diff.py
+"""
+from os.path import abspath, dirname, join
+from sys import path
+from timeit import default_timer
+
+path.insert(0, abspath(join(dirname(__file__), '..')))
+
+from pyvtt import WebVTTFile, WebVTTItem
+
+CUES = 100000
+
+
+def build_files():
+    old_items, new_items = [], []
+    for index in range(CUES):
+        start = index * 2000
+        text = 'Subtitle number %d' % index
+        old_items.append(WebVTTItem(index + 1, start, start + 1500, text))
+        if index % 97 == 0:
+            continue
+        if index % 10 == 0:
+            start += 200
+        if index % 50 == 1:
+            text += ' (fixed)'
+        new_items.append(WebVTTItem(index + 1, start, start + 1500, text))
+        if index % 101 == 0:
+            new_items.append(WebVTTItem(None, start + 1600, start + 1900,
+                                        'Inserted'))
+    return WebVTTFile(old_items), WebVTTFile(new_items)
+
+
+def main():
+    old_file, new_file = build_files()
+    start = default_timer()
+    changes = old_file.diff(new_file)
+    elapsed = default_timer() - start
+    counts = {}
+    for change in changes:
+        counts[change.kind] = counts.get(change.kind, 0) + 1
+    print('%d changes in %.3fs: %s' % (
+        len(changes), elapsed,
+        ', '.join('%s %d' % item for item in sorted(counts.items()))))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Saving a big file after editing a few cues, in full then incrementally.
+
+    $ python benchmarks/bench_incremental.py [cues] [edits]
+"""
+from io import open as iopen
+from os import close, remove
+from os.path import abspath, dirname, getsize, join
+from random import Random
+from sys import argv, path
+from tempfile import mkstemp
+from timeit import default_timer
+
+path.insert(0, abspath(join(dirname(__file__), '..')))
+
+from pyvtt import WebVTTFile, WebVTTItem
+
+CUES = 200000
+EDITS = 10
+
+
+def read(path):
+    vtt_file = WebVTTFile(path=path, encoding='utf_8')
+    with iopen(path, encoding='utf_8', newline='') as source_file:
+        vtt_file.read(source_file, track_source=True)
+    return vtt_file
+
+
+def edit(vtt_file, edits):
+    random = Random(42)
+    for step in range(edits):
+        item = vtt_file[random.randrange(len(vtt_file))]
+        item.text = u'Edited number %d' % step
+
+
+def main():
+    cues = int(argv[1]) if len(argv) > 1 else CUES
+    edits = int(argv[2]) if len(argv) > 2 else EDITS
+    handle, path = mkstemp(suffix='.vtt')
+    close(handle)
+    try:
+        WebVTTFile([WebVTTItem(index + 1, index * 2000, index * 2000 + 1500,
+                               u'Subtitle number %d\nwith a second line' %
+                               index) for index in range(cues)],
+                   eol='\n').save(path)
+        print('%d cues, %.1f MB, %d edits' % (cues, getsize(path) / 1e6,
+                                              edits))
+        for incremental in (False, True):
+            vtt_file = read(path)
+            edit(vtt_file, edits)
+            start = default_timer()
+            vtt_file.save(incremental=incremental)
+            print('%s save: %.3fs' % ('incremental' if incremental else
+                                      'full', default_timer() - start))
+    finally:
+        remove(path)
+
+
+if __name__ == '__main__':
+    main()
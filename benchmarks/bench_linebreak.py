@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Line breaking of 100k cues: former regex based `vtt break` against
+pyvtt.linebreak greedy and balanced modes.
+
+    $ python benchmarks/bench_linebreak.py
+"""
+from os.path import abspath, dirname, join
+from random import choice, randint, seed
+from re import compile
+from sys import path
+from timeit import default_timer
+
+path.insert(0, abspath(join(dirname(__file__), '..')))
+
+from pyvtt.linebreak import break_text, GREEDY, BALANCED
+
+CUES = 100000
+LENGTH = 42
+WORDS = ('the', 'quick', 'brown', 'fox', 'jumps', 'over', 'lazy', 'dog',
+         '<i>really</i>', 'extraordinarily', '<v Roger>Hello', 'a', 'I')
+
+
+def regex_break(text, length, split_re={}):
+    if length not in split_re:
+        split_re[length] = compile(r'(.{,%i})(?:\s+|$)' % length)
+    return '\n'.join(split_re[length].split(text)[1::2])
+
+
+def bench(name, function, texts):
+    start = default_timer()
+    for text in texts:
+        function(text)
+    print('%-10s %.3fs' % (name, default_timer() - start))
+
+
+def main():
+    seed(42)
+    texts = [' '.join(choice(WORDS) for _ in range(randint(3, 20)))
+             for _ in range(CUES)]
+    print('%d cues, %d characters per line' % (CUES, LENGTH))
+    bench('regex', lambda text: regex_break(text, LENGTH), texts)
+    bench(GREEDY, lambda text: break_text(text, LENGTH, GREEDY), texts)
+    bench(BALANCED, lambda text: break_text(text, LENGTH, BALANCED), texts)
+
+
+if __name__ == '__main__':
+    main()
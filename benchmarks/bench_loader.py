@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Loading of the test fixtures in each encoding, grown to a big file: lines
+read through a codecs StreamReader as before, then decoded at once.
+
+    $ python benchmarks/bench_loader.py [size in MB]
+"""
+from codecs import open as copen
+from os import close, remove
+from os.path import abspath, dirname, getsize, join
+from sys import argv, path
+from tempfile import mkstemp
+from timeit import default_timer
+
+path.insert(0, abspath(join(dirname(__file__), '..')))
+
+from pyvtt import WebVTTFile
+from pyvtt.vttfile import BOMS
+
+STATIC_PATH = join(dirname(abspath(__file__)), '..', 'tests', 'static')
+FIXTURES = (('utf-8.vtt', 'utf_8'), ('bom-utf-8.srt', 'utf_8'),
+            ('bom-utf-16-le.srt', 'utf_16_le'),
+            ('bom-utf-16-be.srt', 'utf_16_be'),
+            ('bom-utf-32-le.srt', 'utf_32_le'),
+            ('windows-1252.srt', 'windows-1252'))
+SIZE = 10
+
+
+def write_file(path, fixture, encoding, size):
+    with open(join(STATIC_PATH, fixture), 'rb') as fixture_file:
+        data = fixture_file.read()
+    bom = b''
+    for file_bom, codec in BOMS:
+        if codec == encoding and data.startswith(file_bom):
+            bom, data = file_bom, data[len(file_bom):]
+    text = data.decode(encoding).rstrip() + u'\n\n'
+    with open(path, 'wb') as output_file:
+        output_file.write(bom)
+        data = text.encode(encoding)
+        for repeat in range(max(size * 1000000 // len(data), 1)):
+            output_file.write(data)
+
+
+def read_codecs(path, encoding):
+    with copen(path, 'r', encoding=encoding) as source_file:
+        return sum(1 for line in source_file)
+
+
+def read_io(path, encoding):
+    source_file = WebVTTFile._open_unicode_file(path, encoding)[0]
+    return sum(1 for line in source_file)
+
+
+def timed(function, *args):
+    start = default_timer()
+    result = function(*args)
+    return default_timer() - start, result
+
+
+def main():
+    size = int(argv[1]) if len(argv) > 1 else SIZE
+    handle, path = mkstemp(suffix='.vtt')
+    close(handle)
+    try:
+        for fixture, encoding in FIXTURES:
+            write_file(path, fixture, encoding, size)
+            codecs_time, codecs_lines = timed(read_codecs, path, encoding)
+            io_time, io_lines = timed(read_io, path, encoding)
+            open_time, vtt_file = timed(WebVTTFile.open, path, encoding)
+            print('%-18s %-12s %5.1f MB: lines %.2fs -> %.2fs (x%.1f), '
+                  'open %.2fs, %d lines, %d cues' % (
+                      fixture, encoding, getsize(path) / 1e6, codecs_time,
+                      io_time, codecs_time / io_time, open_time, io_lines,
+                      len(vtt_file)))
+            if codecs_lines != io_lines:
+                print('  codecs read %d lines' % codecs_lines)
+    finally:
+        remove(path)
+
+
+if __name__ == '__main__':
+    main()
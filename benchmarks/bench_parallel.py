@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Parsing of a big file in a single process, then in parallel with an
+increasing number of workers.
+
+    $ python benchmarks/bench_parallel.py [cues]
+"""
+from multiprocessing import cpu_count
+from os import close, remove
+from os.path import abspath, dirname, getsize, join
+from sys import argv, path
+from tempfile import mkstemp
+from timeit import default_timer
+
+path.insert(0, abspath(join(dirname(__file__), '..')))
+
+from pyvtt import WebVTTFile
+
+CUES = 1000000
+
+
+def write_file(path, cues):
+    with open(path, 'w') as vtt_file:
+        vtt_file.write('WEBVTT\n\n')
+        for index in range(cues):
+            start = index * 2000
+            vtt_file.write('%d\n%02d:%02d:%02d.%03d --> %02d:%02d:%02d.%03d\n'
+                           'Subtitle number %d\nwith a second line\n\n' % (
+                               index + 1, start // 3600000,
+                               start // 60000 % 60, start // 1000 % 60, 0,
+                               start // 3600000, start // 60000 % 60,
+                               start // 1000 % 60, 500, index))
+
+
+def main():
+    cues = int(argv[1]) if len(argv) > 1 else CUES
+    handle, path = mkstemp(suffix='.vtt')
+    close(handle)
+    try:
+        write_file(path, cues)
+        print('%d cues, %.1f MB' % (cues, getsize(path) / 1e6))
+        workers, serial = 1, None
+        while workers <= cpu_count():
+            start = default_timer()
+            vtt_file = WebVTTFile.open_parallel(path, workers=workers)
+            elapsed = default_timer() - start
+            serial = serial or elapsed
+            print('%2d workers: %.2fs (x%.1f), %d cues' % (
+                workers, elapsed, serial / elapsed, len(vtt_file)))
+            workers *= 2
+    finally:
+        remove(path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Pickle size and round trip time of a 50k cues WebVTTFile, as shipped to
+worker processes by multiprocessing.
+
+    $ python benchmarks/bench_pickle.py
+"""
+from os.path import abspath, dirname, join
+from pickle import dumps, loads, HIGHEST_PROTOCOL
+from sys import path
+from timeit import default_timer
+
+path.insert(0, abspath(join(dirname(__file__), '..')))
+
+from pyvtt import WebVTTFile, WebVTTItem
+
+CUES = 50000
+ROUNDS = 5
+
+
+def build_file():
+    return WebVTTFile([
+        WebVTTItem(index + 1, index * 2000, index * 2000 + 1500,
+                   'Subtitle number %d\nwith a second line' % index)
+        for index in range(CUES)])
+
+
+def main():
+    vtt_file = build_file()
+    for protocol in (2, HIGHEST_PROTOCOL):
+        data = dumps(vtt_file, protocol)
+        start = default_timer()
+        for _ in range(ROUNDS):
+            loads(dumps(vtt_file, protocol))
+        elapsed = (default_timer() - start) / ROUNDS
+        print('protocol %d: %d bytes, %.3fs per round trip' % (
+            protocol, len(data), elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Resync estimate of a 2000 cues track, about a feature film, against a
+reference track, with NumPy if available and with the pure Python fallback.
+
+    $ python benchmarks/bench_resync.py
+"""
+from os.path import abspath, dirname, join
+from random import Random
+from sys import path
+from timeit import default_timer
+
+path.insert(0, abspath(join(dirname(__file__), '..')))
+
+from pyvtt import WebVTTFile, WebVTTItem
+from pyvtt import resync
+
+CUES = 2000
+OFFSET = 7350
+RATIO = 25 / (24000 / 1001.0)
+
+
+def build_files():
+    random = Random(0)
+    reference, mistimed, start = [], [], 0
+    for index in range(CUES):
+        start += random.randint(1500, 6000)
+        reference.append(WebVTTItem(index + 1, start, start + 1200, ''))
+        if random.random() < 0.8:
+            shifted = int((start - OFFSET) / RATIO) + random.randint(-150, 150)
+            mistimed.append(WebVTTItem(index + 1, shifted, shifted + 1200,
+                                       ''))
+    return WebVTTFile(mistimed), WebVTTFile(reference)
+
+
+def main():
+    vtt_file, reference = build_files()
+    for name, numpy in (('numpy', resync.numpy), ('python', None)):
+        if name == 'numpy' and numpy is None:
+            continue
+        resync.numpy = numpy
+        start = default_timer()
+        alignment = resync.estimate(vtt_file, reference)
+        print('%s: %s in %.3fs' % (name, alignment, default_timer() - start))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Start up time of the vtt command: `vtt --version` and `vtt shift` on a tiny
+file, in fresh interpreters. Exit with status 1 if the best run of a
+command goes over BUDGET.
+
+    $ python benchmarks/bench_startup.py
+"""
+from os import close, devnull, remove
+from os.path import abspath, dirname, join
+from subprocess import check_call
+from sys import executable, exit
+from tempfile import mkstemp
+from timeit import default_timer
+
+ROOT = abspath(join(dirname(__file__), '..'))
+RUNS = 10
+# Seconds, interpreter start included
+BUDGET = 0.25
+
+TINY_FILE = u"""WEBVTT
+
+1
+00:00:01.000 --> 00:00:02.000
+Hello
+"""
+
+
+def run(*args):
+    command = [executable, '-c',
+               'import sys; sys.path.insert(0, %r); '
+               'from pyvtt.commands import main; main()' % ROOT]
+    start = default_timer()
+    with open(devnull, 'w') as null:
+        check_call(command + list(args), stdout=null)
+    return default_timer() - start
+
+
+def main():
+    handle, path = mkstemp(suffix='.vtt')
+    close(handle)
+    try:
+        over_budget = False
+        for args in (['--version'], ['shift', '1s', path]):
+            with open(path, 'w') as tiny_file:
+                tiny_file.write(TINY_FILE)
+            best = min(run(*args) for _ in range(RUNS))
+            over_budget |= best > BUDGET
+            print('vtt %s: %.3fs (budget %.3fs)' % (' '.join(args[:2]), best,
+                                                   BUDGET))
+    finally:
+        remove(path)
+    exit(1 if over_budget else 0)
+
+
+if __name__ == '__main__':
+    main()
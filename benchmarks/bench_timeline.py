@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Live editing of a long track: random inserts, removals and retimings, each
+followed by an up to date cue index, with a WebVTTFile then a Timeline.
+
+    $ python benchmarks/bench_timeline.py [cues] [edits]
+
+WebVTTFile edits cost a full reindexing each, so only a sample of them is
+timed and its time scaled to all edits.
+"""
+from os.path import abspath, dirname, join
+from random import Random
+from sys import argv, path
+from timeit import default_timer
+
+path.insert(0, abspath(join(dirname(__file__), '..')))
+
+from pyvtt import WebVTTFile, WebVTTItem, WebVTTTime
+
+CUES = 100000
+EDITS = 10000
+FILE_EDITS = 200
+
+
+def make_file(cues):
+    return WebVTTFile([WebVTTItem(index + 1, index * 2000, index * 2000 + 1500,
+                                  'Subtitle number %d' % index)
+                       for index in range(cues)])
+
+
+def edits(cues, count):
+    random = Random(42)
+    for step in range(count):
+        start = random.randrange(cues * 2000)
+        yield (random.randrange(3), random.random(), start,
+               start + random.randrange(500, 3000))
+
+
+def edit_file(vtt_file, count):
+    for action, choice, start, end in edits(len(vtt_file), count):
+        if action == 0:
+            vtt_file.add(WebVTTItem(None, start, end, 'New'))
+        elif action == 1:
+            del vtt_file[int(choice * len(vtt_file))]
+        else:
+            item = vtt_file.pop(int(choice * len(vtt_file)))
+            item.start = WebVTTTime.coerce(start)
+            item.end = WebVTTTime.coerce(end)
+            vtt_file.add(item)
+        vtt_file.clean_indexes()
+
+
+def edit_timeline(timeline, count):
+    for action, choice, start, end in edits(len(timeline), count):
+        if action == 0:
+            item = WebVTTItem(None, start, end, 'New')
+            timeline.add(item)
+        elif action == 1:
+            del timeline[int(choice * len(timeline))]
+            continue
+        else:
+            item = timeline[int(choice * len(timeline))]
+            timeline.retime(item, start, end)
+        item.index = timeline.position(item) + 1
+
+
+def main():
+    cues = int(argv[1]) if len(argv) > 1 else CUES
+    count = int(argv[2]) if len(argv) > 2 else EDITS
+    sample = min(count, FILE_EDITS)
+
+    vtt_file = make_file(cues)
+    start = default_timer()
+    edit_file(vtt_file, sample)
+    file_time = (default_timer() - start) * count / sample
+    print('WebVTTFile: %.2fs for %d edits on %d cues (%.3fms per edit)' % (
+        file_time, count, cues, file_time * 1000 / count))
+
+    vtt_file = make_file(cues)
+    start = default_timer()
+    timeline = vtt_file.timeline()
+    edit_timeline(timeline, count)
+    vtt_file = timeline.to_file()
+    timeline_time = default_timer() - start
+    print('Timeline: %.2fs for %d edits on %d cues (%.3fms per edit), '
+          'x%.0f' % (timeline_time, count, cues,
+                     timeline_time * 1000 / count, file_time / timeline_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Copy-on-write views of a big file: reading a view (and the original once a
+view is taken) must cost about as much as reading a plain file, only edits
+copy items.
+
+    $ python benchmarks/bench_view.py [cues]
+"""
+from copy import deepcopy
+from io import StringIO
+from os.path import abspath, dirname, join
+from sys import argv, path
+from timeit import default_timer
+
+path.insert(0, abspath(join(dirname(__file__), '..')))
+
+from pyvtt import WebVTTFile, WebVTTItem
+
+CUES = 100000
+
+
+def iterate(vtt_file):
+    for _ in vtt_file:
+        pass
+
+
+def render(vtt_file):
+    vtt_file.write_into(StringIO())
+
+
+def timed(label, function, *args):
+    start = default_timer()
+    result = function(*args)
+    print('%-24s %.3fs' % (label, default_timer() - start))
+    return result
+
+
+def main():
+    cues = int(argv[1]) if len(argv) > 1 else CUES
+    vtt_file = WebVTTFile([WebVTTItem(index + 1, index * 2000,
+                                      index * 2000 + 1500,
+                                      u'Subtitle number %d' % index)
+                           for index in range(cues)], eol='\n')
+    print('%d cues' % cues)
+    timed('iterate file', iterate, vtt_file)
+    timed('deepcopy', deepcopy, vtt_file)
+    view = timed('view', vtt_file.view)
+    timed('iterate view', iterate, view)
+    timed('iterate original', iterate, vtt_file)
+    timed('write_into view', render, view)
+    timed('at on view', view.at, {'seconds': cues})
+    timed('shift view', view.shift, 0, 0, 1)
+    copied = sum(1 for a, b in zip(view.data, vtt_file.data) if a is not b)
+    print('%d items copied' % copied)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Serialization of a big file to bytes: rendered to a string then encoded as
+before, then encoded by chunks, and saved through codecs then by chunks.
+
+    $ python benchmarks/bench_write.py [cues]
+"""
+from codecs import open as copen
+from io import StringIO
+from os import close, remove
+from os.path import abspath, dirname, join
+from sys import argv, path
+from tempfile import mkstemp
+from timeit import default_timer
+
+path.insert(0, abspath(join(dirname(__file__), '..')))
+
+from pyvtt import WebVTTFile, WebVTTItem
+
+CUES = 200000
+
+
+def render(vtt_file):
+    output = StringIO()
+    vtt_file.write_into(output)
+    return output.getvalue().encode(vtt_file.encoding)
+
+
+def write_to_buffer(vtt_file):
+    buffer = bytearray(64 * 1024 * 1024)
+    return memoryview(buffer)[:vtt_file.write_to_buffer(memoryview(buffer))]
+
+
+def stream(vtt_file):
+    return sum(len(chunk) for chunk in vtt_file.iter_encoded())
+
+
+def save_codecs(vtt_file, path):
+    with copen(path, 'w+', encoding=vtt_file.encoding) as save_file:
+        vtt_file.write_into(save_file)
+
+
+def timed(label, function, *args):
+    start = default_timer()
+    function(*args)
+    print('%-24s %.3fs' % (label, default_timer() - start))
+
+
+def main():
+    cues = int(argv[1]) if len(argv) > 1 else CUES
+    vtt_file = WebVTTFile([WebVTTItem(index + 1, index * 2000,
+                                      index * 2000 + 1500,
+                                      u'Subtitle number %d\nwith é' % index)
+                           for index in range(cues)], eol='\n')
+    print('%d cues, %.1f MB' % (cues, len(vtt_file.to_bytes()) / 1e6))
+    timed('string then encode', render, vtt_file)
+    timed('to_bytes', vtt_file.to_bytes)
+    timed('write_to_buffer', write_to_buffer, vtt_file)
+    timed('iter_encoded', stream, vtt_file)
+    handle, path = mkstemp(suffix='.vtt')
+    close(handle)
+    try:
+        timed('save through codecs', save_codecs, vtt_file, path)
+        timed('save', vtt_file.save, path)
+    finally:
+        remove(path)
+
+
+if __name__ == '__main__':
+    main()
@@ -12,71 +12,29 @@
 import sys
 import getopt
 from pyvtt import WebVTTFile
-from pyvtt import WebVTTItem
 from pyvtt import WebVTTTime
-
-
-def join_lines(txtsub1, txtsub2):
-    if (len(txtsub1) > 0) & (len(txtsub2) > 0):
-        return txtsub1 + '\n' + txtsub2
-    else:
-        return txtsub1 + txtsub2
-
-
-def find_subtitle(subtitle, from_t, to_t, lo=0):
-    i = lo
-    while (i < len(subtitle)):
-        if (subtitle[i].start >= to_t):
-            break
-
-        if (subtitle[i].start <= from_t) & (to_t  <= subtitle[i].end):
-            return subtitle[i].text, i
-        i += 1
-
-    return "", i
-
+from pyvtt.merge import merge
 
 
 def merge_subtitle(sub_a, sub_b, delta):
-    out = WebVTTFile()
-    intervals = [item.start.ordinal for item in sub_a]
-    intervals.extend([item.end.ordinal for item in sub_a])
-    intervals.extend([item.start.ordinal for item in sub_b])
-    intervals.extend([item.end.ordinal for item in sub_b])
-    intervals.sort()
-
-    j = k = 0
-    for i in xrange(1, len(intervals)):
-        start = WebVTTTime.from_ordinal(intervals[i - 1])
-        end = WebVTTTime.from_ordinal(intervals[i])
-
-        if (end-start) > delta:
-            text_a, j = find_subtitle(sub_a, start, end, j)
-            text_b, k = find_subtitle(sub_b, start, end, k)
-
-            text = join_lines(text_a, text_b)
-            if len(text) > 0:
-                item = WebVTTItem(0, start, end, text)
-                out.append(item)
+    return merge([sub_a, sub_b], delta)
 
-    out.clean_indexes()
-    return out
 
 def usage():
-    print "Usage: ./srtmerge [options] lang1.srt lang2.srt out.srt"
-    print
-    print "Options:"
-    print "  -d <milliseconds>         The shortest time length of the one subtitle"
-    print "  --delta=<milliseconds>    default: 500"
-    print "  -e <encoding>             Encoding of input and output files."
-    print "  --encoding=<encoding>     default: utf_8"
+    print("Usage: ./srtmerge [options] lang1.srt lang2.srt out.srt")
+    print("")
+    print("Options:")
+    print("  -d <milliseconds>         The shortest time length of the one subtitle")
+    print("  --delta=<milliseconds>    default: 500")
+    print("  -e <encoding>             Encoding of input and output files.")
+    print("  --encoding=<encoding>     default: utf_8")
 
 
 def main():
     try:
         opts, args = getopt.getopt(sys.argv[1:], 'hd:e:', ["help", "encoding=", "delta="])
-    except getopt.GetoptError, err:
-        print str(err)
+    except getopt.GetoptError as err:
+        print(str(err))
         usage()
         sys.exit(2)
 
@@ -85,7 +43,7 @@ def main():
     encoding="utf_8"
     #-
 
-    if len(args) <> 3:
+    if len(args) != 3:
         usage()
         sys.exit(2)
 
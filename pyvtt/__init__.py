@@ -12,5 +12,7 @@ ERROR_LOG = WebVTTFile.ERROR_LOG
 ERROR_RAISE = WebVTTFile.ERROR_RAISE
 
 open = WebVTTFile.open
+open_cached = WebVTTFile.open_cached
+open_parallel = WebVTTFile.open_parallel
 stream = WebVTTFile.stream
 from_string = WebVTTFile.from_string
@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+"""
+Compact binary serialization of parsed files, and sidecar caches using it
+
+Layout (little endian):
+    header: magic, version, error handling, items count, source mtime,
+        size and sha1, then encoding it was opened with
+    starts, ends, integer indexes: one int64 per item each
+    index kinds: one byte per item (none, integer or string)
+    string lengths: one uint32 per string, in characters
+    strings: a single UTF-8 blob holding eol, encoding, then index, position
+        and text of every item
+"""
+from array import array
+from codecs import lookup
+from gc import disable, enable, isenabled
+from hashlib import sha1
+from os import remove, rename, stat
+from struct import Struct
+from sys import byteorder
+
+from pyvtt.compat import str
+from pyvtt.vttexc import InvalidFile
+from pyvtt.vttitem import WebVTTItem
+from pyvtt.vtttime import WebVTTTime
+
+MAGIC = b'PYVTTBIN'
+VERSION = 2
+HEADER = Struct('<8sBB2xIqq20s32s')
+CACHE_EXTENSION = '.vttc'
+
+INDEX_NONE = 0
+INDEX_INT = 1
+INDEX_STRING = 2
+
+NO_SOURCE = (0, 0, b'\0' * 20)
+NO_OPTIONS = (None, 0)
+
+
+def _to_bytes(values):
+    if byteorder == 'big':
+        values.byteswap()
+    return values.tobytes() if hasattr(values, 'tobytes') else \
+        values.tostring()
+
+
+def _from_bytes(typecode, data):
+    values = array(typecode)
+    if hasattr(values, 'frombytes'):
+        values.frombytes(data)
+    else:
+        values.fromstring(bytes(data))
+    if byteorder == 'big':
+        values.byteswap()
+    return values
+
+
+def _encoding_name(encoding):
+    return lookup(encoding).name if encoding else ''
+
+
+def dumps(vtt_file, source=NO_SOURCE, options=NO_OPTIONS):
+    """
+    dumps(vtt_file[, source][, options]) -> bytes
+
+    `source` -> (mtime in nanoseconds, size, sha1 digest) of the file
+        `vtt_file` was read from, used to validate caches.
+    `options` -> (encoding, error_handling) it was opened with, None
+        encoding meaning it was detected.
+    """
+    starts, ends = array('q'), array('q')
+    indexes, kinds = array('q'), array('b')
+    strings = [vtt_file._eol or '', vtt_file.encoding or '']
+    for item in vtt_file:
+        starts.append(int(item.start.ordinal))
+        ends.append(int(item.end.ordinal))
+        if item.index is None:
+            kinds.append(INDEX_NONE)
+            indexes.append(0)
+            strings.append('')
+        elif isinstance(item.index, int):
+            kinds.append(INDEX_INT)
+            indexes.append(item.index)
+            strings.append('')
+        else:
+            kinds.append(INDEX_STRING)
+            indexes.append(0)
+            strings.append(str(item.index))
+        strings.append(item.position)
+        strings.append(item.text)
+    lengths = array('I', [len(s) for s in strings])
+
+    mtime, size, digest = source
+    encoding, error_handling = options
+    return b''.join((
+        HEADER.pack(MAGIC, VERSION, error_handling, len(starts), mtime,
+                    size, digest, _encoding_name(encoding).encode('ascii')),
+        _to_bytes(starts), _to_bytes(ends), _to_bytes(indexes),
+        _to_bytes(kinds), _to_bytes(lengths),
+        ''.join(strings).encode('utf-8'),
+    ))
+
+
+def read_header(data):
+    """
+    read_header(data) -> (count, source, options)
+
+    Raise InvalidFile if `data` does not start with a binary header.
+    """
+    if len(data) < HEADER.size:
+        raise InvalidFile('Truncated binary file')
+    (magic, version, error_handling, count, mtime, size, digest,
+     encoding) = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise InvalidFile('Not a pyvtt binary file')
+    encoding = encoding.rstrip(b'\0').decode('ascii') or None
+    return count, (mtime, size, digest), (encoding, error_handling)
+
+
+def loads(data, file_class, path=None):
+    """
+    loads(data, file_class[, path]) -> file_class instance
+
+    Decode strings in one go and build items straight from ordinals.
+    """
+    count, _, _ = read_header(data)
+    view = memoryview(data)
+    offset = HEADER.size
+    columns = []
+    for typecode, length in (('q', count), ('q', count), ('q', count),
+                             ('b', count), ('I', 3 * count + 2)):
+        size = length * array(typecode).itemsize
+        columns.append(_from_bytes(typecode, view[offset:offset + size]))
+        offset += size
+    starts, ends, indexes, kinds, lengths = columns
+    if len(lengths) != 3 * count + 2:
+        raise InvalidFile('Truncated binary file')
+    try:
+        strings = bytes(view[offset:]).decode('utf-8')
+    except UnicodeDecodeError:
+        raise InvalidFile('Corrupted binary file')
+
+    bounds = [0]
+    for length in lengths:
+        bounds.append(bounds[-1] + length)
+    if bounds[-1] != len(strings):
+        raise InvalidFile('Corrupted binary file')
+
+    def string(position):
+        return strings[bounds[position]:bounds[position + 1]]
+
+    # Values are already of the right types: skip __init__ coercions, which
+    # cost most of the time of loading otherwise. None of the objects built
+    # can be garbage, so garbage collections they would trigger are skipped
+    # too.
+    gc_enabled = isenabled()
+    disable()
+    try:
+        items = _build_items(count, starts, ends, indexes, kinds, string)
+    finally:
+        if gc_enabled:
+            enable()
+    return file_class(items, eol=string(0) or None, path=path,
+                      encoding=string(1) or None)
+
+
+def _build_items(count, starts, ends, indexes, kinds, string):
+    new_item, new_time = WebVTTItem.__new__, WebVTTTime.__new__
+    items = []
+    for position in range(count):
+        base = 2 + 3 * position
+        kind = kinds[position]
+        if kind == INDEX_INT:
+            index = indexes[position]
+        elif kind == INDEX_STRING:
+            index = string(base)
+        else:
+            index = None
+        start, end = new_time(WebVTTTime), new_time(WebVTTTime)
+        start.ordinal, end.ordinal = starts[position], ends[position]
+        item = new_item(WebVTTItem)
+        item.__dict__.update(index=index, start=start, end=end,
+                             _position=string(base + 1),
+                             _text=string(base + 2), _timestamps=None)
+        items.append(item)
+    return items
+
+
+def source_stat(path):
+    """
+    source_stat(path) -> (mtime in nanoseconds, size)
+    """
+    path_stat = stat(path)
+    mtime = getattr(path_stat, 'st_mtime_ns', None)
+    if mtime is None:
+        mtime = int(path_stat.st_mtime * 1e9)
+    return mtime, path_stat.st_size
+
+
+def source_digest(path):
+    return sha1(_read_source(path)).digest()
+
+
+def _read_source(path):
+    with open(path, 'rb') as source_file:
+        return source_file.read()
+
+
+def open_cached(file_class, path, encoding=None, error_handling=0,
+                cache_path=None):
+    """
+    open_cached(file_class, path[, encoding][, error_handling][, cache_path])
+
+    Load `path` from its binary sidecar cache (`path` + '.vttc' by default)
+    if it is still valid, otherwise open it and refresh the cache.
+
+    A cache is valid if it was written for the same encoding and
+    error_handling, and if the source size and mtime did not change, or if
+    only mtime changed but its sha1 digest did not. Cache write failures
+    are ignored.
+    """
+    cache_path = cache_path or path + CACHE_EXTENSION
+    mtime, size = source_stat(path)
+    options = (_encoding_name(encoding) or None, error_handling)
+    # Source content, read at most once to be both hashed and parsed
+    source = None
+    try:
+        with open(cache_path, 'rb') as cache_file:
+            data = cache_file.read()
+        _, (cached_mtime, cached_size, digest), cached_options = \
+            read_header(data)
+    except (IOError, OSError, InvalidFile):
+        pass
+    else:
+        if cached_options == options and cached_size == size:
+            if cached_mtime == mtime:
+                return loads(data, file_class, path=path)
+            source = _read_source(path)
+            if digest == sha1(source).digest():
+                vtt_file = loads(data, file_class, path=path)
+                _write_cache(vtt_file, cache_path, (mtime, size, digest),
+                             options)
+                return vtt_file
+
+    if source is None:
+        source = _read_source(path)
+    vtt_file = file_class._from_bytes(source, path, encoding=encoding,
+                                      error_handling=error_handling)
+    _write_cache(vtt_file, cache_path, (mtime, size, sha1(source).digest()),
+                 options)
+    return vtt_file
+
+
+def _write_cache(vtt_file, cache_path, source, options):
+    temp_path = '%s.%s.tmp' % (cache_path, id(vtt_file))
+    try:
+        with open(temp_path, 'wb') as cache_file:
+            cache_file.write(dumps(vtt_file, source, options))
+        try:
+            rename(temp_path, cache_path)
+        except OSError:
+            # Windows does not replace existing files
+            remove(cache_path)
+            rename(temp_path, cache_path)
+    except (IOError, OSError):
+        try:
+            remove(temp_path)
+        except OSError:
+            pass
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+In memory LRU cache of opened files, validated against source mtime and size
+"""
+from collections import OrderedDict
+from os.path import abspath
+from threading import Lock
+
+from pyvtt.binary import source_stat
+from pyvtt.vttfile import WebVTTFile
+
+MAX_ENTRIES = 128
+
+
+class FileCache(object):
+    """
+    FileCache([max_entries][, max_bytes][, opener])
+
+    Keep up to `max_entries` parsed files, and no more than `max_bytes` of
+    source files if given, evicting the least recently used first.
+
+    Files are returned as copy-on-write views (see WebVTTFile.view): callers
+    may shift or edit them without altering the cached copy. Cached copies
+    are never edited, so a hit only copies the list of items. An entry is
+    reloaded as soon as the mtime or the size of its source file changes.
+
+    All methods are thread safe. Files are parsed outside of the lock, so
+    one slow load does not block hits on other files.
+
+    opener -> function(path, encoding, error_handling) -> WebVTTFile.
+        Default to WebVTTFile.open.
+
+    Example:
+        >>> cache = FileCache(max_bytes=64 * 1024 * 1024)
+        >>> subs = cache.open('movie.vtt')
+        >>> cache.stats()
+        {'hits': 0, 'misses': 1, 'evictions': 0, 'entries': 1, ...}
+    """
+
+    def __init__(self, max_entries=MAX_ENTRIES, max_bytes=None, opener=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.opener = opener or WebVTTFile.open
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.size = 0
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, path):
+        with self._lock:
+            return any(key[0] == abspath(path) for key in self._entries)
+
+    def open(self, path, encoding=None, error_handling=WebVTTFile.ERROR_PASS):
+        """
+        open(path[, encoding][, error_handling]) -> WebVTTFile
+
+        Same as WebVTTFile.open, but served from the cache when possible.
+        """
+        key = (abspath(path), encoding, error_handling)
+        stat = source_stat(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == stat:
+                self.hits += 1
+                self._move_to_end(key)
+                return entry[1]._frozen_view()
+            self.misses += 1
+
+        vtt_file = self.opener(path, encoding=encoding,
+                               error_handling=error_handling)
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = (stat, vtt_file)
+            self.size += stat[1]
+            self._evict()
+            return vtt_file._frozen_view()
+
+    def invalidate(self, path):
+        """
+        invalidate(path)
+
+        Drop every entry of `path`, whatever its encoding.
+        """
+        path = abspath(path)
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == path]:
+                self._discard(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def stats(self):
+        """
+        stats() -> dict
+
+        Counters of hits, misses and evictions, current entries and bytes.
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self.size,
+            }
+
+    def _move_to_end(self, key):
+        if hasattr(self._entries, 'move_to_end'):
+            self._entries.move_to_end(key)
+        else:
+            self._entries[key] = self._entries.pop(key)
+
+    def _discard(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry[0][1]
+
+    def _evict(self):
+        # Always keep the most recent entry, even if it is too big alone
+        while len(self._entries) > 1 and (
+                len(self._entries) > self.max_entries or
+                (self.max_bytes is not None and self.size > self.max_bytes)):
+            _, ((_, size), _) = self._entries.popitem(last=False)
+            self.size -= size
+            self.evictions += 1
+
+
+DEFAULT_CACHE = FileCache()
+
+
+def open(path, encoding=None, error_handling=WebVTTFile.ERROR_PASS):
+    """
+    open(path[, encoding][, error_handling]) -> WebVTTFile
+
+    Open `path` through the module wide cache, DEFAULT_CACHE.
+    """
+    return DEFAULT_CACHE.open(path, encoding=encoding,
+                              error_handling=error_handling)
@@ -1,16 +1,19 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 # pylint: disable-all
-from argparse import ArgumentParser, ArgumentTypeError, RawTextHelpFormatter
-from chardet import detect
-from codecs import open as copen, lookup
+from argparse import (ArgumentParser, ArgumentTypeError, RawTextHelpFormatter,
+                      REMAINDER)
+from bisect import bisect_left, bisect_right
+from codecs import (BOM_UTF8, BOM_UTF16_BE, BOM_UTF16_LE, BOM_UTF32_BE,
+                    BOM_UTF32_LE, open as copen, lookup)
 from os.path import exists, splitext
 from re import compile
 from shutil import copy2
-from sys import stdout, argv
+from sys import stderr, stdout, argv
 from textwrap import dedent
 
-from pyvtt import WebVTTFile, WebVTTTime, VERSION_STRING
+from pyvtt import WebVTTFile, WebVTTItem, WebVTTTime, VERSION_STRING
+from pyvtt.vttexc import InvalidFile
 
 
 def underline(string):
@@ -18,14 +21,22 @@ def underline(string):
 
 
 class TimeAwareArgumentParser(ArgumentParser):
+    """
+    Argument parser reading negative times (-2s) as positional arguments
+    rather than unknown options: a '--' is inserted before the first one,
+    so all following arguments are positional too. Other arguments are
+    parsed as usual, positive times can be option values (-d 200ms).
+    """
 
     RE_TIME_REPRESENTATION = compile(r'^\-?(\d+[hms]{0,2}){1,4}$')
 
     def parse_args(self, args=None, namespace=None):
+        args = list(argv[1:] if args is None else args)
         time_index = -1
         for index, arg in enumerate(args):
             match = self.RE_TIME_REPRESENTATION.match(arg)
-            if match:
+            # Only negative times can be mistaken for options
+            if match and arg.startswith('-'):
                 time_index = index
                 break
 
@@ -70,8 +81,8 @@ class WebVTTShifter(object):
     RATE_EPILOG = dedent("""\
 
         Examples:
-            Convert 23.9fps subtitles to 25fps:
-                $ vtt -i rate 23.9 25 movie.vtt
+            Convert 23.976fps subtitles to 25fps:
+                $ vtt -i rate 23.976 25 movie.vtt
     """)
     LIMITS_HELP = "Each parts duration in the form: [Hh][Mm]S[s][MSms]"
     SPLIT_EPILOG = dedent("""\
@@ -86,7 +97,16 @@ class WebVTTShifter(object):
                 $ vtt split 20m 20m movie.vtt
                 => creates movie.1.vtt, movie.2.vtt and movie.3.vtt
     """)
-    FRAME_RATE_HELP = "A frame rate in fps (commonly 23.9 or 25)"
+    FRAME_RATE_HELP = dedent("""\
+        A frame rate in fps (commonly 23.976, 25 or 29.97), NTSC rates
+        like 23.976 being read as their exact value (24000/1001)
+    """)
+    SNAP_EPILOG = dedent("""\
+
+        Examples:
+            Align subtitles on the frames of a 23.976fps video:
+                $ vtt -i snap 23.976 movie.vtt
+    """)
     ENCODING_HELP = dedent("""\
         Change file encoding. Useful for players accepting only latin1 
         subtitles. List of supported encodings: 
@@ -94,15 +114,175 @@ class WebVTTShifter(object):
     """)
     BREAK_EPILOG = dedent("""\
         Break lines longer than defined length
+
+        Examples:
+            Lines of 42 characters at most, as balanced as possible:
+                $ vtt break --mode balanced 42 movie.vtt
     """)
     LENGTH_HELP = "Maximum number of characters per line"
+    BREAK_MODE_HELP = dedent("""\
+        greedy: fill lines as much as possible (default)
+        balanced: make lines of similar lengths
+    """)
+    MERGE_EPILOG = dedent("""\
+
+        Examples:
+            Mix english and spanish subtitles in a single file:
+                $ vtt merge movie.es.vtt movie.en.vtt > movie.en-es.vtt
+
+            Drop merged subtitles shorter than 200 milliseconds:
+                $ vtt merge --delta 200ms movie.es.vtt movie.en.vtt
+    """)
+    QC_EPILOG = dedent("""\
+
+        Examples:
+            Check a file against default limits:
+                $ vtt qc movie.vtt
+
+            Allow 17 characters per second at most:
+                $ vtt qc --max-cps 17 movie.vtt
+    """)
+    CONVERT_EPILOG = dedent("""\
+
+        Examples:
+            Convert SubRip subtitles to WebVTT:
+                $ vtt convert vtt movie.srt > movie.vtt
+
+            Read a file without a known extension as SubRip:
+                $ vtt convert --from srt vtt movie.txt > movie.vtt
+    """)
+    DIFF_EPILOG = dedent("""\
+
+        Lines start with + for inserted subtitles, - for removed ones and ~
+        for retimed or retexted ones, followed by their new version.
+
+        Examples:
+            Review a re-timing of movie.vtt:
+                $ vtt diff movie.retimed.vtt movie.vtt
+    """)
+    RESYNC_EPILOG = dedent("""\
+
+        Estimate the frame rate change and offset which best align
+        subtitles on a correctly timed reference track, like another
+        language or a speech recognition output, and apply them.
+
+        Examples:
+            Fix spanish subtitles using english ones:
+                $ vtt -i resync movie.en.vtt movie.es.vtt
+    """)
+    REMAP_EPILOG = dedent("""\
+
+        Follow the edits of an edit decision list (like CMX 3600 ones):
+        subtitles of removed parts are dropped, others are moved to where
+        their part ends up.
+
+        Examples:
+            An edit list of a 24fps video whose timecodes start at 1 hour:
+                $ vtt remap --frame-rate 24 --start 1h cut.edl movie.vtt
+    """)
+    PIPE_EPILOG = dedent("""\
+
+        Chain shift, rate, snap, break, resync and remap commands separated
+        by commas, the file being read and written once. Consecutive shift,
+        rate, snap and break steps are applied in a single pass over
+        subtitles.
+
+        Examples:
+            Delay 23.976fps subtitles by 2 seconds, convert them to 25fps
+            and break their lines at 42 characters:
+                $ vtt -i pipe shift 2s , rate 23.976 25 , break 42 movie.vtt
+    """)
+    STEPS_HELP = "Commands and their arguments, separated by commas"
+    SERVE_EPILOG = dedent("""\
+
+        Run commands sent as JSON lines, one response line each, without
+        paying the interpreter start up for every file. Requests hold the
+        command line arguments, and optionally the file content:
+            {"args": ["shift", "2s", "movie.vtt"]}
+            {"args": ["rate", "25", "23.976", "-"], "content": "WEBVTT..."}
+        Responses hold the output, or an error message:
+            {"output": "WEBVTT...", "messages": ""}
+
+        Examples:
+            Listen on a Unix socket with 4 worker processes:
+                $ vtt serve --socket /tmp/vtt.sock --workers 4
+
+            Read requests from standard input:
+                $ vtt serve < requests.jsonl > responses.jsonl
+    """)
+    SOCKET_HELP = "Unix socket to listen on (default: standard input)"
+    WORKERS_HELP = dedent("""\
+        Number of worker processes, 0 to run commands in the server
+        process (default: number of CPUs)
+    """)
+    FORMAT_HELP = "Output format"
+    SOURCE_FORMAT_HELP = "Input format (default: guessed from extension)"
+    REFERENCE_HELP = "Correctly timed subtitles of the same video"
+    MAX_OFFSET_HELP = dedent("""\
+        Largest offset looked for in the form: [Hh][Mm]S[s][MSms]
+        (default: 5m)
+    """)
+    EDL_HELP = dedent("""\
+        Edit decision list, one event per line:
+        source in, source out, record in[, record out]
+    """)
+    EDL_FRAME_RATE_HELP = "Frame rate of edit list timecodes (default: 25)"
+    EDL_START_HELP = dedent("""\
+        Timecode of the first frame of the video in the form:
+        [Hh][Mm]S[s][MSms] (default: 0)
+    """)
+    NEW_VERSION_HELP = "New version of the file to compare it with"
+    TRACKS_HELP = "Subtitle files to mix with the main one"
+    DELTA_HELP = dedent("""\
+        Shortest merged subtitle duration in the form: [Hh][Mm]S[s][MSms]
+        (default: 500ms)
+    """)
+
+    # (name, help, epilog attribute) of each command, whose arguments are
+    # added by add_<name>_arguments
+    COMMANDS = (
+        ('shift', 'Shift subtitles by specified time offset', 'SHIFT_EPILOG'),
+        ('rate', 'Convert subtitles from one frame rate to another',
+         'RATE_EPILOG'),
+        ('snap', 'Move subtitle times to the nearest frame', 'SNAP_EPILOG'),
+        ('split', 'Split a file in multiple parts', 'SPLIT_EPILOG'),
+        ('break', 'Break long lines', 'BREAK_EPILOG'),
+        ('merge', 'Mix several subtitle files in a single one',
+         'MERGE_EPILOG'),
+        ('qc', 'Check reading speed, line lengths and durations',
+         'QC_EPILOG'),
+        ('convert', 'Convert subtitles to another format', 'CONVERT_EPILOG'),
+        ('diff', 'Compare subtitles with another version of the file',
+         'DIFF_EPILOG'),
+        ('resync', 'Synchronize subtitles with a reference track',
+         'RESYNC_EPILOG'),
+        ('remap', 'Follow the edits of an edit decision list',
+         'REMAP_EPILOG'),
+        ('pipe', 'Apply several commands in a row', 'PIPE_EPILOG'),
+        ('serve', 'Run commands sent as JSON lines', 'SERVE_EPILOG'),
+    )
+    # Commands which do not take a file argument, or parse it themselves
+    FILELESS_COMMANDS = ('pipe', 'serve')
+    # Commands editing the input file, which can be chained by pipe
+    EDIT_COMMANDS = ('shift', 'rate', 'snap', 'break', 'resync', 'remap')
+    PIPE_SEPARATOR = ','
+    PARSER_CLASS = TimeAwareArgumentParser
+    BOM_ENCODINGS = ((BOM_UTF32_LE, 'utf_32'), (BOM_UTF32_BE, 'utf_32'),
+                     (BOM_UTF16_LE, 'utf_16'), (BOM_UTF16_BE, 'utf_16'),
+                     (BOM_UTF8, 'utf_8_sig'))
 
     def __init__(self):
         self.output_file_path = None
+        self.error_file = stderr
 
-    def build_parser(self):
-        parser = TimeAwareArgumentParser(description=self.DESCRIPTION,
-                                         formatter_class=RawTextHelpFormatter)
+    def build_parser(self, command=None):
+        """
+        build_parser([command]) -> TimeAwareArgumentParser
+
+        Only add arguments of `command` if given, of all commands otherwise.
+        """
+        parser = self.PARSER_CLASS(description=self.DESCRIPTION,
+                                   formatter_class=RawTextHelpFormatter)
         parser.add_argument(
             '-i',
             '--in-place',
@@ -122,64 +302,195 @@ class WebVTTShifter(object):
                             action='version',
                             version='%%(prog)s %s' % VERSION_STRING)
         subparsers = parser.add_subparsers(title='commands')
-
-        shift_parser = subparsers.add_parser(
-            'shift',
-            help='Shift subtitles by specified time offset',
-            epilog=self.SHIFT_EPILOG,
-            formatter_class=RawTextHelpFormatter)
-        shift_parser.add_argument('time_offset',
-                                  action='store',
-                                  metavar=underline('offset'),
-                                  type=self.parse_time,
-                                  help=self.TIMESTAMP_HELP)
-        shift_parser.set_defaults(action=self.shift)
-
-        rate_parser = subparsers.add_parser(
-            'rate',
-            help="Convert subtitles from one frame rate to another",
-            epilog=self.RATE_EPILOG,
-            formatter_class=RawTextHelpFormatter)
-        rate_parser.add_argument('initial',
-                                 action='store',
-                                 type=float,
-                                 help=self.FRAME_RATE_HELP)
-        rate_parser.add_argument('final',
-                                 action='store',
-                                 type=float,
-                                 help=self.FRAME_RATE_HELP)
-        rate_parser.set_defaults(action=self.rate)
-
-        split_parser = subparsers.add_parser(
-            'split',
-            help='Split a file in multiple parts',
-            epilog=self.SPLIT_EPILOG,
-            formatter_class=RawTextHelpFormatter)
-        split_parser.add_argument('limits',
-                                  action='store',
-                                  nargs='+',
-                                  type=self.parse_time,
-                                  help=self.LIMITS_HELP)
-        split_parser.set_defaults(action=self.split)
-
-        break_parser = subparsers.add_parser(
-            'break',
-            help="Break long lines",
-            epilog=self.BREAK_EPILOG,
-            formatter_class=RawTextHelpFormatter)
-        break_parser.add_argument('length',
-                                  action='store',
-                                  type=int,
-                                  help=self.LENGTH_HELP)
-        break_parser.set_defaults(action=self.break_lines)
-
-        parser.add_argument('file', action='store')
+        for name, help, epilog in self.COMMANDS:
+            subparser = subparsers.add_parser(
+                name,
+                help=help,
+                epilog=getattr(self, epilog),
+                formatter_class=RawTextHelpFormatter)
+            # Only the invoked command needs its arguments, so others do
+            # not import their modules.
+            if command is None or command == name:
+                getattr(self, 'add_%s_arguments' % name)(subparser)
+                if name not in self.FILELESS_COMMANDS:
+                    subparser.add_argument('file', action='store')
+        parser.set_defaults(file=None)
 
         return parser
 
+    def add_shift_arguments(self, parser):
+        parser.add_argument('time_offset',
+                            action='store',
+                            metavar=underline('offset'),
+                            type=self.parse_time,
+                            help=self.TIMESTAMP_HELP)
+        parser.set_defaults(action=self.edit, cue_edit=self.shift_cue)
+
+    def add_rate_arguments(self, parser):
+        from pyvtt.frames import parse_rate
+        parser.add_argument('initial',
+                            action='store',
+                            type=parse_rate,
+                            help=self.FRAME_RATE_HELP)
+        parser.add_argument('final',
+                            action='store',
+                            type=parse_rate,
+                            help=self.FRAME_RATE_HELP)
+        parser.set_defaults(action=self.edit, cue_edit=self.rate_cue)
+
+    def add_snap_arguments(self, parser):
+        from pyvtt.frames import parse_rate
+        parser.add_argument('frame_rate',
+                            action='store',
+                            type=parse_rate,
+                            help=self.FRAME_RATE_HELP)
+        parser.set_defaults(action=self.edit, cue_edit=self.snap_cue)
+
+    def add_split_arguments(self, parser):
+        parser.add_argument('limits',
+                            action='store',
+                            nargs='+',
+                            type=self.parse_time,
+                            help=self.LIMITS_HELP)
+        parser.set_defaults(action=self.split)
+
+    def add_break_arguments(self, parser):
+        from pyvtt.linebreak import MODES as BREAK_MODES, GREEDY
+        parser.add_argument('length',
+                            action='store',
+                            type=int,
+                            help=self.LENGTH_HELP)
+        parser.add_argument('-m',
+                            '--mode',
+                            action='store',
+                            choices=BREAK_MODES,
+                            default=GREEDY,
+                            help=self.BREAK_MODE_HELP)
+        parser.set_defaults(action=self.edit, cue_edit=self.break_cue)
+
+    def add_merge_arguments(self, parser):
+        parser.add_argument('tracks',
+                            action='store',
+                            nargs='+',
+                            help=self.TRACKS_HELP)
+        parser.add_argument('-d',
+                            '--delta',
+                            action='store',
+                            default=500,
+                            metavar=underline('delta'),
+                            type=self.parse_time,
+                            help=self.DELTA_HELP)
+        parser.set_defaults(action=self.merge_tracks)
+
+    def add_qc_arguments(self, parser):
+        from pyvtt import qc
+        parser.add_argument('--max-cps',
+                            action='store',
+                            type=float,
+                            default=qc.MAX_CPS,
+                            help='Maximum characters per second '
+                                 '(default: %(default)s)')
+        parser.add_argument('--max-line-length',
+                            action='store',
+                            type=int,
+                            default=qc.MAX_LINE_LENGTH,
+                            help='Maximum characters per line '
+                                 '(default: %(default)s)')
+        parser.add_argument('--max-lines',
+                            action='store',
+                            type=int,
+                            default=qc.MAX_LINES,
+                            help='Maximum lines per subtitle '
+                                 '(default: %(default)s)')
+        parser.add_argument('--min-duration',
+                            action='store',
+                            type=self.parse_time,
+                            default=qc.MIN_DURATION,
+                            help='Minimum duration (default: 833ms)')
+        parser.add_argument('--max-duration',
+                            action='store',
+                            type=self.parse_time,
+                            default=qc.MAX_DURATION,
+                            help='Maximum duration (default: 7s)')
+        parser.set_defaults(action=self.quality_check)
+
+    def add_convert_arguments(self, parser):
+        from pyvtt.formats import FORMATS
+        parser.add_argument('format',
+                            action='store',
+                            choices=sorted(FORMATS),
+                            help=self.FORMAT_HELP)
+        parser.add_argument('-f',
+                            '--from',
+                            action='store',
+                            dest='source_format',
+                            choices=sorted(FORMATS),
+                            help=self.SOURCE_FORMAT_HELP)
+        parser.set_defaults(action=self.convert)
+
+    def add_diff_arguments(self, parser):
+        parser.add_argument('new_version',
+                            action='store',
+                            help=self.NEW_VERSION_HELP)
+        parser.set_defaults(action=self.diff)
+
+    def add_resync_arguments(self, parser):
+        from pyvtt.resync import MAX_OFFSET
+        parser.add_argument('reference',
+                            action='store',
+                            help=self.REFERENCE_HELP)
+        parser.add_argument('--max-offset',
+                            action='store',
+                            default=MAX_OFFSET,
+                            metavar=underline('offset'),
+                            type=self.parse_time,
+                            help=self.MAX_OFFSET_HELP)
+        parser.set_defaults(action=self.edit, file_edit=self.resync_file)
+
+    def add_remap_arguments(self, parser):
+        from pyvtt.frames import parse_rate
+        from pyvtt.remap import EDL_FRAME_RATE
+        parser.add_argument('edl',
+                            action='store',
+                            help=self.EDL_HELP)
+        parser.add_argument('--frame-rate',
+                            action='store',
+                            type=parse_rate,
+                            default=EDL_FRAME_RATE,
+                            help=self.EDL_FRAME_RATE_HELP)
+        parser.add_argument('--start',
+                            action='store',
+                            default=0,
+                            metavar=underline('timecode'),
+                            type=self.parse_time,
+                            help=self.EDL_START_HELP)
+        parser.set_defaults(action=self.edit, file_edit=self.remap_file)
+
+    def add_pipe_arguments(self, parser):
+        parser.add_argument('steps',
+                            action='store',
+                            nargs=REMAINDER,
+                            metavar=underline('command'),
+                            help=self.STEPS_HELP)
+        parser.set_defaults(action=self.pipe)
+
+    def add_serve_arguments(self, parser):
+        parser.add_argument('--socket',
+                            action='store',
+                            metavar=underline('path'),
+                            help=self.SOCKET_HELP)
+        parser.add_argument('--workers',
+                            action='store',
+                            type=int,
+                            help=self.WORKERS_HELP)
+        parser.set_defaults(action=self.serve)
+
     def run(self, args):
-        self.arguments = self.build_parser().parse_args(args)
-        if self.arguments.in_place:
+        names = [name for name, _, _ in self.COMMANDS]
+        command = next((arg for arg in args if arg in names), '')
+        self.parser = self.build_parser(command)
+        self.arguments = self.parser.parse_args(args)
+        if self.arguments.in_place and self.arguments.file is not None:
             self.create_backup()
         self.arguments.action()
 
@@ -200,26 +511,162 @@ class WebVTTShifter(object):
             raise ArgumentTypeError(error.message)
         return encoding_name
 
-    def shift(self):
-        self.input_file.shift(milliseconds=self.arguments.time_offset)
+    def edit(self):
+        self.apply_edits([self.arguments])
         self.input_file.write_into(self.output_file)
 
-    def rate(self):
-        ratio = self.arguments.final / self.arguments.initial
-        self.input_file.shift(ratio=ratio)
+    def apply_edits(self, steps):
+        """
+        apply_edits(steps)
+
+        Apply the edits of a list of parsed commands to the input file. Cue
+        edits of consecutive steps are fused in a single pass over cues.
+        """
+        cue_edits = []
+        for arguments in steps:
+            if getattr(arguments, 'cue_edit', None) is not None:
+                cue_edits.append(arguments.cue_edit(arguments))
+                continue
+            self.edit_cues(cue_edits)
+            cue_edits = []
+            arguments.file_edit(arguments)
+        self.edit_cues(cue_edits)
+
+    def edit_cues(self, cue_edits):
+        if not cue_edits:
+            return
+        for item in self.input_file._owned_items():
+            for cue_edit in cue_edits:
+                cue_edit(item)
+
+    def pipe(self):
+        # Separators and times are left to the parser of each step
+        tokens = [token for token in self.arguments.steps if token != '--']
+        if len(tokens) < 2:
+            self.parser.error('pipe needs at least a command and a file')
+        self.arguments.file = tokens.pop()
+        if self.arguments.in_place:
+            self.create_backup()
+        steps, step = [], []
+        for token in tokens + [self.PIPE_SEPARATOR]:
+            if token != self.PIPE_SEPARATOR:
+                step.append(token)
+                continue
+            if not step or step[0] not in self.EDIT_COMMANDS:
+                self.parser.error('pipe steps must be one of: %s' %
+                                  ', '.join(self.EDIT_COMMANDS))
+            steps.append(self.build_parser(step[0]).parse_args(
+                step + [self.arguments.file]))
+            step = []
+        self.apply_edits(steps)
         self.input_file.write_into(self.output_file)
 
+    def shift_cue(self, arguments):
+        offset = arguments.time_offset
+
+        def shift(item):
+            item.start.ordinal += offset
+            item.end.ordinal += offset
+        return shift
+
+    def rate_cue(self, arguments):
+        from pyvtt.frames import rate_converter
+        return self.retime_cue(rate_converter(arguments.initial,
+                                              arguments.final))
+
+    def snap_cue(self, arguments):
+        from pyvtt.frames import snapper
+        return self.retime_cue(snapper(arguments.frame_rate))
+
+    @staticmethod
+    def retime_cue(retime):
+        def edit(item):
+            item.start.ordinal = retime(item.start.ordinal)
+            item.end.ordinal = retime(item.end.ordinal)
+        return edit
+
+    def break_cue(self, arguments):
+        from pyvtt.linebreak import break_text
+        length, mode = arguments.length, arguments.mode
+
+        def break_lines(item):
+            item.text = break_text(item.text, length, mode)
+        return break_lines
+
+    def resync_file(self, arguments):
+        reference = self.open_file(arguments.reference)
+        alignment = self.input_file.resync(
+            reference, max_offset=arguments.max_offset)
+        self.error_file.write('offset: %sms, ratio: %.6f, %d%% of subtitles '
+                              'matched\n' % (alignment.offset,
+                                             alignment.ratio,
+                                             alignment.score * 100))
+
+    def remap_file(self, arguments):
+        from pyvtt.remap import TimeMap
+        with open(arguments.edl) as edl_file:
+            try:
+                time_map = TimeMap.from_edl(edl_file,
+                                            frame_rate=arguments.frame_rate,
+                                            start=arguments.start)
+            except ValueError as error:
+                self.parser.error('invalid edit decision list: %s' % error)
+        removed = self.input_file.remap(time_map)
+        if removed:
+            self.error_file.write('%d subtitles removed\n' % len(removed))
+
     def split(self):
-        limits = ([0] + self.arguments.limits +
-                  [self.input_file[-1].end.ordinal + 1])
+        # A single sweep over cues sorted by start, each cue being written
+        # to every part it overlaps as it comes. Once cues start after a
+        # part, its file is complete and closed.
+        if any(duration <= 0 for duration in self.arguments.limits):
+            self.parser.error('split durations must be positive')
+        limits = [0]
+        for duration in self.arguments.limits:
+            limits.append(limits[-1] + duration)
+        self.input_file.sort()
+        # Sorted by start, the last cue is not always the one ending last
+        end = max([item.end.ordinal for item in self.input_file] or [0])
+        limits.append(max(end + 1, limits[-1] + 1))
+        parts = {}
+        closed = 0
+        try:
+            for item in self.input_file:
+                start, end = item.start.ordinal, item.end.ordinal
+                first = min(max(bisect_right(limits, start) - 1, 0),
+                            len(limits) - 2)
+                last = min(max(bisect_left(limits, end) - 1, 0),
+                           len(limits) - 2)
+                while closed < min(first, len(limits) - 1):
+                    self.close_part(parts, closed)
+                    closed += 1
+                for index in range(first, last + 1):
+                    if index not in parts:
+                        parts[index] = [self.open_part(index), 0]
+                    part = parts[index]
+                    part[1] += 1
+                    WebVTTFile._write_item(part[0], WebVTTItem(
+                        part[1], start - limits[index], end - limits[index],
+                        item.text, item.position), self.input_file.eol)
+            for index in range(closed, len(limits) - 1):
+                self.close_part(parts, index)
+        finally:
+            for part_file, _ in parts.values():
+                part_file.close()
+
+    def open_part(self, index):
         base_name, extension = splitext(self.arguments.file)
-        for index, (start, end) in enumerate(zip(limits[:-1], limits[1:])):
-            file_name = '%s.%s%s' % (base_name, index + 1, extension)
-            part_file = self.input_file.slice(ends_after=start,
-                                              starts_before=end)
-            part_file.shift(milliseconds=-start)
-            part_file.clean_indexes()
-            part_file.save(path=file_name, encoding=self.output_encoding)
+        file_name = '%s.%s%s' % (base_name, index + 1, extension)
+        part_file = copen(file_name, 'w+', encoding=self.output_encoding)
+        WebVTTFile._write_header(part_file, self.input_file.eol)
+        return part_file
+
+    @staticmethod
+    def close_part(parts, index):
+        if index not in parts:
+            # Like saving an empty WebVTTFile
+            raise InvalidFile()
+        parts.pop(index)[0].close()
 
     def create_backup(self):
         backup_file = self.arguments.file + self.BACKUP_EXTENSION
@@ -228,11 +675,55 @@ class WebVTTShifter(object):
         self.output_file_path = self.arguments.file
         self.arguments.file = backup_file
 
-    def break_lines(self):
-        split_re = compile(r'(.{,%i})(?:\s+|$)' % self.arguments.length)
-        for item in self.input_file:
-            item.text = '\n'.join(split_re.split(item.text)[1::2])
-        self.input_file.write_into(self.output_file)
+    def merge_tracks(self):
+        from pyvtt.merge import merge
+        tracks = [self.input_file]
+        tracks.extend(self.open_file(path) for path in self.arguments.tracks)
+        merged_file = merge(tracks, delta=self.arguments.delta)
+        merged_file.write_into(self.output_file, eol=self.input_file.eol)
+
+    def quality_check(self):
+        report = self.input_file.qc(
+            max_cps=self.arguments.max_cps,
+            max_line_length=self.arguments.max_line_length,
+            max_lines=self.arguments.max_lines,
+            min_duration=self.arguments.min_duration,
+            max_duration=self.arguments.max_duration)
+        self.output_file.write(report.summary() + '\n')
+
+    def convert(self):
+        # Items are streamed from one file to the other, so the input file is
+        # never fully loaded.
+        from pyvtt.formats import get_format, convert_file
+        source_format = get_format(self.arguments.source_format,
+                                   self.arguments.file)
+        source_file, encoding, eol = self.open_stream(self.arguments.file,
+                                                      source_format)
+        self.arguments.output_encoding = (self.arguments.output_encoding or
+                                          encoding)
+        try:
+            convert_file(source_file, self.output_file, source_format,
+                         self.arguments.format, eol=eol,
+                         error_handling=WebVTTFile.ERROR_LOG,
+                         encoding=self.output_encoding)
+        finally:
+            source_file.close()
+
+    def diff(self):
+        from pyvtt.diff import diff
+        new_file = self.open_file(self.arguments.new_version)
+        for change in diff(self.input_file, new_file):
+            self.output_file.write('%s\n' % (change, ))
+
+    def serve(self):
+        from pyvtt.server import serve
+        try:
+            serve(self.arguments.socket, workers=self.arguments.workers)
+        except EnvironmentError as error:
+            if self.arguments.socket is None:
+                raise
+            self.parser.error('cannot listen on %s: %s' % (
+                self.arguments.socket, error))
 
     @property
     def output_encoding(self):
@@ -241,17 +732,33 @@ class WebVTTShifter(object):
     @property
     def input_file(self):
         if not hasattr(self, '_source_file'):
-            with open(self.arguments.file, 'rb') as f:
-                content = f.read()
-                encoding = detect(content).get('encoding')
-                encoding = self.normalize_encoding(encoding)
-
-            self._source_file = WebVTTFile.open(
-                self.arguments.file,
-                encoding=encoding,
-                error_handling=WebVTTFile.ERROR_LOG)
+            self._source_file = self.open_file(self.arguments.file)
         return self._source_file
 
+    def open_file(self, path):
+        return WebVTTFile.open(path, encoding=self.detect_encoding(path),
+                               error_handling=WebVTTFile.ERROR_LOG)
+
+    def open_stream(self, path, source_format):
+        # Binary formats decode files themselves
+        encoding = None if source_format.binary else self.detect_encoding(path)
+        return source_format.open(path, encoding=encoding)
+
+    def detect_encoding(self, path):
+        with open(path, 'rb') as f:
+            content = f.read()
+        for bom, encoding in self.BOM_ENCODINGS:
+            if content.startswith(bom):
+                return encoding
+        try:
+            content.decode('utf-8')
+            return 'utf_8'
+        except UnicodeDecodeError:
+            pass
+        # chardet is slow to import: only load it for the remaining files
+        from chardet import detect
+        return self.normalize_encoding(detect(content).get('encoding'))
+
     @property
     def output_file(self):
         if not hasattr(self, '_output_file'):
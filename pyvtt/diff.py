@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+Cue level comparison of two versions of a caption file
+"""
+from collections import namedtuple
+try:
+    from collections import UserList
+except ImportError:
+    from UserList import UserList
+
+INSERTED = 'inserted'
+REMOVED = 'removed'
+RETIMED = 'retimed'
+RETEXTED = 'retexted'
+MODIFIED = 'modified'
+
+
+class Change(namedtuple('Change', ('kind', 'old', 'new'))):
+    """
+    Change(kind, old, new)
+
+    kind -> one of INSERTED, REMOVED, RETIMED, RETEXTED or MODIFIED (both
+        retimed and retexted).
+    old -> WebVTTItem of the old file, None if INSERTED.
+    new -> WebVTTItem of the new file, None if REMOVED.
+    """
+    __slots__ = ()
+
+    def __str__(self):
+        if self.kind == INSERTED:
+            return '+ %s' % _describe(self.new)
+        if self.kind == REMOVED:
+            return '- %s' % _describe(self.old)
+        return '~ %s\n  %s' % (_describe(self.old), _describe(self.new))
+
+
+def _describe(item):
+    return '%s %s --> %s %r' % (
+        '#%s' % item.index if item.index not in (None, '') else '#?',
+        item.start, item.end, item.text)
+
+
+def _key(item):
+    return item.start.ordinal, item.end.ordinal
+
+
+def _items(cues):
+    # Cues themselves, even those a view shares with another file
+    if isinstance(cues, UserList):
+        return cues.data
+    return list(cues)
+
+
+def _group(values, positions, keys):
+    # value -> position, or list of positions in time order if repeated.
+    # Most values are unique: sparing a list for each of them keeps the
+    # garbage collector quiet on big files.
+    groups = {}
+    for position in sorted(positions, key=keys.__getitem__):
+        value = values[position]
+        group = groups.get(value)
+        if group is None:
+            groups[value] = position
+        elif isinstance(group, list):
+            group.append(position)
+        else:
+            groups[value] = [group, position]
+    return groups
+
+
+def diff(old_file, new_file):
+    """
+    diff(old_file, new_file) -> list of Change
+
+    Align cues of both files and report those inserted, removed, retimed
+    or retexted, sorted by time. Unchanged cues are not reported.
+
+    Cues are paired, in this order:
+      - identical timing and text
+      - identical text, if it appears as many times in both files
+        (RETIMED), in time order
+      - identical timing (RETEXTED)
+      - overlapping timing (MODIFIED, or RETIMED for repeated texts),
+        sweeping both files sorted by start
+    Pairing goes through dicts of times and texts and a single sweep, so it
+    runs in O(n log n).
+
+    Changes hold the cues of both files themselves, not copies.
+    """
+    old_items, new_items = _items(old_file), _items(new_file)
+    old_keys = [_key(item) for item in old_items]
+    new_keys = [_key(item) for item in new_items]
+    old_texts = [item.text for item in old_items]
+    new_texts = [item.text for item in new_items]
+    old_left = set(range(len(old_items)))
+    new_left = set(range(len(new_items)))
+    changes = []
+
+    def pair(old_values, new_values, kind):
+        old_groups = _group(old_values, old_left, old_keys)
+        new_groups = _group(new_values, new_left, new_keys)
+        for value, old_positions in old_groups.items():
+            new_positions = new_groups.get(value)
+            if new_positions is None:
+                continue
+            if not isinstance(old_positions, list):
+                old_positions = [old_positions]
+            if not isinstance(new_positions, list):
+                new_positions = [new_positions]
+            if kind == RETIMED and len(old_positions) != len(new_positions):
+                # Repeated texts ("Yes.") are left to the time sweep
+                continue
+            for old_position, new_position in zip(old_positions,
+                                                  new_positions):
+                old_left.discard(old_position)
+                new_left.discard(new_position)
+                if kind is not None:
+                    changes.append(Change(kind, old_items[old_position],
+                                          new_items[new_position]))
+
+    pair(list(zip(old_keys, old_texts)), list(zip(new_keys, new_texts)),
+         None)
+    pair(old_texts, new_texts, RETIMED)
+    pair(old_keys, new_keys, RETEXTED)
+
+    old_sorted = sorted(old_left, key=old_keys.__getitem__)
+    new_sorted = sorted(new_left, key=new_keys.__getitem__)
+    old_index = new_index = 0
+    while old_index < len(old_sorted) and new_index < len(new_sorted):
+        old, new = old_sorted[old_index], new_sorted[new_index]
+        (old_start, old_end), (new_start, new_end) = old_keys[old], \
+            new_keys[new]
+        if old_start < new_end and new_start < old_end:
+            changes.append(Change(
+                RETIMED if old_texts[old] == new_texts[new] else MODIFIED,
+                old_items[old], new_items[new]))
+            old_index += 1
+            new_index += 1
+        elif old_keys[old] < new_keys[new]:
+            changes.append(Change(REMOVED, old_items[old], None))
+            old_index += 1
+        else:
+            changes.append(Change(INSERTED, None, new_items[new]))
+            new_index += 1
+    changes.extend(Change(REMOVED, old_items[p], None)
+                   for p in old_sorted[old_index:])
+    changes.extend(Change(INSERTED, None, new_items[p])
+                   for p in new_sorted[new_index:])
+
+    changes.sort(key=lambda c: _key(c.new if c.new is not None else c.old))
+    return changes
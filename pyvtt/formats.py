@@ -0,0 +1,450 @@
+# -*- coding: utf-8 -*-
+"""
+Streaming readers and writers for other caption formats: SubRip (.srt),
+YouTube SubViewer (.sbv) and TTML (.ttml, .dfxp, .xml)
+"""
+from codecs import getincrementaldecoder, lookup, open as copen
+from io import StringIO
+from os.path import splitext
+from re import compile
+from xml.parsers.expat import ExpatError, ParserCreate
+from xml.sax.saxutils import escape
+
+from pyvtt.compat import str
+from pyvtt.vttexc import InvalidFile, InvalidItem, InvalidTimeString
+from pyvtt.vttfile import BOMS, CHUNK_SIZE, WebVTTFile
+from pyvtt.vttitem import WebVTTItem
+from pyvtt.vtttime import WebVTTTime
+
+
+def format_timestamp(ordinal, pattern=WebVTTTime.TIME_PATTERN):
+    """
+    format_timestamp(ordinal[, pattern]) -> str
+
+    Render a count of milliseconds with `pattern`, a format string taking
+    hours, minutes, seconds and milliseconds, without building any
+    WebVTTTime. Negative times are rendered as zero.
+    """
+    if ordinal < 0:
+        ordinal = 0
+    seconds, milliseconds = divmod(int(ordinal), WebVTTTime.SECONDS_RATIO)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return pattern % (hours, minutes, seconds, milliseconds)
+
+
+def xml_encoding(encoding):
+    """
+    xml_encoding(encoding) -> str
+
+    IANA name of a Python codec, as declared in XML documents.
+    raise ValueError for codecs without one.
+    """
+    name = lookup(encoding).name
+    if name in XML_ENCODINGS:
+        return XML_ENCODINGS[name]
+    if name.startswith('iso8859-'):
+        return 'ISO-8859-' + name[len('iso8859-'):]
+    if name.startswith('cp125') and len(name) == 6:
+        return 'windows-' + name[2:]
+    raise ValueError('No XML name for encoding: %r' % (encoding, ))
+
+
+# IANA names of Python codecs other than iso8859-* and cp125*, see
+# xml_encoding
+XML_ENCODINGS = {
+    'ascii': 'US-ASCII',
+    'utf-8': 'UTF-8',
+    'utf-8-sig': 'UTF-8',
+    'utf-16': 'UTF-16',
+    'utf-16-le': 'UTF-16LE',
+    'utf-16-be': 'UTF-16BE',
+    'utf-32': 'UTF-32',
+    'utf-32-le': 'UTF-32LE',
+    'utf-32-be': 'UTF-32BE',
+    'koi8-r': 'KOI8-R',
+    'koi8-u': 'KOI8-U',
+    'mac-roman': 'macintosh',
+    'shift_jis': 'Shift_JIS',
+    'euc_jp': 'EUC-JP',
+    'euc_kr': 'EUC-KR',
+    'big5': 'Big5',
+    'gb2312': 'GB2312',
+    'gbk': 'GBK',
+    'gb18030': 'GB18030',
+}
+
+
+class CaptionFormat(object):
+    """
+    Base class of caption formats.
+
+    read(source_file[, error_handling]) yields WebVTTItem instances parsed
+    from an iterable of unicode lines, write(items, output_file[, eol]
+    [, encoding]) serializes any iterable of WebVTTItem, `encoding` being
+    the one `output_file` writes in. Both are streaming: no more than
+    one item is held at once.
+
+    Formats with `binary` set read binary files instead, and decode them
+    themselves.
+    """
+    name = None
+    extensions = ()
+    binary = False
+
+    @classmethod
+    def open(cls, path, encoding=None):
+        """
+        open(path[, encoding]) -> (source_file, encoding, eol)
+
+        Open `path` to be read by read(), detecting its encoding like
+        WebVTTFile.open unless given, and its end of line.
+        """
+        source_file, encoding = WebVTTFile._open_unicode_file(
+            path, claimed_encoding=encoding)
+        return source_file, encoding, WebVTTFile._guess_eol(source_file)
+
+    @classmethod
+    def read(cls, source_file, error_handling=WebVTTFile.ERROR_PASS):
+        return WebVTTFile.stream(source_file, error_handling=error_handling,
+                                 parse_item=cls.parse_item)
+
+    @classmethod
+    def parse_item(cls, lines):
+        return WebVTTItem.from_lines(lines)
+
+    @classmethod
+    def write(cls, items, output_file, eol='\n', encoding=None):
+        header = cls.header(encoding)
+        if header:
+            output_file.write(header.replace('\n', eol))
+        for position, item in enumerate(items):
+            output_file.write(cls.serialize_item(item, position)
+                              .replace('\n', eol))
+        footer = cls.footer()
+        if footer:
+            output_file.write(footer.replace('\n', eol))
+
+    @classmethod
+    def header(cls, encoding=None):
+        return ''
+
+    @classmethod
+    def footer(cls):
+        return ''
+
+    @classmethod
+    def serialize_item(cls, item, position):
+        raise NotImplementedError
+
+
+class WebVTTFormat(CaptionFormat):
+    name = 'vtt'
+    extensions = ('.vtt', )
+
+    @classmethod
+    def header(cls, encoding=None):
+        return 'WEBVTT\n\n'
+
+    @classmethod
+    def serialize_item(cls, item, position):
+        string_repr = str(item)
+        if not string_repr.endswith('\n\n'):
+            string_repr += '\n'
+        return string_repr
+
+
+class SubRipFormat(CaptionFormat):
+    name = 'srt'
+    extensions = ('.srt', )
+    TIME_PATTERN = '%02d:%02d:%02d,%03d'
+    ITEM_PATTERN = '%d\n%s --> %s\n%s\n\n'
+
+    @classmethod
+    def serialize_item(cls, item, position):
+        # SubRip indexes are mandatory and sequential
+        return cls.ITEM_PATTERN % (
+            position + 1,
+            format_timestamp(item.start.ordinal, cls.TIME_PATTERN),
+            format_timestamp(item.end.ordinal, cls.TIME_PATTERN),
+            item.text)
+
+
+class SBVFormat(CaptionFormat):
+    name = 'sbv'
+    extensions = ('.sbv', )
+    TIME_PATTERN = '%d:%02d:%02d.%03d'
+    ITEM_PATTERN = '%s,%s\n%s\n\n'
+    TIMESTAMP_SEPARATOR = ','
+
+    @classmethod
+    def parse_item(cls, lines):
+        if len(lines) < 2:
+            raise InvalidItem()
+        lines = [l.rstrip('\n\r') for l in lines]
+        timestamps = lines[0].strip().split(cls.TIMESTAMP_SEPARATOR)
+        if len(timestamps) != 2:
+            raise InvalidItem()
+        return WebVTTItem(None, timestamps[0], timestamps[1],
+                          '\n'.join(lines[1:]))
+
+    @classmethod
+    def serialize_item(cls, item, position):
+        return cls.ITEM_PATTERN % (
+            format_timestamp(item.start.ordinal, cls.TIME_PATTERN),
+            format_timestamp(item.end.ordinal, cls.TIME_PATTERN),
+            item.text)
+
+
+class TTMLFormat(CaptionFormat):
+    """
+    TTML documents are read from binary files, decoded by the XML parser
+    according to their declaration, or from unicode ones. Text is read as
+    TTML renders it: whitespace is collapsed unless xml:space="preserve",
+    and <br/> breaks lines. Errors are reported with the line of their <p>.
+    """
+    name = 'ttml'
+    extensions = ('.ttml', '.dfxp', '.xml')
+    binary = True
+    NAMESPACE = 'http://www.w3.org/ns/ttml'
+    SPACE_ATTRIBUTE = 'http://www.w3.org/XML/1998/namespace}space'
+    TIME_PATTERN = '%02d:%02d:%02d.%03d'
+    ITEM_PATTERN = '      <p begin="%s" end="%s">%s</p>\n'
+    RE_OFFSET_TIME = compile(r'^(\d+(?:\.\d+)?)(h|m|s|ms)$')
+    RE_SPACES = compile(r'[ \t\r\n]+')
+    RE_DECLARED_ENCODING = compile(
+        br'^<\?xml[^>]*?\sencoding\s*=\s*["\']([A-Za-z][\w.-]*)["\']')
+    OFFSET_RATIOS = {
+        'h': WebVTTTime.HOURS_RATIO,
+        'm': WebVTTTime.MINUTES_RATIO,
+        's': WebVTTTime.SECONDS_RATIO,
+        'ms': 1,
+    }
+    # Bytes looked at for the encoding and end of line, see open
+    HEAD_SIZE = 1024
+
+    @classmethod
+    def open(cls, path, encoding=None):
+        """
+        open(path[, encoding]) -> (source_file, encoding, eol)
+
+        Open `path` as a binary file. XML documents declare their own
+        encoding, which is returned: `encoding` is ignored.
+        """
+        source_file = open(path, 'rb')
+        head = source_file.read(cls.HEAD_SIZE)
+        source_file.seek(0)
+        encoding = cls.declared_encoding(head)
+        text = getincrementaldecoder(encoding)('replace').decode(head)
+        return (source_file, encoding,
+                WebVTTFile._guess_eol(StringIO(text, newline='')))
+
+    @classmethod
+    def declared_encoding(cls, head):
+        """
+        declared_encoding(head) -> str
+
+        Encoding of an XML document starting with bytes `head`, from its
+        byte order mark or its declaration. Default to utf-8.
+        """
+        for bom, encoding in BOMS:
+            if head.startswith(bom):
+                # Codecs which read and write the BOM
+                if encoding.endswith(('_le', '_be')):
+                    return lookup(encoding[:-len('_le')]).name
+                return lookup('utf_8_sig').name
+        match = cls.RE_DECLARED_ENCODING.match(head)
+        if match:
+            return lookup(match.group(1).decode('ascii')).name
+        return 'utf-8'
+
+    @classmethod
+    def read(cls, source_file, error_handling=WebVTTFile.ERROR_PASS):
+        parser = ParserCreate(namespace_separator='}')
+        items = []
+        # xml:space="preserve" of each open element, and the <p> being read
+        # if any: [line, attributes, text parts]
+        preserve = [False]
+        cue = []
+
+        def start_element(name, attributes):
+            space = attributes.get(cls.SPACE_ATTRIBUTE)
+            preserve.append(preserve[-1] if space is None
+                            else space == 'preserve')
+            local_name = cls._local_name(name)
+            if local_name == 'p':
+                cue[:] = [parser.CurrentLineNumber, attributes, []]
+            elif local_name == 'br' and cue:
+                parts = cue[2]
+                if parts and not preserve[-1]:
+                    parts[-1] = parts[-1].rstrip(' ')
+                parts.append('\n')
+
+        def end_element(name):
+            preserve.pop()
+            if cue and cls._local_name(name) == 'p':
+                line, attributes, parts = cue
+                del cue[:]
+                try:
+                    items.append(cls.parse_cue(attributes, ''.join(parts)))
+                except (InvalidTimeString, InvalidItem) as error:
+                    error.args += ('<p %s>' % ' '.join(
+                        '%s="%s"' % attribute
+                        for attribute in sorted(attributes.items())), )
+                    WebVTTFile._handle_error(error, error_handling, line)
+
+        def character_data(data):
+            if not cue:
+                return
+            parts = cue[2]
+            if not preserve[-1]:
+                data = cls.RE_SPACES.sub(' ', data)
+                if data.startswith(' ') and (
+                        not parts or parts[-1].endswith((' ', '\n'))):
+                    data = data[1:]
+            if data:
+                parts.append(data)
+
+        parser.StartElementHandler = start_element
+        parser.EndElementHandler = end_element
+        parser.CharacterDataHandler = character_data
+        chunk = True
+        while chunk:
+            chunk = source_file.read(CHUNK_SIZE)
+            try:
+                parser.Parse(chunk, not chunk)
+            except ExpatError as error:
+                raise InvalidFile(str(error))
+            for item in items:
+                yield item
+            del items[:]
+
+    @classmethod
+    def parse_cue(cls, attributes, text):
+        """
+        parse_cue(attributes, text) -> WebVTTItem
+
+        Build an item from the attributes and the text of a <p> element.
+        raise InvalidTimeString
+        """
+        start = cls.parse_time(attributes.get('begin'))
+        if attributes.get('end') is not None:
+            end = cls.parse_time(attributes.get('end'))
+        else:
+            end = start + cls.parse_time(attributes.get('dur'))
+        return WebVTTItem(attributes.get('id'), start, end, text.strip())
+
+    @classmethod
+    def parse_time(cls, source):
+        """
+        Parse TTML clock times (HH:MM:SS.mmm) and offset times (1.5s, 10ms)
+        into a count of milliseconds.
+        """
+        if source is None:
+            raise InvalidTimeString()
+        match = cls.RE_OFFSET_TIME.match(source.strip())
+        if match:
+            value, unit = match.groups()
+            return int(round(float(value) * cls.OFFSET_RATIOS[unit]))
+        return WebVTTTime.from_string(source.strip()).ordinal
+
+    @classmethod
+    def _local_name(cls, tag):
+        return tag.rsplit('}', 1)[-1]
+
+    @classmethod
+    def header(cls, encoding=None):
+        encoding = xml_encoding(encoding) if encoding else 'UTF-8'
+        return ('<?xml version="1.0" encoding="%s"?>\n'
+                '<tt xmlns="%s">\n  <body>\n    <div>\n' % (
+                    encoding, cls.NAMESPACE))
+
+    @classmethod
+    def footer(cls):
+        return '    </div>\n  </body>\n</tt>\n'
+
+    @classmethod
+    def serialize_item(cls, item, position):
+        text = '<br/>'.join(escape(line) for line in
+                            item.text_without_tags.split('\n'))
+        return cls.ITEM_PATTERN % (
+            format_timestamp(item.start.ordinal, cls.TIME_PATTERN),
+            format_timestamp(item.end.ordinal, cls.TIME_PATTERN),
+            text)
+
+
+FORMATS = dict((f.name, f) for f in (WebVTTFormat, SubRipFormat, SBVFormat,
+                                     TTMLFormat))
+
+
+def get_format(name=None, path=None):
+    """
+    get_format([name][, path]) -> CaptionFormat
+
+    Look a format up by name or else by the extension of `path`.
+    """
+    if name:
+        try:
+            return FORMATS[name.lower()]
+        except KeyError:
+            raise ValueError('Unknown caption format: %r' % (name, ))
+    extension = splitext(path or '')[1].lower()
+    for caption_format in FORMATS.values():
+        if extension in caption_format.extensions:
+            return caption_format
+    raise ValueError('Unknown caption format for: %r' % (path, ))
+
+
+def convert_file(source_file, output_file, source_format, output_format,
+                 eol='\n', error_handling=WebVTTFile.ERROR_PASS,
+                 encoding=None):
+    """
+    convert_file(source_file, output_file, source_format, output_format
+                 [, eol][, error_handling][, encoding])
+
+    Stream items read from `source_file` in `source_format` into
+    `output_file` in `output_format`. Formats are either CaptionFormat
+    classes or their names. `encoding` is the one `output_file` writes in,
+    declared by formats which need it (TTML).
+    """
+    if not isinstance(source_format, type):
+        source_format = get_format(source_format)
+    if not isinstance(output_format, type):
+        output_format = get_format(output_format)
+    items = source_format.read(source_file, error_handling=error_handling)
+    output_format.write(items, output_file, eol=eol, encoding=encoding)
+
+
+def convert(source_path, output_path, source_format=None, output_format=None,
+            encoding=None, output_encoding=None, eol=None,
+            error_handling=WebVTTFile.ERROR_PASS):
+    """
+    convert(source_path, output_path[, source_format][, output_format]
+            [, encoding][, output_encoding][, eol][, error_handling])
+
+    Convert a caption file without building any intermediate WebVTTFile.
+    Formats are guessed from file extensions if not given. Encoding is
+    detected like in WebVTTFile.open, or read from the XML declaration of
+    TTML files. Output encoding default to the input one and eol to the one
+    of the input file.
+
+    Example:
+        >>> convert('movie.srt', 'movie.vtt')
+    """
+    source_format = get_format(source_format, source_path)
+    output_format = get_format(output_format, output_path)
+    source_file, encoding, source_eol = source_format.open(
+        source_path, encoding=encoding)
+    try:
+        eol = eol or source_eol
+        output_encoding = output_encoding or encoding
+        output_file = copen(output_path, 'w+', encoding=output_encoding)
+        try:
+            convert_file(source_file, output_file, source_format,
+                         output_format, eol=eol,
+                         error_handling=error_handling,
+                         encoding=output_encoding)
+        finally:
+            output_file.close()
+    finally:
+        source_file.close()
@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+"""
+Frame accurate times: exact frame rates, snapping and SMPTE timecodes
+
+Frame rates are Fractions so NTSC rates (24000/1001, 30000/1001...) are
+exact, and all conversions use integer arithmetic: each time is rounded
+once from its exact value, whatever its magnitude, instead of accumulating
+float errors.
+"""
+from fractions import Fraction
+from re import compile
+
+# Rates commonly written as decimals, and their exact value
+NTSC_RATES = dict((round(float(rate), 2), rate) for rate in (
+    Fraction(24000, 1001), Fraction(30000, 1001), Fraction(48000, 1001),
+    Fraction(60000, 1001)))
+
+RE_TIMECODE = compile(r'^(\d+):(\d\d):(\d\d)([:;.,])(\d+)$')
+
+
+def parse_rate(rate):
+    """
+    parse_rate(rate) -> Fraction
+
+    `rate` -> frames per second as a number or a string, either decimal
+        ('25', '23.976', '29.97') or a ratio ('30000/1001'). Decimal
+        approximations of NTSC rates are read as their exact value.
+
+    Raise ValueError for invalid or non positive rates.
+    """
+    try:
+        fraction = Fraction(rate)
+    except TypeError:
+        fraction = Fraction(str(rate))
+    if fraction <= 0:
+        raise ValueError('Invalid frame rate: %r' % (rate, ))
+    if fraction.denominator == 1:
+        return fraction
+    return NTSC_RATES.get(round(float(fraction), 2),
+                          fraction.limit_denominator(1001))
+
+
+def _round(fraction):
+    # Half up, unlike round() on Python 3. All roundings of this module are.
+    return (2 * fraction.numerator + fraction.denominator) // \
+        (2 * fraction.denominator)
+
+
+def _to_frames(ordinal, rate):
+    return (2 * ordinal * rate.numerator + 1000 * rate.denominator) // \
+        (2000 * rate.denominator)
+
+
+def _from_frames(frames, rate):
+    return (2000 * frames * rate.denominator + rate.numerator) // \
+        (2 * rate.numerator)
+
+
+def to_frames(ordinal, rate):
+    """
+    to_frames(ordinal, rate) -> int
+
+    Index of the frame displayed at `ordinal` milliseconds, the nearest
+    frame start.
+    """
+    return _to_frames(int(ordinal), parse_rate(rate))
+
+
+def from_frames(frames, rate):
+    """
+    from_frames(frames, rate) -> int
+
+    Start of frame `frames`, in milliseconds rounded to the nearest one.
+    """
+    return _from_frames(int(frames), parse_rate(rate))
+
+
+def snap_ordinal(ordinal, rate):
+    """
+    snap_ordinal(ordinal, rate) -> int
+
+    Move `ordinal` to the nearest frame start.
+    """
+    rate = parse_rate(rate)
+    return _from_frames(_to_frames(int(ordinal), rate), rate)
+
+
+def _drop_frames(rate):
+    # 29.97 drops 2 frame numbers each minute but every tenth, 59.94 drops 4
+    if rate.denominator == 1001 and rate.numerator % 30000 == 0:
+        return 2 * rate.numerator // 30000
+    return 0
+
+
+def to_timecode(ordinal, rate, drop_frame=None):
+    """
+    to_timecode(ordinal, rate[, drop_frame]) -> str
+
+    SMPTE timecode (HH:MM:SS:FF) of the frame displayed at `ordinal`
+    milliseconds. Drop frame timecodes (HH:MM:SS;FF) are used by default for
+    29.97 and 59.94 fps, frame numbers then stay close to wall clock time.
+    """
+    rate = parse_rate(rate)
+    frames = max(_to_frames(int(ordinal), rate), 0)
+    nominal = _round(rate)
+    drop = _drop_frames(rate) if drop_frame is not False else 0
+    if drop_frame and not drop:
+        raise ValueError('No drop frame timecode at %s fps' % (rate, ))
+    if drop:
+        frames_per_minute = nominal * 60 - drop
+        frames_per_ten_minutes = frames_per_minute * 10 + drop
+        tens, remainder = divmod(frames, frames_per_ten_minutes)
+        frames += drop * 9 * tens
+        if remainder > drop:
+            frames += drop * ((remainder - drop) // frames_per_minute)
+    seconds, frame = divmod(frames, nominal)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return '%02d:%02d:%02d%s%02d' % (hours, minutes, seconds,
+                                     ';' if drop else ':', frame)
+
+
+def from_timecode(timecode, rate):
+    """
+    from_timecode(timecode, rate) -> int
+
+    Milliseconds of a SMPTE timecode, HH:MM:SS:FF or, for drop frame ones,
+    HH:MM:SS;FF (or HH:MM:SS.FF, HH:MM:SS,FF).
+
+    Raise ValueError for malformed timecodes.
+    """
+    match = RE_TIMECODE.match(timecode.strip())
+    if not match:
+        raise ValueError('Invalid timecode: %r' % (timecode, ))
+    hours, minutes, seconds, separator, frame = match.groups()
+    hours, minutes, seconds, frame = (int(hours), int(minutes),
+                                      int(seconds), int(frame))
+    rate = parse_rate(rate)
+    nominal = _round(rate)
+    frames = ((hours * 60 + minutes) * 60 + seconds) * nominal + frame
+    drop = _drop_frames(rate)
+    if drop and separator != ':':
+        total_minutes = hours * 60 + minutes
+        frames -= drop * (total_minutes - total_minutes // 10)
+    return _from_frames(frames, rate)
+
+
+def snapper(rate):
+    """
+    snapper(rate) -> function(ordinal) -> int
+
+    Same as snap_ordinal, with `rate` parsed once for all calls.
+    """
+    rate = parse_rate(rate)
+    return lambda ordinal: _from_frames(_to_frames(ordinal, rate), rate)
+
+
+def rate_converter(initial, final):
+    """
+    rate_converter(initial, final) -> function(ordinal) -> int
+
+    Function multiplying a time by final / initial, see convert_rate.
+    """
+    ratio = parse_rate(final) / parse_rate(initial)
+    numerator, denominator = ratio.numerator, ratio.denominator
+    return lambda ordinal: (2 * ordinal * numerator + denominator) // \
+        (2 * denominator)
+
+
+def snap(vtt_file, rate):
+    """
+    snap(vtt_file, rate) -> vtt_file
+
+    Move every start and end time of `vtt_file` in place to the nearest
+    frame start at `rate` frames per second.
+    """
+    rate = parse_rate(rate)
+    for item in vtt_file._owned_items():
+        for time in (item.start, item.end):
+            time.ordinal = _from_frames(_to_frames(time.ordinal, rate),
+                                        rate)
+    return vtt_file
+
+
+def convert_rate(vtt_file, initial, final):
+    """
+    convert_rate(vtt_file, initial, final) -> vtt_file
+
+    Multiply every time of `vtt_file` in place by final / initial, like
+    shift(ratio=final / initial) but with exact rates and integer
+    arithmetic, rounding each time to the nearest millisecond.
+
+    Example:
+        >>> convert_rate(subs, '23.976', 25)
+    """
+    ratio = parse_rate(final) / parse_rate(initial)
+    numerator, denominator = ratio.numerator, ratio.denominator
+    for item in vtt_file._owned_items():
+        for time in (item.start, item.end):
+            time.ordinal = (2 * time.ordinal * numerator + denominator) // \
+                (2 * denominator)
+    return vtt_file
@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+"""
+Incremental save of files read from disk
+
+Cues read by WebVTTFile.read(track_source=True), as done by WebVTTFile.open,
+remember the lines they come from. When saving back to the same path, the
+bytes of those lines are copied for untouched cues (see WebVTTItem.dirty),
+only changed ones are serialized and encoded, and the file is rewritten
+from its first changed byte only.
+
+Lines are mapped back to bytes, so this needs an encoding where a line feed
+is a single 0x0A byte (UTF-8, Latin-1, cp1252...), and a file left unchanged
+since it was read. Otherwise, save() returns None and the file has to be
+saved in full.
+"""
+from copy import copy
+from io import StringIO
+from itertools import chain
+from os import stat
+from os.path import abspath
+
+try:
+    from itertools import accumulate
+except ImportError:  # Python 2
+    def accumulate(iterable):
+        total = 0
+        for value in iterable:
+            total += value
+            yield total
+
+from pyvtt.vttfile import BOMS, _splittable
+
+# Bytes compared at once when looking for the first changed byte
+BLOCK_SIZE = 64 * 1024
+
+
+class Source(object):
+    """
+    Source(path, encoding)
+
+    A file cues were read from: its state when read, and the lines of the
+    first and after the last cue read.
+    """
+
+    def __init__(self, path, encoding):
+        self.path = abspath(path)
+        self.encoding = encoding
+        self.state = _state(path)
+        self.header_end = self.last_end = None
+
+
+def _state(path):
+    state = stat(path)
+    return state.st_size, getattr(state, 'st_mtime_ns', state.st_mtime)
+
+
+def common_prefix(old, new):
+    """
+    common_prefix(old, new) -> int
+
+    Length of the common prefix of bytes `old` and `new`.
+    """
+    length, size = 0, min(len(old), len(new))
+    while (length < size and
+           old[length:length + BLOCK_SIZE] == new[length:length + BLOCK_SIZE]):
+        length += BLOCK_SIZE
+    length = min(length, size)
+    size = min(length + BLOCK_SIZE, size)
+    while length < size and old[length] == new[length]:
+        length += 1
+    return length
+
+
+def _read_lines(source):
+    # (data, line offsets) of the source file, None if it cannot be reused
+    try:
+        if _state(source.path) != source.state:
+            return None
+    except OSError:
+        return None
+    with open(source.path, 'rb') as source_file:
+        data = source_file.read()
+    bom = b''
+    for file_bom, codec in BOMS:
+        if codec == source.encoding and data.startswith(file_bom):
+            bom = file_bom
+    lines = data[len(bom):].splitlines(True)
+    # Lines were read as text: check they still end on the last cue
+    last_end = source.last_end
+    if (last_end > len(lines) or not lines[last_end - 1].strip() or
+            b''.join(lines[last_end:]).strip()):
+        return None
+    return data, list(accumulate(chain([len(bom)], map(len, lines))))
+
+
+def save(vtt_file, path, encoding, eol=None, include_indexes=False):
+    """
+    save(vtt_file, path, encoding[, eol][, include_indexes]) -> int or None
+
+    Save `vtt_file` to `path`, where it was read from, and return the
+    number of bytes written. Return None without writing anything if it
+    cannot be saved incrementally.
+    """
+    source = vtt_file._source
+    if (source is None or abspath(path) != source.path or
+            encoding != source.encoding or not _splittable(encoding) or
+            eol not in (None, vtt_file.eol)):
+        return None
+    vtt_file._check_valid_len()
+    read = _read_lines(source)
+    if read is None:
+        return None
+    data, offsets = read
+
+    eol = vtt_file.eol
+    encoded_eol = eol.encode(encoding)
+    lines_count = len(offsets) - 1
+    new_source = copy(source)
+    # Bytes of untouched cues are copied by runs, with the blank line after
+    # each of them, starting with the header
+    chunks, run_start, run_end = [], 0, offsets[source.header_end]
+    line = source.header_end
+    for item in vtt_file:
+        item_source = item._source
+        if (item_source is not None and item_source[0] is source and
+                item_source[3:] == (item.index, item.start.ordinal,
+                                    item.end.ordinal)):
+            first, end = item_source[1], item_source[2]
+            if offsets[first] != run_end:
+                chunks.append(data[run_start:run_end])
+                run_start = offsets[first]
+            if end < lines_count:
+                run_end = offsets[end + 1]
+            else:
+                chunks.append(data[run_start:])
+                if not data.endswith((b'\n', b'\r')):
+                    chunks.append(encoded_eol)
+                chunks.append(encoded_eol)
+                run_start = run_end = 0
+            count = end - first
+            item._source = (new_source, line, line + count) + item_source[3:]
+        else:
+            chunks.append(data[run_start:run_end])
+            run_start = run_end = 0
+            buffer = StringIO()
+            vtt_file._write_item(buffer, item, eol, include_indexes)
+            chunk = buffer.getvalue().encode(encoding)
+            chunks.append(chunk)
+            block = chunk.splitlines()
+            count = len(block) - 1
+            if block[-1].strip() or not all(l.strip() for l in block[:-1]):
+                # Blank lines in text: not read back as a single cue
+                item._source = None
+                line += len(block)
+                continue
+            item._source = (new_source, line, line + count, item.index,
+                            item.start.ordinal, item.end.ordinal)
+        line += count + 1
+    chunks.append(data[run_start:run_end])
+
+    # Items now refer to new_source: until it is set, they are all dirty
+    vtt_file._source = None
+    new_data = b''.join(chunks)
+    start = common_prefix(data, new_data)
+    if start < len(data) or start < len(new_data):
+        with open(source.path, 'r+b') as output_file:
+            output_file.seek(start)
+            output_file.write(new_data[start:])
+            output_file.truncate()
+    new_source.state = _state(source.path)
+    new_source.last_end = line - 1
+    vtt_file._source = new_source
+    return len(new_data) - start
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+Line breaking of subtitle texts
+"""
+from re import compile
+
+GREEDY = 'greedy'
+BALANCED = 'balanced'
+MODES = (GREEDY, BALANCED)
+
+# A word is anything between whitespaces, but tags like <v Roger> are kept
+# whole even if they contain some.
+RE_WORD = compile(r'(?:<[^<>\n]*>|\S)+')
+RE_TAG = compile(r'<[^<>\n]*>')
+
+
+def break_text(text, length, mode=GREEDY):
+    """
+    break_text(text, length[, mode]) -> unicode
+
+    Reflow `text` in lines of at most `length` visible characters, tags
+    not being counted nor split. Words longer than `length` are kept whole
+    on their own line.
+
+    mode -> GREEDY fills each line as much as possible in linear time.
+            BALANCED uses as few lines as GREEDY but minimizes the sum of
+            the squares of their free space so lines are of similar length.
+    """
+    if '<' in text:
+        words = RE_WORD.findall(text)
+        widths = [len(RE_TAG.sub('', word)) if '<' in word else len(word)
+                  for word in words]
+    else:
+        words = text.split()
+        widths = [len(word) for word in words]
+
+    if mode not in MODES:
+        raise ValueError('Unknown line breaking mode: %r' % (mode, ))
+    if sum(widths) + len(widths) - 1 <= length:
+        return ' '.join(words)
+    if mode == GREEDY:
+        breaks = _greedy_breaks(widths, length)
+    else:
+        breaks = _balanced_breaks(widths, length)
+    return '\n'.join(' '.join(words[start:end])
+                     for start, end in zip(breaks[:-1], breaks[1:]))
+
+
+def _greedy_breaks(widths, length):
+    breaks = [0]
+    line_width = None
+    for index, width in enumerate(widths):
+        if line_width is not None and line_width + 1 + width <= length:
+            line_width += 1 + width
+        else:
+            if line_width is not None:
+                breaks.append(index)
+            line_width = width
+    if widths:
+        breaks.append(len(widths))
+    return breaks
+
+
+def _balanced_breaks(widths, length):
+    # best[i]: (lines, raggedness, start of last line) to lay out i words.
+    # A line never holds more than `length` characters, so the inner loop
+    # is bounded by the line length and the whole is linear in words.
+    best = [(0, 0, 0)]
+    for end in range(1, len(widths) + 1):
+        candidate = None
+        line_width = -1
+        for start in range(end - 1, -1, -1):
+            line_width += widths[start] + 1
+            if line_width > length and start < end - 1:
+                break
+            lines, raggedness, _ = best[start]
+            cost = (lines + 1, raggedness + max(length - line_width, 0) ** 2,
+                    start)
+            if candidate is None or cost < candidate:
+                candidate = cost
+        best.append(candidate)
+
+    breaks = [len(widths)]
+    while breaks[-1]:
+        breaks.append(best[breaks[-1]][2])
+    breaks.reverse()
+    return breaks
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""
+Mix several subtitle tracks into a single one
+"""
+from heapq import heappop, heappush
+
+from pyvtt.vttfile import WebVTTFile
+from pyvtt.vttitem import WebVTTItem
+from pyvtt.vtttime import WebVTTTime
+
+
+def merge(tracks, delta=500, separator='\n'):
+    """
+    merge(tracks[, delta][, separator]) -> WebVTTFile
+
+    Mix several subtitle tracks (e.g. the same movie in two languages) in a
+    single one. The timeline is cut at every start and end of every cue and
+    each interval longer than `delta` gets the text of the first cue of each
+    track covering it, joined with `separator` in tracks order.
+
+    `tracks` -> iterable of WebVTTFile or of any list of WebVTTItem.
+    `delta` -> anything coercible to WebVTTTime: shortest interval kept.
+        Default to 500 milliseconds.
+
+    Boundaries are sorted once and swept in a single pass, keeping a heap of
+    the active cues of each track, so merging is O(n log n).
+
+    Example:
+        >>> merge([pyvtt.open('movie.en.vtt'), pyvtt.open('movie.es.vtt')],
+        ...       delta={'milliseconds': 200})
+    """
+    delta = WebVTTTime.coerce(delta).ordinal
+    tracks = [list(track) for track in tracks]
+
+    starts = sorted((item.start.ordinal, track_index, item_index)
+                    for track_index, track in enumerate(tracks)
+                    for item_index, item in enumerate(track))
+    boundaries = set(start for start, _, _ in starts)
+    boundaries.update(item.end.ordinal for track in tracks for item in track)
+    boundaries = sorted(boundaries)
+
+    # One heap of item indexes per track, sorted in file order
+    active = [[] for _ in tracks]
+    output = WebVTTFile()
+    cursor = 0
+    for start, end in zip(boundaries[:-1], boundaries[1:]):
+        while cursor < len(starts) and starts[cursor][0] <= start:
+            _, track_index, item_index = starts[cursor]
+            heappush(active[track_index], item_index)
+            cursor += 1
+
+        if end - start <= delta:
+            continue
+
+        texts = []
+        for track, heap in zip(tracks, active):
+            # Boundaries include every end, so a cue ending before this
+            # interval does not cover any of the following ones either.
+            while heap and track[heap[0]].end.ordinal < end:
+                heappop(heap)
+            if heap and track[heap[0]].text:
+                texts.append(track[heap[0]].text)
+
+        if texts:
+            output.append(WebVTTItem(0, start, end, separator.join(texts)))
+
+    output.clean_indexes()
+    return output
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""
+Parallel parsing of big files, split in chunks on blank lines
+
+Cues never span a blank line, so chunks starting on one can be parsed
+independently. Each worker process reads its own byte range of the file,
+and sends its cues back in pyvtt compact binary format (see pyvtt.binary).
+Errors are sent back with their line index in the chunk, and handled by the
+calling process in file order once line indexes are made absolute.
+
+Rebuilding cues from binary data is the part left to the calling process:
+files are split in a few chunks per worker, so that it rebuilds the first
+ones while workers still parse the next ones.
+
+Only stateless encodings where a line feed is a single 0x0A byte (UTF-8,
+Latin-1, cp1252...) can be split on bytes: other files, ISO-2022 or UTF-7
+ones for instance, are parsed in a single chunk.
+"""
+from codecs import lookup
+from gc import disable
+from io import StringIO
+from multiprocessing import Pool, cpu_count
+from os.path import getsize
+from re import compile
+
+from pyvtt import binary
+from pyvtt.vttfile import BIGGER_BOM, BOMS, WebVTTFile, _splittable
+
+# Chunks are not made smaller than this, process startup would dominate
+MIN_CHUNK_SIZE = 4 * 1024 * 1024
+CHUNKS_PER_WORKER = 4
+RE_BLANK_LINE = compile(b'\n\r?\n')
+# Bytes read after each split point to find a blank line, then doubled
+SEARCH_SIZE = 64 * 1024
+
+
+def split_points(source, size, count):
+    """
+    split_points(source, size, count) -> list of offsets
+
+    Offsets of at most `count` chunks of the `size` bytes of binary file
+    `source`, as even as possible, each one but the first starting on a
+    blank line.
+    """
+    points = [0]
+    for position in range(1, count):
+        target = max(size * position // count, points[-1] + 1)
+        point = _find_blank_line(source, target, size)
+        if point is None:
+            break
+        if point > points[-1]:
+            points.append(point)
+    return points
+
+
+def _find_blank_line(source, position, size):
+    search_size = SEARCH_SIZE
+    while position < size:
+        source.seek(position)
+        data = source.read(search_size + 2)
+        match = RE_BLANK_LINE.search(data)
+        if match:
+            return position + match.start() + 1
+        position += search_size
+        search_size *= 2
+    return None
+
+
+def parse_chunk(path, start, end, encoding):
+    """
+    parse_chunk(path, start, end, encoding) -> (items, errors, lines count)
+
+    Parse bytes `start` to `end` of `path`. `errors` is a list of (line
+    index in chunk, error).
+    """
+    with open(path, 'rb') as source:
+        source.seek(start)
+        text = source.read(end - start).decode(encoding)
+    # Lines are split on '\n', '\r' and '\r\n' only, like in WebVTTFile.open
+    lines = list(StringIO(text, newline=''))
+    # Errors are kept to be handled in file order by the calling process
+    errors = []
+    items = list(WebVTTFile._parse_blocks(
+        lines, lambda index, error: errors.append((index, error))))
+    return items, errors, len(lines)
+
+
+def _parse_chunk(arguments):
+    # Run by workers: a single bytes object is much faster to send back
+    items, errors, lines_count = parse_chunk(*arguments)
+    return binary.dumps(WebVTTFile(items)), errors, lines_count
+
+
+def open_parallel(file_class, path, encoding=None,
+                  error_handling=WebVTTFile.ERROR_PASS, workers=None,
+                  min_chunk_size=MIN_CHUNK_SIZE):
+    """
+    open_parallel(file_class, path[, encoding][, error_handling][, workers]
+                  [, min_chunk_size]) -> file_class instance
+
+    Same as file_class.open, parsing `path` in chunks of at least
+    `min_chunk_size` bytes with a pool of `workers` processes (default to
+    the number of CPUs).
+    """
+    encoding = encoding or file_class._detect_encoding(path)
+    size = getsize(path)
+    if workers is None:
+        workers = cpu_count()
+    count = max(min(workers * CHUNKS_PER_WORKER,
+                    size // max(min_chunk_size, 1)), 1)
+    if not _splittable(encoding):
+        count = 1
+
+    with open(path, 'rb') as source:
+        head = source.read(BIGGER_BOM)
+        start = 0
+        codec_name = lookup(encoding).name
+        for bom, codec in BOMS:
+            if lookup(codec).name == codec_name and head.startswith(bom):
+                start = len(bom)
+        points = split_points(source, size, count)
+        source.seek(start)
+        head = source.read(SEARCH_SIZE).decode(encoding, 'replace')
+    points[0] = start
+    tasks = [(path, chunk_start, chunk_end, encoding)
+             for chunk_start, chunk_end in zip(points, points[1:] + [size])]
+
+    new_file = file_class(path=path, encoding=encoding)
+    new_file.eol = file_class._guess_eol(StringIO(head, newline=''))
+    pool = None
+    if len(tasks) > 1 and workers > 1:
+        # Workers only live for this file: garbage collections are useless
+        pool = Pool(min(workers, len(tasks)), initializer=disable)
+        results = pool.imap(_parse_chunk, tasks)
+    else:
+        results = (parse_chunk(*task) for task in tasks)
+    try:
+        offset = 0
+        for items, errors, lines_count in results:
+            for index, error in errors:
+                file_class._handle_error(error, error_handling,
+                                         offset + index)
+            if pool is not None:
+                items = binary.loads(items, file_class)
+            new_file.extend(items)
+            offset += lines_count
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+    new_file._check_valid_len()
+    return new_file
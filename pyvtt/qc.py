@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""
+Quality control of whole files: reading speed, line lengths and durations
+"""
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+MAX_CPS = 20
+MAX_LINE_LENGTH = 42
+MAX_LINES = 2
+MIN_DURATION = 833
+MAX_DURATION = 7000
+
+
+class QCReport(object):
+    """
+    QCReport(durations, characters_per_second, line_lengths, line_counts,
+             limits, violations)
+
+    Metrics of every cue of a file, in file order. They are NumPy arrays if
+    NumPy is available, lists otherwise:
+
+    durations -> duration in milliseconds.
+    characters_per_second -> visible characters (without tags nor line
+        breaks) per second, 0.0 for empty cues.
+    line_lengths -> visible characters of the longest line.
+    line_counts -> number of lines.
+
+    limits -> dict: check name -> limit used.
+    violations -> dict: check name -> list of positions of faulty cues.
+    """
+    CHECKS = (
+        ('max_cps', 'characters per second > %s'),
+        ('max_line_length', 'characters per line > %s'),
+        ('max_lines', 'lines > %s'),
+        ('min_duration', 'duration < %sms'),
+        ('max_duration', 'duration > %sms'),
+    )
+
+    def __init__(self, durations, characters_per_second, line_lengths,
+                 line_counts, limits, violations):
+        self.durations = durations
+        self.characters_per_second = characters_per_second
+        self.line_lengths = line_lengths
+        self.line_counts = line_counts
+        self.limits = limits
+        self.violations = violations
+
+    def __len__(self):
+        return len(self.durations)
+
+    @property
+    def ok(self):
+        return not any(self.violations.values())
+
+    def summary(self):
+        lines = ['%d cues checked' % len(self)]
+        for name, description in self.CHECKS:
+            if name not in self.violations:
+                continue
+            positions = self.violations[name]
+            lines.append('%s: %d%s' % (
+                description % self.limits[name], len(positions),
+                ' (%s)' % ', '.join('#%d' % (p + 1) for p in positions)
+                if positions else ''))
+        return '\n'.join(lines)
+
+
+def check(vtt_file, max_cps=MAX_CPS, max_line_length=MAX_LINE_LENGTH,
+          max_lines=MAX_LINES, min_duration=MIN_DURATION,
+          max_duration=MAX_DURATION):
+    """
+    check(vtt_file[, max_cps][, max_line_length][, max_lines]
+          [, min_duration][, max_duration]) -> QCReport
+
+    Compute reading speed, line lengths, line counts and durations of all
+    cues in a single pass and report those exceeding given limits.
+    Durations are in milliseconds. Use None to disable a check.
+
+    Characters per second are computed like
+    WebVTTItem.characters_per_second, but tags are only looked for in texts
+    that may contain some.
+    """
+    durations, characters, line_lengths, line_counts = [], [], [], []
+    for item in vtt_file:
+        text = item.text
+        if '<' in text or '>' in text:
+            text = item.text_without_tags
+        lines = text.split('\n')
+        durations.append(item.end.ordinal - item.start.ordinal)
+        characters.append(len(text) - len(lines) + 1)
+        line_lengths.append(max(len(line) for line in lines))
+        line_counts.append(len(lines))
+
+    limits = {
+        'max_cps': max_cps,
+        'max_line_length': max_line_length,
+        'max_lines': max_lines,
+        'min_duration': min_duration,
+        'max_duration': max_duration,
+    }
+    if numpy is not None:
+        metrics = _numpy_metrics(durations, characters, line_lengths,
+                                 line_counts, limits)
+    else:
+        metrics = _python_metrics(durations, characters, line_lengths,
+                                  line_counts, limits)
+    return QCReport(*metrics)
+
+
+def _numpy_metrics(durations, characters, line_lengths, line_counts, limits):
+    durations = numpy.array(durations, dtype=numpy.int64)
+    characters = numpy.array(characters, dtype=numpy.float64)
+    line_lengths = numpy.array(line_lengths, dtype=numpy.int64)
+    line_counts = numpy.array(line_counts, dtype=numpy.int64)
+    cps = numpy.zeros(len(durations))
+    numpy.divide(characters, durations / 1000.0, out=cps,
+                 where=durations != 0)
+
+    checks = {
+        'max_cps': lambda limit: cps > limit,
+        'max_line_length': lambda limit: line_lengths > limit,
+        'max_lines': lambda limit: line_counts > limit,
+        'min_duration': lambda limit: durations < limit,
+        'max_duration': lambda limit: durations > limit,
+    }
+    violations = dict(
+        (name, numpy.flatnonzero(checks[name](limit)).tolist())
+        for name, limit in limits.items() if limit is not None)
+    return durations, cps, line_lengths, line_counts, limits, violations
+
+
+def _python_metrics(durations, characters, line_lengths, line_counts, limits):
+    cps = [count / (duration / 1000.0) if duration else 0.0
+           for count, duration in zip(characters, durations)]
+
+    checks = {
+        'max_cps': lambda limit: (v > limit for v in cps),
+        'max_line_length': lambda limit: (v > limit for v in line_lengths),
+        'max_lines': lambda limit: (v > limit for v in line_counts),
+        'min_duration': lambda limit: (v < limit for v in durations),
+        'max_duration': lambda limit: (v > limit for v in durations),
+    }
+    violations = dict(
+        (name, [p for p, faulty in enumerate(checks[name](limit)) if faulty])
+        for name, limit in limits.items() if limit is not None)
+    return durations, cps, line_lengths, line_counts, limits, violations
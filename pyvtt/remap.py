@@ -0,0 +1,279 @@
+# -*- coding: utf-8 -*-
+"""
+Piecewise linear time maps, to follow subtitles through video edits
+"""
+from bisect import bisect_left, bisect_right
+from copy import copy
+from re import compile
+
+from pyvtt.frames import from_timecode
+from pyvtt.vtttime import WebVTTTime
+
+INFINITY = float('inf')
+
+# HH:MM:SS:FF (or ;FF for drop frame) timecodes, or HH:MM:SS.mmm times
+RE_EDL_TIME = compile(r'\b(\d+):(\d\d):(\d\d)([:;.,])(\d+)\b')
+EDL_FRAME_RATE = 25
+
+
+def _ordinal(time):
+    return WebVTTTime.coerce(time).ordinal
+
+
+class TimeMap(object):
+    """
+    TimeMap(segments)
+
+    segments -> list of (source_start, source_end, target_start,
+        target_end) in milliseconds: each source range is mapped linearly on
+        its target range, times outside of all of them are removed. Source
+        bounds may be infinite, their segments then keep durations
+        unchanged.
+
+    Source ranges may overlap, like when an edit uses a shot twice: times
+    in several ranges have several targets, see map_ranges.
+
+    See from_anchors, from_cuts and from_edl to build one.
+    """
+
+    def __init__(self, segments):
+        # Segments are spread over layers of non-overlapping source ranges,
+        # most maps having a single one
+        self.layers = []
+        for segment in sorted(segments):
+            if segment[1] <= segment[0]:
+                raise ValueError('Empty source range: %r' % (segment, ))
+            for layer in self.layers:
+                if layer.ends[-1] <= segment[0]:
+                    layer.append(segment)
+                    break
+            else:
+                self.layers.append(_Layer())
+                self.layers[-1].append(segment)
+
+    def __len__(self):
+        return sum(len(layer) for layer in self.layers)
+
+    @classmethod
+    def from_anchors(cls, anchors):
+        """
+        from_anchors(anchors) -> TimeMap
+
+        `anchors` -> list of (source, target) times coercible to WebVTTTime:
+            times between two anchors are interpolated, those before the
+            first one or after the last one are shifted like it.
+
+        Example:
+            >>> TimeMap.from_anchors([(0, 0), ({'minutes': 10}, 602000)])
+        """
+        anchors = sorted((_ordinal(s), _ordinal(t)) for s, t in anchors) \
+            or [(0, 0)]
+        (first_source, first_target), (last_source, last_target) = \
+            anchors[0], anchors[-1]
+        segments = [(-INFINITY, first_source, -INFINITY, first_target)]
+        for (source_start, target_start), (source_end, target_end) in zip(
+                anchors[:-1], anchors[1:]):
+            if source_end > source_start:
+                segments.append((source_start, source_end, target_start,
+                                 target_end))
+        segments.append((last_source, INFINITY, last_target, INFINITY))
+        return cls(segments)
+
+    @classmethod
+    def from_cuts(cls, cuts):
+        """
+        from_cuts(cuts) -> TimeMap
+
+        `cuts` -> list of (start, end) times coercible to WebVTTTime, source
+            ranges removed from the video. Following times are moved back by
+            the duration removed before them.
+
+        Example:
+            >>> TimeMap.from_cuts([({'minutes': 1}, {'minutes': 2})])
+        """
+        segments, kept_start, removed = [], 0, 0
+        for start, end in sorted((_ordinal(s), _ordinal(e))
+                                 for s, e in cuts):
+            start = max(start, kept_start)
+            if end <= start:
+                continue
+            if start > kept_start:
+                segments.append((kept_start, start, kept_start - removed,
+                                 start - removed))
+            removed += end - start
+            kept_start = end
+        segments.append((kept_start, INFINITY, kept_start - removed,
+                         INFINITY))
+        return cls(segments)
+
+    @classmethod
+    def from_edl(cls, lines, frame_rate=EDL_FRAME_RATE, start=0):
+        """
+        from_edl(lines[, frame_rate][, start]) -> TimeMap
+
+        Read an edit decision list: every line holding at least three times
+        is an event (source in, source out, record in[, record out]), other
+        ones (titles, comments...) are ignored. This covers CMX 3600 lists.
+
+        Times are either SMPTE timecodes, HH:MM:SS:FF or HH:MM:SS;FF for
+        drop frame ones, at `frame_rate` frames per second (see
+        pyvtt.frames.parse_rate), or HH:MM:SS.mmm times. `start` is the
+        time of the first frame of the video in both source and record
+        timelines, like 01:00:00:00 for many edit systems.
+
+        Example:
+            >>> TimeMap.from_edl(open('cut.edl'), frame_rate=24,
+            ...                  start={'hours': 1})
+        """
+        start = _ordinal(start)
+        segments = []
+        for line in lines:
+            times = [cls._parse_edl_time(match, frame_rate) - start
+                     for match in RE_EDL_TIME.finditer(line)]
+            if len(times) < 3:
+                continue
+            if len(times) == 3:
+                source_in, source_out, record_in = times
+                record_out = record_in + source_out - source_in
+            else:
+                source_in, source_out, record_in, record_out = times[-4:]
+            segments.append((source_in, source_out, record_in, record_out))
+        return cls(segments)
+
+    @classmethod
+    def _parse_edl_time(cls, match, frame_rate):
+        hours, minutes, seconds, separator, fraction = match.groups()
+        if separator in ':;':
+            return from_timecode(match.group(0), frame_rate)
+        return (int(hours) * WebVTTTime.HOURS_RATIO +
+                int(minutes) * WebVTTTime.MINUTES_RATIO +
+                int(seconds) * WebVTTTime.SECONDS_RATIO +
+                int(round(float('0.' + fraction) * 1000)))
+
+    def map(self, time):
+        """
+        map(time) -> int or None
+
+        Map a time coercible to WebVTTTime, return milliseconds or None if
+        it was removed. Times with several targets are mapped to the one of
+        the earliest source range.
+        """
+        ordinal = _ordinal(time)
+        for layer in self.layers:
+            mapped = layer.map(ordinal)
+            if mapped is not None:
+                return mapped
+        return None
+
+    def map_range(self, start, end):
+        """
+        map_range(start, end) -> (start, end) or None
+
+        Map the bounds of a range of milliseconds. A bound in a removed
+        part is moved to the nearest kept time within the range. Return
+        None if nothing of the range was kept. Ranges with several targets
+        are mapped like map() does, see map_ranges.
+        """
+        for layer in self.layers:
+            bounds = layer.map_range(start, end)
+            if bounds is not None:
+                return bounds
+        return None
+
+    def map_ranges(self, start, end):
+        """
+        map_ranges(start, end) -> list of (start, end)
+
+        Map a range of milliseconds like map_range, to all its targets
+        where source ranges overlap.
+        """
+        return [bounds for bounds in (layer.map_range(start, end)
+                                      for layer in self.layers)
+                if bounds is not None]
+
+
+class _Layer(object):
+    # Segments of a TimeMap whose source ranges do not overlap, sorted
+
+    def __init__(self):
+        self.starts = []
+        self.ends = []
+        self.lines = []
+
+    def __len__(self):
+        return len(self.lines)
+
+    def append(self, segment):
+        source_start, source_end, target_start, target_end = segment
+        if INFINITY in (abs(source_start), abs(source_end)):
+            slope = 1.0
+            intercept = (target_start - source_start
+                         if abs(source_start) != INFINITY
+                         else target_end - source_end)
+        else:
+            slope = ((target_end - target_start) /
+                     float(source_end - source_start))
+            intercept = target_start - source_start * slope
+        self.starts.append(source_start)
+        self.ends.append(source_end)
+        self.lines.append((slope, intercept))
+
+    def _apply(self, position, ordinal):
+        slope, intercept = self.lines[position]
+        return int(round(ordinal * slope + intercept))
+
+    def map(self, ordinal):
+        position = bisect_right(self.starts, ordinal) - 1
+        if position < 0 or ordinal >= self.ends[position]:
+            return None
+        return self._apply(position, ordinal)
+
+    def map_range(self, start, end):
+        first = bisect_right(self.starts, start) - 1
+        if first < 0 or start >= self.ends[first]:
+            # Start at the beginning of the next kept segment
+            first += 1
+            if first >= len(self) or self.starts[first] >= end:
+                return None
+            start = self.starts[first]
+        last = bisect_left(self.ends, end)
+        if last >= len(self) or self.starts[last] >= end:
+            # End at the end of the previous kept segment
+            last -= 1
+            if last < first:
+                return None
+            end = self.ends[last]
+        start, end = self._apply(first, start), self._apply(last, end)
+        if end <= start:
+            return None
+        return start, end
+
+
+def remap(vtt_file, time_map):
+    """
+    remap(vtt_file, time_map) -> list of removed WebVTTItem
+
+    Map start and end of every cue of `vtt_file` in place through
+    `time_map`, a TimeMap or a list of (source, target) anchors. Cues lying
+    entirely in removed parts are dropped, the others are trimmed to what
+    was kept. Cues in source ranges used several times are copied for each
+    target, copies following the cue.
+
+    Each cue costs two binary searches among the segments of each layer of
+    the map, a single one unless source ranges overlap.
+    """
+    if not isinstance(time_map, TimeMap):
+        time_map = TimeMap.from_anchors(time_map)
+    kept, removed = [], []
+    for item in vtt_file._owned_items():
+        ranges = time_map.map_ranges(item.start.ordinal, item.end.ordinal)
+        if not ranges:
+            removed.append(item)
+            continue
+        for position, (start, end) in enumerate(ranges):
+            target = copy(item) if position else item
+            target.start = WebVTTTime.from_ordinal(start)
+            target.end = WebVTTTime.from_ordinal(end)
+            kept.append(target)
+    vtt_file[:] = kept
+    return removed
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""
+Timeline analysis and repair: overlapping, out of order or empty cues
+"""
+from collections import namedtuple
+from heapq import heappop, heappush
+from re import compile
+
+from pyvtt.vtttime import WebVTTTime
+
+OVERLAP = 'overlap'
+SHORT_GAP = 'short_gap'
+EMPTY = 'empty'
+NEGATIVE = 'negative'
+OUT_OF_ORDER = 'out_of_order'
+
+TRIM = 'trim'
+MERGE = 'merge'
+STACK = 'stack'
+
+RE_LINE_SETTING = compile(r'(^|\s)line:\S*')
+
+
+class Issue(namedtuple('Issue', ('kind', 'position', 'other'))):
+    """
+    Issue(kind, position, other)
+
+    kind -> one of OVERLAP, SHORT_GAP, EMPTY, NEGATIVE or OUT_OF_ORDER.
+    position -> position of the faulty cue in the file.
+    other -> position of the cue it conflicts with, if any.
+    """
+    __slots__ = ()
+
+
+def analyze(vtt_file, min_gap=0):
+    """
+    analyze(vtt_file[, min_gap]) -> list of Issue
+
+    Report cues of `vtt_file` which:
+      - end before they start (NEGATIVE) or as soon as they start (EMPTY)
+      - start before the previous cue of the file (OUT_OF_ORDER)
+      - overlap a cue starting before them (OVERLAP)
+      - start less than `min_gap` after the end of the previous cue
+        (SHORT_GAP). `min_gap` should be coercible to WebVTTTime.
+
+    Cues are sorted once and swept in a single pass, keeping track of the
+    cue which ends the latest so far.
+    """
+    min_gap = WebVTTTime.coerce(min_gap).ordinal
+    starts = [item.start.ordinal for item in vtt_file]
+    ends = [item.end.ordinal for item in vtt_file]
+    keys = list(zip(starts, ends))
+    issues = []
+
+    for position, (start, end) in enumerate(keys):
+        if end < start:
+            issues.append(Issue(NEGATIVE, position, None))
+        elif end == start:
+            issues.append(Issue(EMPTY, position, None))
+        if position and keys[position] < keys[position - 1]:
+            issues.append(Issue(OUT_OF_ORDER, position, position - 1))
+
+    latest = None
+    for position in sorted(range(len(keys)), key=keys.__getitem__):
+        if ends[position] <= starts[position]:
+            continue
+        if latest is not None:
+            gap = starts[position] - ends[latest]
+            if gap < 0:
+                issues.append(Issue(OVERLAP, position, latest))
+            elif 0 < gap < min_gap:
+                issues.append(Issue(SHORT_GAP, position, latest))
+        if latest is None or ends[position] > ends[latest]:
+            latest = position
+
+    return issues
+
+
+def repair(vtt_file, overlaps=TRIM, min_gap=0, drop_empty=True):
+    """
+    repair(vtt_file[, overlaps][, min_gap][, drop_empty]) -> vtt_file
+
+    Fix in place the issues reported by `analyze`:
+      - cues are sorted and their indexes reset.
+      - empty and negative cues are removed if `drop_empty` is True.
+      - overlapping cues are either trimmed (TRIM) so each one ends when
+        the next one starts (a cue starting with the next one has its text
+        merged into it), merged (MERGE) in a single cue or stacked
+        (STACK) on distinct lines using the `line` cue setting. Use None to
+        keep them untouched.
+      - gaps shorter than `min_gap` are closed by extending the cue before.
+
+    Example:
+        >>> repair(subs, overlaps=MERGE, min_gap={'milliseconds': 100})
+    """
+    if overlaps not in (TRIM, MERGE, STACK, None):
+        raise ValueError('Unknown overlap strategy: %r' % (overlaps, ))
+    min_gap = WebVTTTime.coerce(min_gap).ordinal
+
+    items = sorted(vtt_file._owned_items(),
+                   key=lambda i: (i.start.ordinal, i.end.ordinal))
+    if drop_empty:
+        items = [i for i in items if i.end.ordinal > i.start.ordinal]
+    if overlaps == TRIM:
+        items = _trim(items)
+    elif overlaps == MERGE:
+        items = _merge(items)
+    elif overlaps == STACK:
+        _stack(items)
+    if min_gap:
+        _close_gaps(items, min_gap)
+
+    vtt_file[:] = items
+    for index, item in enumerate(items):
+        item.index = index + 1
+    return vtt_file
+
+
+def _trim(items):
+    trimmed = []
+    for item, following in zip(items, items[1:] + [None]):
+        if (following is not None and
+                item.end.ordinal > following.start.ordinal):
+            if following.start.ordinal <= item.start.ordinal:
+                # Nothing left once trimmed: both cues start together, and
+                # the next one lasts at least as long, so it takes the text
+                following.text = '\n'.join((item.text, following.text))
+                continue
+            item.end = WebVTTTime.from_ordinal(following.start.ordinal)
+        trimmed.append(item)
+    return trimmed
+
+
+def _merge(items):
+    merged = []
+    for item in items:
+        if merged and item.start.ordinal < merged[-1].end.ordinal:
+            previous = merged[-1]
+            if item.end.ordinal > previous.end.ordinal:
+                previous.end = WebVTTTime.from_ordinal(item.end.ordinal)
+            previous.text = '\n'.join((previous.text, item.text))
+        else:
+            merged.append(item)
+    return merged
+
+
+def _stack(items):
+    # Interval partitioning: every cue takes the lowest free line.
+    busy, free, lines = [], [], 0
+    for item in items:
+        while busy and busy[0][0] <= item.start.ordinal:
+            heappush(free, heappop(busy)[1])
+        if free:
+            line = heappop(free)
+        else:
+            line, lines = lines, lines + 1
+        heappush(busy, (item.end.ordinal, line))
+        if line:
+            position = RE_LINE_SETTING.sub('', item.position).strip()
+            item.position = ' '.join(
+                s for s in (position, 'line:%d' % -(line + 1)) if s)
+
+
+def _close_gaps(items, min_gap):
+    latest = None
+    for item in items:
+        if latest is not None:
+            gap = item.start.ordinal - latest.end.ordinal
+            if 0 < gap < min_gap:
+                latest.end = WebVTTTime.from_ordinal(item.start.ordinal)
+        if latest is None or item.end.ordinal > latest.end.ordinal:
+            latest = item
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""
+Automatic resynchronization of a track against a correctly timed reference
+
+Both tracks are reduced to their cue starts. For each candidate frame rate
+ratio, starts are binned and the lag maximizing the cross-correlation of
+both histograms gives a coarse offset, refined with the median distance of
+starts matched at that lag.
+"""
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+from math import log
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Frame rates subtitles are commonly made for, as exact ratios
+FRAME_RATES = (24000 / 1001.0, 24.0, 25.0, 30000 / 1001.0, 30.0)
+RATIOS = tuple(sorted(set(final / initial for initial in FRAME_RATES
+                          for final in FRAME_RATES)))
+RESOLUTION = 250
+MAX_OFFSET = 5 * 60 * 1000
+
+# Each start also counts half in the bins around it, so starts a bin apart
+# still correlate.
+KERNEL = (0.5, 1.0, 0.5)
+
+
+class Alignment(namedtuple('Alignment', ('offset', 'ratio', 'score'))):
+    """
+    Alignment(offset, ratio, score)
+
+    offset -> int: milliseconds to add once times are multiplied by ratio.
+    ratio -> float: ratio to multiply times with.
+    score -> float: share of cues starting within a bin of a reference cue
+        once aligned, between 0 and 1.
+    """
+    __slots__ = ()
+
+    def apply(self, vtt_file):
+        """
+        apply(vtt_file)
+
+        Shift `vtt_file` in place.
+        """
+        if self.ratio != 1:
+            vtt_file.shift(ratio=self.ratio)
+        if self.offset:
+            vtt_file.shift(milliseconds=self.offset)
+
+
+def estimate(vtt_file, reference, ratios=RATIOS, max_offset=MAX_OFFSET,
+             resolution=RESOLUTION):
+    """
+    estimate(vtt_file, reference[, ratios][, max_offset][, resolution])
+        -> Alignment
+
+    Find the ratio among `ratios` and the offset of at most `max_offset`
+    milliseconds which best align cue starts of `vtt_file` on those of
+    `reference`, `resolution` being the width of histogram bins in
+    milliseconds.
+
+    Cross-correlations are computed by FFT if NumPy is available, and from
+    the distances of starts less than `max_offset` apart otherwise.
+    """
+    reference_starts = sorted(max(i.start.ordinal, 0) for i in reference)
+    starts = sorted(max(i.start.ordinal, 0) for i in vtt_file)
+    if not reference_starts or not starts:
+        return Alignment(0, 1.0, 0.0)
+
+    max_lag = int(max_offset // resolution)
+    reference_bins = [s // resolution for s in reference_starts]
+    correlate = _numpy_correlation if numpy is not None else \
+        _python_correlation
+
+    best = None
+    for ratio in ratios:
+        bins = [int(round(s * ratio)) // resolution for s in starts]
+        value, lag = correlate(reference_bins, bins, max_lag)
+        # On ties, prefer ratios close to 1 then small offsets
+        key = (value, -abs(log(ratio)), -abs(lag))
+        if best is None or key > best[0]:
+            best = key, ratio, lag
+
+    _, ratio, lag = best
+    offset, score = _refine(reference_starts, starts, ratio,
+                            lag * resolution, resolution)
+    return Alignment(offset, ratio, score)
+
+
+def resync(vtt_file, reference, **kwargs):
+    """
+    resync(vtt_file, reference[, ratios][, max_offset][, resolution])
+        -> Alignment
+
+    Estimate the alignment of `vtt_file` on `reference` (see estimate) and
+    shift it in place accordingly.
+
+    Example:
+        >>> resync(subs, pyvtt.open('movie.en.vtt'))
+        Alignment(offset=2350, ratio=1.0427..., score=0.91)
+    """
+    alignment = estimate(vtt_file, reference, **kwargs)
+    alignment.apply(vtt_file)
+    return alignment
+
+
+def _numpy_correlation(reference_bins, bins, max_lag):
+    length = max(reference_bins[-1], max(bins)) + 1
+    size = 1
+    while size < 2 * length:
+        size *= 2
+    reference_series = numpy.bincount(reference_bins, minlength=length)
+    series = numpy.convolve(numpy.bincount(bins, minlength=length), KERNEL,
+                            mode='same')
+    # correlation[k] = sum(reference_series[i + k] * series[i]), negative
+    # lags being wrapped at the end.
+    correlation = numpy.fft.irfft(
+        numpy.fft.rfft(reference_series, size) *
+        numpy.conj(numpy.fft.rfft(series, size)), size)
+    max_lag = min(max_lag, length - 1)
+    lags = numpy.arange(-max_lag, max_lag + 1)
+    # Values are multiples of 0.5: get rid of FFT rounding errors
+    values = numpy.rint(correlation[lags] * 2) / 2
+    best = values.max()
+    candidates = lags[values == best]
+    lag = candidates[numpy.argmin(numpy.abs(candidates))]
+    return float(best), int(lag)
+
+
+def _python_correlation(reference_bins, bins, max_lag):
+    histogram = {}
+    for start in bins:
+        low = bisect_left(reference_bins, start - max_lag)
+        high = bisect_right(reference_bins, start + max_lag)
+        for reference_start in reference_bins[low:high]:
+            lag = reference_start - start
+            histogram[lag] = histogram.get(lag, 0) + 1
+
+    best = None
+    for lag in histogram:
+        for candidate in (lag - 1, lag, lag + 1):
+            if abs(candidate) > max_lag:
+                continue
+            value = sum(weight * histogram.get(candidate + shift, 0)
+                        for shift, weight in zip((-1, 0, 1), KERNEL))
+            key = (value, -abs(candidate), -candidate)
+            if best is None or key > best:
+                best = key
+    if best is None:
+        return 0.0, 0
+    return float(best[0]), -best[2]
+
+
+def _refine(reference_starts, starts, ratio, offset, tolerance):
+    distances = []
+    for start in starts:
+        start = start * ratio + offset
+        position = bisect_left(reference_starts, start)
+        nearest = [reference_starts[p] - start
+                   for p in (position - 1, position)
+                   if 0 <= p < len(reference_starts)]
+        distance = min(nearest, key=abs)
+        if abs(distance) <= tolerance:
+            distances.append(distance)
+    if not distances:
+        return int(round(offset)), 0.0
+    distances.sort()
+    median = distances[len(distances) // 2]
+    return int(round(offset + median)), len(distances) / float(len(starts))
@@ -0,0 +1,337 @@
+# -*- coding: utf-8 -*-
+"""
+Long running `vtt serve` mode: commands sent as JSON lines, run by a pool of
+worker processes
+
+Each request is a JSON object holding the command line arguments of a vtt
+command, and optionally the content of its file:
+
+    {"id": 1, "args": ["shift", "2s", "movie.vtt"]}
+    {"args": ["break", "42", "inline.vtt"], "content": "WEBVTT\\n\\n..."}
+
+With a content, the file argument only names the file: nothing is read from
+it. Each response is a JSON object on a single line, holding the id of the
+request if any, and either what the command printed and its messages, or an
+error:
+
+    {"id": 1, "output": "WEBVTT\\n\\n...", "messages": ""}
+    {"id": 2, "error": "invalid parse_rate value: 'abc'"}
+"""
+from errno import ECONNREFUSED
+from io import StringIO
+from json import dumps, loads
+from multiprocessing import Pool, cpu_count
+from os import remove, stat
+from socket import AF_UNIX, SOCK_STREAM, error as socket_error, socket
+from stat import S_ISSOCK
+from sys import stdin, stdout
+
+try:
+    from socketserver import (StreamRequestHandler, ThreadingMixIn,
+                              UnixStreamServer)
+except ImportError:  # Python 2
+    from SocketServer import (StreamRequestHandler, ThreadingMixIn,
+                              UnixStreamServer)
+
+from pyvtt.commands import TimeAwareArgumentParser, WebVTTShifter
+from pyvtt.vttfile import WebVTTFile
+
+
+class RequestError(ValueError):
+    pass
+
+
+class ParserExit(Exception):
+    """
+    Raised instead of exiting once the help or the version is printed.
+    """
+
+
+class RequestArgumentParser(TimeAwareArgumentParser):
+    """
+    Argument parser raising RequestError rather than exiting, and keeping
+    what it prints (help, version) for the response.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(RequestArgumentParser, self).__init__(*args, **kwargs)
+        self.printed = []
+
+    def _print_message(self, message, file=None):
+        if message:
+            self.printed.append(message)
+
+    def exit(self, status=0, message=None):
+        if message:
+            self.printed.append(message)
+        if status:
+            raise RequestError(''.join(self.printed).strip())
+        raise ParserExit(''.join(self.printed))
+
+    def error(self, message):
+        raise RequestError(message)
+
+
+class RequestShifter(WebVTTShifter):
+    """
+    RequestShifter([content])
+
+    WebVTTShifter answering a single request: its output and messages are
+    kept in memory, and its file is read from `content` if given.
+    """
+    PARSER_CLASS = RequestArgumentParser
+
+    def __init__(self, content=None):
+        super(RequestShifter, self).__init__()
+        self.content = content
+        self.error_file = StringIO()
+
+    def run(self, args):
+        try:
+            # Parsing errors are messages of the request, not of the server
+            with WebVTTFile.log_errors_to(self.error_file):
+                super(RequestShifter, self).run(args)
+        finally:
+            if self.output_file_path and hasattr(self, '_output_file'):
+                self._output_file.close()
+
+    def create_backup(self):
+        if self.content is not None:
+            raise RequestError('Cannot edit inline content in place')
+        super(RequestShifter, self).create_backup()
+
+    def split(self):
+        if self.content is not None:
+            raise RequestError('Cannot split inline content')
+        super(RequestShifter, self).split()
+
+    def serve(self):
+        raise RequestError('Cannot serve from a request')
+
+    def open_file(self, path):
+        if self.content is not None and path == self.arguments.file:
+            return WebVTTFile.from_string(self.content,
+                                          error_handling=WebVTTFile.ERROR_LOG)
+        return super(RequestShifter, self).open_file(path)
+
+    def open_stream(self, path, source_format):
+        if self.content is not None and path == self.arguments.file:
+            source_file = StringIO(self.content)
+            return (source_file, WebVTTFile.DEFAULT_ENCODING,
+                    WebVTTFile._guess_eol(source_file))
+        return super(RequestShifter, self).open_stream(path, source_format)
+
+    @property
+    def output_file(self):
+        if not self.output_file_path and not hasattr(self, '_output_file'):
+            self._output_file = StringIO()
+        return WebVTTShifter.output_file.fget(self)
+
+
+def handle(request):
+    """
+    handle(request) -> dict
+
+    Run a request, a dict holding `args` and optionally `content` and `id`,
+    and return its response.
+    """
+    response = {}
+    try:
+        if not isinstance(request, dict):
+            raise RequestError('Request must be a JSON object')
+        if 'id' in request:
+            response['id'] = request['id']
+        args = request.get('args')
+        if not isinstance(args, list):
+            raise RequestError('Request must hold a list of args')
+        shifter = RequestShifter(content=request.get('content'))
+        shifter.run([u'%s' % (arg, ) for arg in args])
+        response['output'] = ('' if shifter.output_file_path
+                              else shifter.output_file.getvalue())
+        response['messages'] = shifter.error_file.getvalue()
+    except ParserExit as exit:
+        response['output'] = exit.args[0]
+        response['messages'] = ''
+    except Exception as error:
+        response.pop('output', None)
+        response['error'] = (error.args[0] if error.args
+                             else type(error).__name__)
+    return response
+
+
+def handle_line(line):
+    """
+    handle_line(line) -> str
+
+    Same as handle, from a JSON line to a JSON line.
+    """
+    try:
+        request = loads(line)
+    except ValueError as error:
+        return dumps({'error': 'Invalid JSON: %s' % error}) + '\n'
+    return dumps(handle(request)) + '\n'
+
+
+def _run_lines(lines, pool):
+    lines = (line for line in lines if line.strip())
+    if pool is None:
+        return (handle_line(line) for line in lines)
+    return pool.imap(handle_line, lines)
+
+
+class RequestHandler(StreamRequestHandler):
+
+    def handle(self):
+        pool = self.server.pool
+        for line in self.rfile:
+            line = line.decode('utf-8')
+            if not line.strip():
+                continue
+            if pool is None:
+                response = handle_line(line)
+            else:
+                response = pool.apply(handle_line, (line, ))
+            self.wfile.write(response.encode('utf-8'))
+            self.wfile.flush()
+
+
+class Server(ThreadingMixIn, UnixStreamServer):
+    """
+    Server(path[, workers])
+
+    Unix socket server, one thread per connection, requests of a
+    connection being answered in order. Commands run in a pool of
+    `workers` processes, in the connection thread if `workers` is 0.
+
+    A socket file left by a server which did not exit cleanly is replaced,
+    binding fails if a server still listens on it. Workers are only started
+    once the socket is bound.
+    """
+    daemon_threads = True
+    pool = None
+    # Whether this server bound the socket file, and has to remove it
+    bound = False
+
+    def __init__(self, path, workers=None):
+        if workers is None:
+            workers = cpu_count()
+        self.path = path
+        remove_stale_socket(path)
+        UnixStreamServer.__init__(self, path, RequestHandler)
+        if workers:
+            try:
+                self.pool = Pool(workers)
+            except BaseException:
+                self.server_close()
+                raise
+
+    def server_bind(self):
+        UnixStreamServer.server_bind(self)
+        self.bound = True
+
+    def server_close(self):
+        UnixStreamServer.server_close(self)
+        if self.pool is not None:
+            self.pool.terminate()
+            self.pool.join()
+            self.pool = None
+        if self.bound:
+            self.bound = False
+            try:
+                remove(self.path)
+            except OSError:
+                pass
+
+
+def remove_stale_socket(path):
+    """
+    remove_stale_socket(path) -> bool
+
+    Remove the Unix socket file `path` if no server listens on it anymore.
+    Return whether it was removed. Other files are left alone.
+    """
+    try:
+        if not S_ISSOCK(stat(path).st_mode):
+            return False
+    except OSError:
+        return False
+    probe = socket(AF_UNIX, SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except socket_error as error:
+        if error.errno != ECONNREFUSED:
+            raise
+        remove(path)
+        return True
+    finally:
+        probe.close()
+    return False
+
+
+def serve(path=None, workers=None, input_file=stdin, output_file=stdout):
+    """
+    serve([path][, workers][, input_file][, output_file])
+
+    Listen on the Unix socket `path` until interrupted, or answer the
+    requests read from `input_file` line by line if `path` is None.
+    """
+    if path is not None:
+        server = Server(path, workers=workers)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+        return
+
+    if workers is None:
+        workers = cpu_count()
+    pool = Pool(workers) if workers else None
+    try:
+        for response in _run_lines(input_file, pool):
+            output_file.write(response)
+            output_file.flush()
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+
+class Client(object):
+    """
+    Client(path)
+
+    Minimal client of a server listening on the Unix socket `path`.
+
+    Example:
+        >>> with Client('/tmp/vtt.sock') as client:
+        ...     client.request(['shift', '2s', 'movie.vtt'])['output']
+    """
+
+    def __init__(self, path):
+        self.socket = socket(AF_UNIX, SOCK_STREAM)
+        self.socket.connect(path)
+        self.responses = self.socket.makefile('rb')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def request(self, args, content=None, **kwargs):
+        """
+        request(args[, content]) -> dict
+
+        Send a request and wait for its response.
+        """
+        kwargs['args'] = list(args)
+        if content is not None:
+            kwargs['content'] = content
+        self.socket.sendall((dumps(kwargs) + '\n').encode('utf-8'))
+        return loads(self.responses.readline().decode('utf-8'))
+
+    def close(self):
+        self.responses.close()
+        self.socket.close()
@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+"""
+Cue timelines published in shared memory for multi-process readers
+
+Layout of the block (native byte order, items sorted by start):
+    header: magic, items count, strings size and longest duration
+    starts, ends, positions in the source file, integer indexes and index
+        kinds (none, integer or string): one int64 per item each
+    string offsets: 3 * items count + 1 int64
+    strings: a single UTF-8 blob holding index, settings and text of every
+        item
+"""
+from array import array
+from bisect import bisect_left, bisect_right
+from struct import Struct
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:
+    shared_memory = None
+
+from pyvtt.binary import INDEX_INT, INDEX_NONE, INDEX_STRING
+from pyvtt.compat import str
+from pyvtt.vttexc import InvalidFile
+from pyvtt.vttfile import WebVTTFile
+from pyvtt.vttitem import WebVTTItem
+from pyvtt.vtttime import WebVTTTime
+
+MAGIC = b'PYVTTSHM'
+HEADER = Struct('=8sqqq')
+INT_SIZE = 8
+
+
+class SharedTimeline(object):
+    """
+    SharedTimeline(memory[, owner])
+
+    Read-only view on a timeline published with SharedTimeline.publish.
+    Use SharedTimeline.attach(name) from other processes.
+
+    Every lookup works on the shared block: items are only built for the
+    subtitles returned.
+
+    Example:
+        >>> timeline = SharedTimeline.publish(pyvtt.open('movie.vtt'))
+        >>> # In any other process:
+        >>> timeline = SharedTimeline.attach(name)
+        >>> timeline.at(seconds=20)
+    """
+
+    def __init__(self, memory, owner=False):
+        self.memory = memory
+        self.owner = owner
+        buffer = memory.buf
+        magic, count, strings_size, max_duration = HEADER.unpack_from(buffer)
+        if magic != MAGIC:
+            raise InvalidFile('Not a shared pyvtt timeline')
+        self.max_duration = max_duration
+
+        self._views = []
+        offset = HEADER.size
+        self.starts = self._view(offset, count)
+        self.ends = self._view(offset + count * INT_SIZE, count)
+        self.positions = self._view(offset + 2 * count * INT_SIZE, count)
+        self.indexes = self._view(offset + 3 * count * INT_SIZE, count)
+        self.kinds = self._view(offset + 4 * count * INT_SIZE, count)
+        self.string_offsets = self._view(offset + 5 * count * INT_SIZE,
+                                         3 * count + 1)
+        offset += (8 * count + 1) * INT_SIZE
+        self.strings = self._readonly(buffer[offset:offset + strings_size])
+
+    def _readonly(self, view):
+        if hasattr(view, 'toreadonly'):
+            view = view.toreadonly()
+        self._views.append(view)
+        return view
+
+    def _view(self, offset, count):
+        raw = self._readonly(self.memory.buf[offset:offset + count * INT_SIZE])
+        view = raw.cast('q')
+        self._views.append(view)
+        return view
+
+    @classmethod
+    def publish(cls, vtt_file, name=None):
+        """
+        publish(vtt_file[, name]) -> SharedTimeline
+
+        Copy start and end ordinals, indexes, settings and texts of
+        `vtt_file` in a new shared memory block. The returned timeline owns
+        the block: call unlink() once no process needs it anymore.
+        """
+        if shared_memory is None:
+            raise ImportError('Shared timelines require '
+                              'multiprocessing.shared_memory (Python 3.8+)')
+        order = sorted(range(len(vtt_file)),
+                       key=lambda p: vtt_file[p].start.ordinal)
+        items = [vtt_file[p] for p in order]
+        indexes, kinds, strings = [], [], []
+        for item in items:
+            if item.index is None:
+                kinds.append(INDEX_NONE)
+                indexes.append(0)
+                strings.append(b'')
+            elif isinstance(item.index, int):
+                kinds.append(INDEX_INT)
+                indexes.append(item.index)
+                strings.append(b'')
+            else:
+                kinds.append(INDEX_STRING)
+                indexes.append(0)
+                strings.append(str(item.index).encode('utf-8'))
+            strings.append(item.position.encode('utf-8'))
+            strings.append(item.text.encode('utf-8'))
+        string_offsets = [0]
+        for string in strings:
+            string_offsets.append(string_offsets[-1] + len(string))
+        max_duration = max([i.end.ordinal - i.start.ordinal for i in items]
+                           or [0])
+
+        count = len(items)
+        size = HEADER.size + (8 * count + 1) * INT_SIZE + string_offsets[-1]
+        memory = shared_memory.SharedMemory(name=name, create=True,
+                                            size=max(size, 1))
+        buffer = memory.buf
+        HEADER.pack_into(buffer, 0, MAGIC, count, string_offsets[-1],
+                         max(max_duration, 0))
+        offset = HEADER.size
+        for column in ([int(i.start.ordinal) for i in items],
+                       [int(i.end.ordinal) for i in items], order, indexes,
+                       kinds, string_offsets):
+            data = array('q', column).tobytes()
+            buffer[offset:offset + len(data)] = data
+            offset += len(data)
+        buffer[offset:offset + string_offsets[-1]] = b''.join(strings)
+        return cls(memory, owner=True)
+
+    @classmethod
+    def attach(cls, name):
+        """
+        attach(name) -> SharedTimeline
+
+        Attach the timeline published under `name` by another process.
+        """
+        if shared_memory is None:
+            raise ImportError('Shared timelines require '
+                              'multiprocessing.shared_memory (Python 3.8+)')
+        try:
+            memory = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            memory = shared_memory.SharedMemory(name=name)
+            # Before Python 3.13 the resource tracker of this process would
+            # destroy the block it does not own on exit.
+            try:
+                from multiprocessing import resource_tracker
+                resource_tracker.unregister(memory._name, 'shared_memory')
+            except (ImportError, AttributeError):
+                pass
+        return cls(memory)
+
+    @property
+    def name(self):
+        return self.memory.name
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+        if self.owner:
+            self.unlink()
+
+    def _string(self, number):
+        return bytes(self.strings[self.string_offsets[number]:
+                                  self.string_offsets[number + 1]]
+                     ).decode('utf-8')
+
+    def index(self, position):
+        kind = self.kinds[position]
+        if kind == INDEX_INT:
+            return self.indexes[position]
+        elif kind == INDEX_STRING:
+            return self._string(3 * position)
+        return None
+
+    def settings(self, position):
+        return self._string(3 * position + 1)
+
+    def text(self, position):
+        return self._string(3 * position + 2)
+
+    def item(self, position):
+        """
+        item(position) -> WebVTTItem
+
+        Build a new item, the `position`th one by start time, with the
+        index and settings it had in the published file.
+        """
+        return WebVTTItem(self.index(position),
+                          WebVTTTime.from_ordinal(self.starts[position]),
+                          WebVTTTime.from_ordinal(self.ends[position]),
+                          self.text(position), self.settings(position))
+
+    def slice(self, starts_before=None, starts_after=None, ends_before=None,
+              ends_after=None):
+        """
+        slice([starts_before][, starts_after][, ends_before][, ends_after]) \
+-> WebVTTFile
+
+        Same as WebVTTFile.slice, but start constraints are binary searched
+        and returned items are never shared.
+        """
+        low, high = 0, len(self)
+        if starts_before:
+            high = bisect_left(self.starts,
+                               WebVTTTime.coerce(starts_before).ordinal)
+        if starts_after:
+            low = bisect_right(self.starts,
+                               WebVTTTime.coerce(starts_after).ordinal)
+        ends_after = WebVTTTime.coerce(ends_after).ordinal \
+            if ends_after else None
+        ends_before = WebVTTTime.coerce(ends_before).ordinal \
+            if ends_before else None
+        if ends_after is not None:
+            # No item lasts longer than max_duration
+            low = max(low, bisect_right(self.starts,
+                                        ends_after - self.max_duration))
+
+        ends = self.ends
+        return WebVTTFile([
+            self.item(p) for p in range(low, high)
+            if (ends_after is None or ends[p] > ends_after) and
+            (ends_before is None or ends[p] < ends_before)])
+
+    def at(self, timestamp=None, **kwargs):
+        """
+        at(timestamp) -> WebVTTFile
+
+        Return all subtitles visible at the timestamp mark.
+        """
+        time = WebVTTTime.coerce(timestamp or kwargs)
+        return self.slice(starts_before=time, ends_after=time)
+
+    def close(self):
+        """
+        Release this process' views and mapping of the block.
+        """
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self.memory.close()
+
+    def unlink(self):
+        """
+        Destroy the block. Only meant to be called by its publisher.
+        """
+        self.memory.unlink()
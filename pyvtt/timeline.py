@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+"""
+Editable timeline of cues, for many inserts, removals and retimings in the
+middle of long tracks
+
+Cues are kept sorted by start then end in a list of blocks of at most
+2 * load_factor cues, each with the sorted list of its keys. Finding a cue
+is a binary search on the last key of each block, then in the block:
+inserting or removing one moves at most a block, not the whole track.
+Positions (and so cue indexes) are computed lazily from block lengths.
+"""
+from bisect import bisect_left, bisect_right
+
+from pyvtt.vttfile import WebVTTFile
+from pyvtt.vtttime import WebVTTTime
+
+LOAD_FACTOR = 1000
+
+
+def _key(item):
+    return item.start.ordinal, item.end.ordinal
+
+
+class Timeline(object):
+    """
+    Timeline([items][, load_factor])
+
+    items -> iterable of WebVTTItem, in any order. They are not copied:
+        edit a WebVTTFile.view() to keep the original file untouched.
+
+    Times of cues must only be changed through retime() while they are in
+    the timeline, since they are its keys.
+
+    Example:
+        >>> timeline = subs.timeline()
+        >>> timeline.add(WebVTTItem(None, 61000, 63000, 'Hello'))
+        >>> timeline.retime(timeline[10], end=75000)
+        >>> timeline.to_file().save('movie.vtt')
+    """
+
+    def __init__(self, items=(), load_factor=LOAD_FACTOR):
+        self.load_factor = load_factor
+        items = sorted(items, key=_key)
+        self._blocks = [items[start:start + load_factor]
+                        for start in range(0, len(items), load_factor)]
+        self._keys = [[_key(item) for item in block]
+                      for block in self._blocks]
+        self._maxes = [keys[-1] for keys in self._keys]
+        self._offsets = None
+        self._length = len(items)
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        for block in self._blocks:
+            for item in block:
+                yield item
+
+    def __getitem__(self, position):
+        block, offset = self._locate(position)
+        return self._blocks[block][offset]
+
+    def __delitem__(self, position):
+        block, offset = self._locate(position)
+        self._delete(block, offset)
+
+    def _locate(self, position):
+        if position < 0:
+            position += self._length
+        if not 0 <= position < self._length:
+            raise IndexError('Timeline index out of range')
+        offsets = self._get_offsets()
+        block = bisect_right(offsets, position) - 1
+        return block, position - offsets[block]
+
+    def _get_offsets(self):
+        # Position of the first cue of each block, rebuilt after edits
+        if self._offsets is None:
+            offsets, total = [], 0
+            for block in self._blocks:
+                offsets.append(total)
+                total += len(block)
+            self._offsets = offsets
+        return self._offsets
+
+    def add(self, item):
+        """
+        add(item)
+
+        Insert `item` at its place, after cues with the same times.
+        """
+        key = _key(item)
+        if not self._blocks:
+            self._blocks.append([item])
+            self._keys.append([key])
+            self._maxes.append(key)
+        else:
+            block = min(bisect_right(self._maxes, key), len(self._maxes) - 1)
+            keys = self._keys[block]
+            offset = bisect_right(keys, key)
+            keys.insert(offset, key)
+            self._blocks[block].insert(offset, item)
+            self._maxes[block] = keys[-1]
+            if len(keys) > 2 * self.load_factor:
+                self._split(block)
+        self._length += 1
+        self._offsets = None
+
+    def update(self, items):
+        """
+        update(items)
+
+        Add several cues, rebuilding blocks at once if there are many.
+        """
+        items = list(items)
+        if len(items) * 4 < self._length:
+            for item in items:
+                self.add(item)
+        else:
+            self.__init__(list(self) + items, self.load_factor)
+
+    def _split(self, block):
+        half = len(self._keys[block]) // 2
+        self._blocks.insert(block + 1, self._blocks[block][half:])
+        self._keys.insert(block + 1, self._keys[block][half:])
+        del self._blocks[block][half:]
+        del self._keys[block][half:]
+        self._maxes.insert(block, self._keys[block][-1])
+
+    def _find(self, item):
+        # (block, offset) of `item` itself, among cues of the same times
+        key = _key(item)
+        block = bisect_left(self._maxes, key)
+        while block < len(self._blocks):
+            keys = self._keys[block]
+            offset = bisect_left(keys, key)
+            while offset < len(keys) and keys[offset] == key:
+                if self._blocks[block][offset] is item:
+                    return block, offset
+                offset += 1
+            if offset < len(keys):
+                break
+            block += 1
+        raise ValueError('Cue not in timeline: %r' % (item, ))
+
+    def _delete(self, block, offset):
+        del self._blocks[block][offset]
+        del self._keys[block][offset]
+        if self._keys[block]:
+            self._maxes[block] = self._keys[block][-1]
+        else:
+            del self._blocks[block], self._keys[block], self._maxes[block]
+        self._length -= 1
+        self._offsets = None
+
+    def remove(self, item):
+        """
+        remove(item)
+
+        Remove `item` itself (not an equal cue). Raise ValueError if it is
+        not in the timeline.
+        """
+        self._delete(*self._find(item))
+
+    def retime(self, item, start=None, end=None):
+        """
+        retime(item[, start][, end])
+
+        Change times of `item`, coercible to WebVTTTime, and move it to its
+        new place.
+        """
+        self.remove(item)
+        if start is not None:
+            item.start = WebVTTTime.coerce(start)
+        if end is not None:
+            item.end = WebVTTTime.coerce(end)
+        self.add(item)
+
+    def position(self, item):
+        """
+        position(item) -> int
+
+        Position of `item` itself, its index being position + 1 once the
+        timeline is turned into a file.
+        """
+        block, offset = self._find(item)
+        return self._get_offsets()[block] + offset
+
+    def between(self, start, end):
+        """
+        between(start, end) -> list of WebVTTItem
+
+        Cues starting from `start` and before `end`, both coercible to
+        WebVTTTime.
+        """
+        start_key = (WebVTTTime.coerce(start).ordinal, )
+        end_key = (WebVTTTime.coerce(end).ordinal, )
+        items = []
+        block = bisect_left(self._maxes, start_key)
+        while block < len(self._blocks):
+            keys = self._keys[block]
+            low = bisect_left(keys, start_key)
+            high = bisect_left(keys, end_key)
+            items.extend(self._blocks[block][low:high])
+            if high < len(keys):
+                break
+            block += 1
+        return items
+
+    def to_file(self, **kwargs):
+        """
+        to_file(**kwargs) -> WebVTTFile
+
+        Sorted file of all cues, indexes being set on the way. Keyword
+        arguments are passed to WebVTTFile (eol, path, encoding).
+        """
+        vtt_file = WebVTTFile(list(self), **kwargs)
+        for index, item in enumerate(vtt_file.data):
+            item.index = index + 1
+        vtt_file._sorted = True
+        return vtt_file
@@ -1,24 +1,49 @@
 # -*- coding: utf-8 -*-
 from codecs import (BOM_UTF8, BOM_UTF16_BE, BOM_UTF16_LE, BOM_UTF32_BE,
-                    BOM_UTF32_LE, open as copen)
+                    BOM_UTF32_LE, getincrementalencoder, lookup)
 try:
     from collections import UserList
 except ImportError:
     from UserList import UserList
+from contextlib import contextmanager
 from copy import copy
+from io import StringIO
 from itertools import chain
 from os import linesep
+from os.path import abspath
 from sys import stderr
+from threading import local
 
+from pyvtt import binary
+from pyvtt.diff import diff
+from pyvtt.linebreak import break_text, GREEDY
 from pyvtt.vttexc import Error, InvalidFile
 from pyvtt.vttitem import WebVTTItem
+from pyvtt.vtttime import WebVTTTime
 from pyvtt.compat import str
 
 BOMS = ((BOM_UTF32_LE, 'utf_32_le'), (BOM_UTF32_BE, 'utf_32_be'),
         (BOM_UTF16_LE, 'utf_16_le'), (BOM_UTF16_BE, 'utf_16_be'),
         (BOM_UTF8, 'utf_8'))
-CODECS_BOMS = dict((codec, str(bom, codec)) for bom, codec in BOMS)
 BIGGER_BOM = max(len(bom) for bom, encoding in BOMS)
+# Characters serialized before each encoding, see WebVTTFile.iter_encoded
+CHUNK_SIZE = 64 * 1024
+# File ERROR_LOG errors are written to in each thread, see log_errors_to
+_error_log = local()
+# Codecs switching between character sets with escape sequences: bytes
+# cannot be decoded without the ones before them
+STATEFUL_CODECS = ('iso2022', 'hz', 'utf-7')
+
+
+def _splittable(encoding):
+    # Whether a line feed is a single 0x0A byte and the codec is stateless,
+    # so files can be cut on lines as bytes
+    try:
+        if lookup(encoding).name.startswith(STATEFUL_CODECS):
+            return False
+        return u'\n\r\n'.encode(encoding) == b'\n\r\n'
+    except LookupError:
+        return False
 
 
 class WebVTTFile(UserList, object):
@@ -47,6 +72,291 @@ class WebVTTFile(UserList, object):
         self._eol = eol
         self.path = path
         self.encoding = encoding
+        self._sorted = None
+
+    def __reduce__(self):
+        # Pickle items as columns rather than one object (and two times)
+        # per item, see __setstate__.
+        state = (self._eol, self.path, self.encoding,
+                 [item.index for item in self.data],
+                 [item.start.ordinal for item in self.data],
+                 [item.end.ordinal for item in self.data],
+                 [item.text for item in self.data],
+                 [item.position for item in self.data])
+        return self.__class__, (), state
+
+    def __setstate__(self, state):
+        (self._eol, self.path, self.encoding,
+         indexes, starts, ends, texts, positions) = state
+        self._sorted = None
+        self.data = [
+            WebVTTItem(index, WebVTTTime.from_ordinal(start),
+                       WebVTTTime.from_ordinal(end), text, position)
+            for index, start, end, text, position
+            in zip(indexes, starts, ends, texts, positions)]
+
+    def __copy__(self):
+        # Shallow copies share items, unlike pickling
+        clone = self.__class__.__new__(self.__class__)
+        clone.__dict__.update(self.__dict__)
+        clone.data = self.data[:]
+        if self._shared:
+            clone._shared = dict(self._get_shared())
+        return clone
+
+    # id -> item of items also referenced by another file, see view(). Or
+    # the list of these items, never modified, until the dict is needed:
+    # see _frozen_view.
+    _shared = None
+    # Whether items are sorted, None if unknown, see is_sorted
+    _sorted = None
+    # pyvtt.incremental.Source items were read from, see save
+    _source = None
+
+    def view(self):
+        """
+        view() -> WebVTTFile clone
+
+        Return a copy-on-write clone: both files keep referencing the same
+        items, reading them (iteration, text, write_into, qc...) never
+        copies any. A file gets its own copy of an item the first time it
+        edits it (shift, clean_text, break_lines...) or hands it out by
+        index to be edited, so both sides can be altered safely. Items
+        obtained by iteration are the shared ones: edit them by index.
+
+        Example:
+            >>> delayed = subs.view()
+            >>> delayed.shift(seconds=2)  # subs is left untouched
+            >>> delayed[0].text = 'Hello'  # same
+        """
+        return self._view(self.data)
+
+    def _view(self, items):
+        clone = self.__class__.__new__(self.__class__)
+        clone.__dict__.update(self.__dict__)
+        clone.data = list(items)
+        # Items keep their order: a subset of a sorted file is sorted
+        clone._sorted = self._sorted or None
+        clone._shared = self._share(clone.data)
+        return clone
+
+    def _frozen_view(self):
+        # view() of a file which is never modified nor edited afterwards,
+        # like the ones FileCache keeps: its items need not be marked as
+        # shared, and the view builds its id -> item dict only if it edits
+        # them. Only the list of items is copied.
+        clone = self.__class__.__new__(self.__class__)
+        clone.__dict__.update(self.__dict__)
+        clone.data = list(self.data)
+        clone._shared = self.data
+        return clone
+
+    def _get_shared(self):
+        shared = self._shared
+        if shared is not None and not isinstance(shared, dict):
+            shared = self._shared = dict((id(item), item) for item in shared)
+        return shared
+
+    def _share(self, items):
+        # Mark `items` as referenced by another file too, and return the
+        # id -> item dict this other file keeps for them
+        shared = dict((id(item), item) for item in items)
+        if self._shared:
+            self._get_shared().update(shared)
+        else:
+            self._shared = dict(shared)
+        return shared
+
+    def _own(self, position):
+        item = self.data[position]
+        if self._shared and self._get_shared().pop(id(item), None) is item:
+            item = self.data[position] = copy(item)
+        return item
+
+    def _owned_items(self):
+        # Items to edit in place: shared ones are copied first
+        if not self._shared:
+            return iter(self.data)
+        return (self._own(position) for position in range(len(self.data)))
+
+    def _adopt(self, other):
+        # Items of file `other` to add to this one, shared with it. Items
+        # this file may hold already are copied: a file never holds an
+        # item twice.
+        shared = self._get_shared() or {}
+        if other is self:
+            return [copy(item) for item in other.data]
+        items = [copy(item) if id(item) in shared else item
+                 for item in other.data]
+        kept = [item for item, own in zip(items, other.data) if item is own]
+        if kept:
+            if self._shared is None:
+                self._shared = {}
+            self._shared.update(other._share(kept))
+        return items
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            clone = self.__class__(self.data[index])
+            if self._sorted and index.step in (None, 1):
+                clone._sorted = True
+            clone._shared = self._share(clone.data)
+            return clone
+        return self._own(index)
+
+    def pop(self, position=-1):
+        item = self.data.pop(position)
+        if self._shared and self._get_shared().pop(id(item), None) is item:
+            item = copy(item)
+        return item
+
+    def copy(self):
+        return self.view()
+
+    def __add__(self, other):
+        clone = self._view(self.data)
+        clone.extend(other)
+        return clone
+
+    def __radd__(self, other):
+        clone = self._view(self.data)
+        clone.data[:0] = other
+        clone._sorted = None
+        return clone
+
+    def __mul__(self, count):
+        # Repeated items are copies: a file never holds an item twice
+        clone = self._view(self.data if count > 0 else ())
+        if count > 1:
+            clone.data.extend(copy(item) for _ in range(count - 1)
+                              for item in self.data)
+            clone._sorted = None
+        return clone
+
+    __rmul__ = __mul__
+
+    def __imul__(self, count):
+        if count > 1:
+            self.data.extend([copy(item) for _ in range(count - 1)
+                              for item in self.data])
+            self._sorted = None
+        elif count < 1:
+            del self.data[:]
+        return self
+
+    def __setitem__(self, index, item):
+        self.data[index] = item
+        if isinstance(index, slice):
+            self._sorted = None
+        elif self._sorted:
+            self._sorted = self._in_order(index)
+
+    def __iadd__(self, other):
+        self.extend(other)
+        return self
+
+    @property
+    def is_sorted(self):
+        """
+        is_sorted -> bool
+
+        Whether items are sorted by start then end, without sorting them.
+        It is kept up to date through list operations and shift(), and only
+        computed after operations which cannot tell (slice assignment,
+        reverse...). Times of items edited one by one are not tracked:
+        clean_indexes() and slice() check the order again, call sort()
+        before add() or text_at() if they may be out of order.
+        """
+        if self._sorted is None:
+            keys = [(i.start.ordinal, i.end.ordinal) for i in self.data]
+            self._sorted = all(previous <= key for previous, key
+                               in zip(keys, keys[1:]))
+        return self._sorted
+
+    @staticmethod
+    def _key(item):
+        return item.start.ordinal, item.end.ordinal
+
+    def _in_order(self, position):
+        # Whether the item at `position` is in order with its neighbours
+        data, key = self.data, self._key(self.data[position])
+        position %= len(data)
+        return ((position == 0 or self._key(data[position - 1]) <= key) and
+                (position == len(data) - 1 or
+                 key <= self._key(data[position + 1])))
+
+    def append(self, item):
+        self.data.append(item)
+        if self._sorted and len(self.data) > 1:
+            self._sorted = self._in_order(-1)
+
+    def extend(self, other):
+        start = len(self.data)
+        if isinstance(other, WebVTTFile):
+            other = self._adopt(other)
+        elif isinstance(other, UserList):
+            other = other.data
+        self.data.extend(other)
+        if self._sorted:
+            keys = [self._key(item) for item in self.data[max(start - 1, 0):]]
+            self._sorted = all(previous <= key for previous, key
+                               in zip(keys, keys[1:]))
+
+    def insert(self, position, item):
+        length = len(self.data)
+        self.data.insert(position, item)
+        if self._sorted:
+            if position < 0:
+                position = max(position + length, 0)
+            self._sorted = self._in_order(min(position, length))
+
+    def reverse(self):
+        self.data.reverse()
+        self._sorted = None
+
+    def _check_sorted(self):
+        # Times may have been changed through items since _sorted was set
+        self._sorted = None
+        return self.is_sorted
+
+    def sort(self, *args, **kwargs):
+        if args or kwargs:
+            self.data.sort(*args, **kwargs)
+            self._sorted = None
+        elif not self.is_sorted:
+            self.data.sort(key=self._key)
+            self._sorted = True
+
+    def add(self, item):
+        """
+        add(item)
+
+        Insert `item` at its place by start then end, after items with the
+        same times, with a binary search if the file is sorted. Otherwise
+        append it.
+        """
+        if not self.is_sorted:
+            self.data.append(item)
+            return
+        self.data.insert(self._bisect(self._key(item), self._key), item)
+
+    def _bisect(self, key, item_key, right=True):
+        # Position of `key` among sorted item_key(item), after equal ones if
+        # `right`, before them otherwise.
+        data = self.data
+        low, high = 0, len(data)
+        while low < high:
+            middle = (low + high) // 2
+            middle_key = item_key(data[middle])
+            if key < middle_key or (not right and key == middle_key):
+                high = middle
+            else:
+                low = middle + 1
+        return low
+
+    def __iter__(self):
+        # Reading never copies shared items, see view()
+        return iter(self.data)
 
     def _get_eol(self):
         return self._eol or linesep
@@ -68,27 +378,36 @@ class WebVTTFile(UserList, object):
         It reduces the set of subtitles to those that match match given time
         constraints.
 
-        The returned set is a clone, but still contains references to original
-        subtitles. So if you shift this returned set, subs contained in the
-        original WebVTTFile instance will be altered too.
+        The returned set is a copy-on-write view (see view()): shifting or
+        editing its subtitles does not alter the original WebVTTFile, nor
+        does altering the original alter it.
 
         Example:
             >>> subs.slice(ends_after={'seconds': 20}).shift(seconds=2)
         """
-        clone = copy(self)
-
-        if starts_before:
-            clone.data = (i for i in clone.data if i.start < starts_before)
-        if starts_after:
-            clone.data = (i for i in clone.data if i.start > starts_after)
+        items = self.data
+        if (starts_before or starts_after) and self._check_sorted():
+            # Starts are sorted too: bound them by binary search
+            start_key = lambda i: i.start.ordinal
+            low, high = 0, len(items)
+            if starts_after:
+                low = self._bisect(WebVTTTime.coerce(starts_after).ordinal,
+                                   start_key)
+            if starts_before:
+                high = self._bisect(WebVTTTime.coerce(starts_before).ordinal,
+                                    start_key, right=False)
+            items = items[low:max(low, high)]
+        else:
+            if starts_before:
+                items = (i for i in items if i.start < starts_before)
+            if starts_after:
+                items = (i for i in items if i.start > starts_after)
         if ends_before:
-            clone.data = (i for i in clone.data if i.end < ends_before)
+            items = (i for i in items if i.end < ends_before)
         if ends_after:
-            clone.data = (i for i in clone.data if i.end > ends_after)
+            items = (i for i in items if i.end > ends_after)
 
-        clone.data = list(clone.data)
-
-        return clone
+        return self._view(items)
 
     def at(self, timestamp=None, **kwargs):
         """
@@ -106,6 +425,30 @@ class WebVTTFile(UserList, object):
         time = timestamp or kwargs
         return self.slice(starts_before=time, ends_after=time)
 
+    def text_at(self, timestamp=None, **kwargs):
+        """
+        text_at(timestamp) -> list of (WebVTTItem, unicode)
+
+        timestamp argument should be coercible to WebVTTTime object.
+
+        Return all subtitles visible at the timestamp mark along with the
+        part of their text already revealed by karaoke style inline
+        timestamps (e.g. <00:00:05.000>).
+
+        Example:
+            >>> for item, text in subs.text_at(seconds=20):
+            ...     print(text)
+        """
+        time = WebVTTTime.coerce(timestamp or kwargs)
+        # Walk items themselves rather than an at() view, so that parsed
+        # timestamps stay cached on them between calls
+        ordinal, items = time.ordinal, self.data
+        if self.is_sorted:
+            items = items[:self._bisect(ordinal, lambda i: i.start.ordinal,
+                                        right=False)]
+        return [(item, item.text_at(time)) for item in items
+                if item.start.ordinal < ordinal < item.end.ordinal]
+
     def shift(self, *args, **kwargs):
         """shift(hours, minutes, seconds, milliseconds, ratio)
 
@@ -120,19 +463,24 @@ class WebVTTFile(UserList, object):
         Example to delay all subs from 2 seconds and half
         >>> subs.shift(seconds=2, milliseconds=500)
         """
-        for item in self:
+        for item in self._owned_items():
             item.shift(*args, **kwargs)
+        # Offsets and positive ratios keep items in order
+        if kwargs.get('ratio', 1) <= 0:
+            self._sorted = None
 
     def clean_indexes(self):
         """
         clean_indexes()
 
-        Sort subs and reset their index attribute. Should be called after
-        destructive operations like split or such.
+        Sort subs, unless they already are, and reset their index attribute.
+        Should be called after destructive operations like split or such.
         """
+        self._check_sorted()
         self.sort()
-        for index, item in enumerate(self):
-            item.index = index + 1
+        for position, item in enumerate(self.data):
+            if item.index != position + 1:
+                self._own(position).index = position + 1
 
     def clean_text(self, tags=False, brackets=False, keys=False,
                    trailing=False):
@@ -141,7 +489,7 @@ class WebVTTFile(UserList, object):
 
             Removes the indicated tags inside item's text.
             """
-        for item in self:
+        for item in self._owned_items():
             if tags:
                 item.text = item.text_without_tags
             if brackets:
@@ -158,9 +506,101 @@ class WebVTTFile(UserList, object):
             :param replacements: Map with the replaced/replacement tuples
         """
         if replacements:
-            for item in self:
+            for item in self._owned_items():
                 item.text = item.text_with_replacements(replacements)
 
+    def break_lines(self, length, mode=GREEDY):
+        """
+        break_lines(length[, mode])
+
+        Reflow text of each item in lines of at most `length` characters.
+        `mode` is either pyvtt.linebreak.GREEDY or pyvtt.linebreak.BALANCED,
+        see pyvtt.linebreak.break_text.
+        """
+        for position, item in enumerate(self.data):
+            text = break_text(item.text, length, mode)
+            if text != item.text:
+                self._own(position).text = text
+
+    def qc(self, **limits):
+        """
+        qc([max_cps][, max_line_length][, max_lines][, min_duration]
+           [, max_duration]) -> QCReport
+
+        Check reading speed, line lengths and durations of all subtitles in
+        a single pass. See pyvtt.qc.check for limits and their defaults.
+
+        Example:
+            >>> report = subs.qc(max_cps=17)
+            >>> report.violations['max_cps']
+            [4, 10, 12]
+        """
+        # Imported on use, like remap and resync: they are slow to import
+        # (NumPy, fractions) and most scripts never need them.
+        from pyvtt.qc import check
+        return check(self, **limits)
+
+    def diff(self, other):
+        """
+        diff(other) -> list of pyvtt.diff.Change
+
+        Report subtitles inserted, removed, retimed or retexted in `other`,
+        a newer version of this file. See pyvtt.diff.diff.
+
+        Example:
+            >>> for change in subs.diff(pyvtt.open('movie.fixed.vtt')):
+            ...     print(change.kind, change.old, change.new)
+        """
+        return diff(self, other)
+
+    def remap(self, time_map):
+        """
+        remap(time_map) -> list of removed WebVTTItem
+
+        Follow a video edit: map subtitle times through `time_map`, either
+        a pyvtt.remap.TimeMap or a list of (source, target) anchor times,
+        dropping subtitles whose whole time range was cut.
+
+        Example:
+            >>> subs.remap(TimeMap.from_cuts([({'minutes': 1},
+            ...                                {'minutes': 2})]))
+            >>> subs.remap([(0, 0), ({'minutes': 10}, {'minutes': 9})])
+        """
+        from pyvtt.remap import remap
+        return remap(self, time_map)
+
+    def resync(self, reference, **kwargs):
+        """
+        resync(reference[, ratios][, max_offset][, resolution]) -> Alignment
+
+        Estimate the frame rate ratio and offset which best align subtitles
+        on those of `reference`, a correctly timed WebVTTFile, and shift
+        them accordingly. See pyvtt.resync.estimate.
+
+        Example:
+            >>> subs.resync(pyvtt.open('movie.en.vtt'))
+            Alignment(offset=2350, ratio=1.0, score=0.93)
+        """
+        from pyvtt.resync import resync
+        return resync(self, reference, **kwargs)
+
+    def timeline(self, **kwargs):
+        """
+        timeline([load_factor]) -> pyvtt.timeline.Timeline
+
+        Editable timeline of the subtitles, for many inserts, removals and
+        retimings: turn it back into a file with to_file() once done. Cues
+        are shared with this file, not copied, unless it shares them with
+        another one (see view).
+
+        Example:
+            >>> timeline = subs.timeline()
+            >>> timeline.retime(timeline[42], start={'seconds': 61})
+            >>> subs = timeline.to_file()
+        """
+        from pyvtt.timeline import Timeline
+        return Timeline(self._owned_items(), **kwargs)
+
     @property
     def text(self):
         return '\n'.join(i.text for i in self)
@@ -173,13 +613,68 @@ class WebVTTFile(UserList, object):
         If you do not provide any encoding, it can be detected if the file
         contain a bit order mark, unless it is set to utf-8 as default.
         """
-        source_file, encoding = cls._open_unicode_file(
-            path, claimed_encoding=encoding)
+        with open(path, 'rb') as source_file:
+            data = source_file.read()
+        return cls._from_bytes(data, path, encoding, error_handling)
+
+    @classmethod
+    def _from_bytes(cls, data, path='', encoding=None,
+                    error_handling=ERROR_PASS):
+        # open() a file whose content `data` was already read
+        source_file, encoding = cls._decode(data, claimed_encoding=encoding)
         new_file = cls(path=path, encoding=encoding)
-        new_file.read(source_file, error_handling=error_handling)
+        new_file.read(source_file, error_handling=error_handling,
+                      track_source=True)
         source_file.close()
         return new_file
 
+    @classmethod
+    def open_cached(cls, path, encoding=None, error_handling=ERROR_PASS,
+                    cache_path=None):
+        """
+        open_cached(path[, encoding][, error_handling][, cache_path])
+
+        Like open, but keep a binary copy of parsed subtitles in a sidecar
+        file (`path` + '.vttc' by default) and load it instead of parsing
+        `path` again as long as the source file is unchanged.
+        """
+        return binary.open_cached(cls, path, encoding=encoding,
+                                  error_handling=error_handling,
+                                  cache_path=cache_path)
+
+    @classmethod
+    def open_parallel(cls, path, encoding=None, error_handling=ERROR_PASS,
+                      workers=None):
+        """
+        open_parallel(path[, encoding][, error_handling][, workers])
+
+        Like open, but parse big files in chunks with a pool of `workers`
+        processes (default to the number of CPUs). Worth it from a few tens
+        of megabytes. See pyvtt.parallel.
+        """
+        from pyvtt.parallel import open_parallel
+        return open_parallel(cls, path, encoding=encoding,
+                             error_handling=error_handling, workers=workers)
+
+    @classmethod
+    def load_binary(cls, path):
+        """
+        load_binary(path) -> WebVTTFile
+
+        Load a file saved with save_binary.
+        """
+        with open(path, 'rb') as binary_file:
+            return binary.loads(binary_file.read(), cls)
+
+    def save_binary(self, path):
+        """
+        save_binary(path)
+
+        Save subtitles, eol and encoding in pyvtt compact binary format.
+        """
+        with open(path, 'wb') as binary_file:
+            binary_file.write(binary.dumps(self))
+
     @classmethod
     def from_string(cls, source, **kwargs):
         """
@@ -193,31 +688,52 @@ class WebVTTFile(UserList, object):
         new_file.read(source.splitlines(True), error_handling=error_handling)
         return new_file
 
-    def read(self, source_file, error_handling=ERROR_PASS):
+    def read(self, source_file, error_handling=ERROR_PASS,
+             track_source=False):
         """
-        read(source_file, [error_handling])
+        read(source_file, [error_handling][, track_source])
 
         This method parse subtitles contained in `source_file` and append them
         to the current instance.
 
         `source_file` -> Any iterable that yield unicode strings, like a file
             opened with `codecs.open()` or an array of unicode.
+        `track_source` -> Remember the lines each subtitle was read from, for
+            save(incremental=True). `source_file` must then hold all lines of
+            a file in the current encoding: opened on a path, or on self.path
+            if it has no name.
         """
         self.eol = self._guess_eol(source_file)
-        self.extend(self.stream(source_file, error_handling=error_handling))
+        source = None
+        if track_source:
+            from pyvtt.incremental import Source
+            source = Source(getattr(source_file, 'name', None) or self.path,
+                            self.encoding)
+        items = list(self.stream(source_file, error_handling=error_handling,
+                                 source=source))
+        if source is not None and items:
+            source.header_end = items[0]._source[1]
+            source.last_end = items[-1]._source[2]
+            self._source = source
+        self.extend(items)
         self._check_valid_len()
         return self
 
     @classmethod
-    def stream(cls, source_file, error_handling=ERROR_PASS):
+    def stream(cls, source_file, error_handling=ERROR_PASS,
+               parse_item=WebVTTItem.from_lines, source=None):
         """
-        stream(source_file, [error_handling])
+        stream(source_file, [error_handling][, parse_item][, source])
 
         This method yield WebVTTItem instances a soon as they have been parsed
         without storing them. It is a kind of SAX parser for .vtt files.
 
         `source_file` -> Any iterable that yield unicode strings, like a file
             opened with `codecs.open()` or an array of unicode.
+        `parse_item` -> Function building an item from the lines of a block.
+            Default to WebVTTItem.from_lines, which also reads .srt blocks.
+        `source` -> pyvtt.incremental.Source yielded items are tagged with,
+            along with the lines they were read from. See read.
 
         Example:
             >>> import pyvtt
@@ -227,35 +743,65 @@ class WebVTTFile(UserList, object):
             ...     sub.text += "\nHello !"
             ...     print unicode(sub)
         """
+        def handle_error(index, error):
+            cls._handle_error(error, error_handling, index)
+        return cls._parse_blocks(source_file, handle_error,
+                                 parse_item=parse_item, source=source)
+
+    @staticmethod
+    def _parse_blocks(source_file, handle_error,
+                      parse_item=WebVTTItem.from_lines, source=None):
+        # Loop of stream(), calling handle_error(line index, error) for
+        # blocks which cannot be parsed
         string_buffer = []
         for index, line in enumerate(chain(source_file, '\n')):
             if line.strip():
                 string_buffer.append(line)
             else:
-                source = string_buffer
+                lines = string_buffer
                 string_buffer = []
-                if source and all(source):
+                if lines and all(lines):
                     try:
-                        yield WebVTTItem.from_lines(source)
+                        item = parse_item(lines)
                     except Error as error:
-                        error.args += (''.join(source), )
-                        cls._handle_error(error, error_handling, index)
-
-    def save(self, path=None, encoding=None, eol=None, include_indexes=False):
+                        error.args += (''.join(lines), )
+                        handle_error(index, error)
+                        continue
+                    if source is not None:
+                        item._source = (source, index - len(lines), index,
+                                        item.index, item.start.ordinal,
+                                        item.end.ordinal)
+                    yield item
+
+    def save(self, path=None, encoding=None, eol=None, include_indexes=False,
+             incremental=False):
         """
-        save([path][, encoding][, eol])
+        save([path][, encoding][, eol][, include_indexes][, incremental])
 
         Use initial path if no other provided.
         Use initial encoding if no other provided.
         Use initial eol if no other provided.
         Set include_indexes to True to include the cue indexes.
+        Set incremental to True to only serialize changed cues and rewrite
+        the file from its first change, when saving an opened file back to
+        its path, encoding and eol. Untouched cues are then kept as they
+        were read, index lines included. See pyvtt.incremental.
         """
         path = path or self.path
         encoding = encoding or self.encoding
 
-        save_file = copen(path, 'w+', encoding=encoding)
-        self.write_into(save_file, eol=eol, include_indexes=include_indexes)
-        save_file.close()
+        if incremental and self._source is not None:
+            from pyvtt.incremental import save
+            if save(self, path, encoding, eol=eol,
+                    include_indexes=include_indexes) is not None:
+                return
+        with open(path, 'wb') as save_file:
+            for chunk in self.iter_encoded(encoding, eol=eol,
+                                           include_indexes=include_indexes):
+                save_file.write(chunk)
+        if self._source is not None and self._source.path == abspath(path):
+            # Lines items were read from are gone
+            self._source = None
 
     def write_into(self, output_file, eol=None, include_indexes=False):
         """
@@ -271,21 +817,94 @@ class WebVTTFile(UserList, object):
         """
         self._check_valid_len()
         output_eol = eol or self.eol
-        output_file.write("WEBVTT{0}{0}".format(output_eol))
+        self._write_header(output_file, output_eol)
+        for item in self:
+            self._write_item(output_file, item, output_eol, include_indexes)
 
+    def iter_encoded(self, encoding=None, eol=None, include_indexes=False,
+                     chunk_size=CHUNK_SIZE):
+        """
+        iter_encoded([encoding][, eol][, include_indexes][, chunk_size])
+            -> iterator of bytes
+
+        Serialize current state as encoded chunks of about `chunk_size`
+        characters, without building the whole text first. Use initial
+        encoding and eol if no other provided.
+
+        Example:
+            >>> for chunk in subs.iter_encoded():
+            ...     response.write(chunk)
+            >>> connection.sendmsg(list(subs.iter_encoded()))
+        """
+        self._check_valid_len()
+        return self._iter_encoded(encoding or self.encoding, eol or self.eol,
+                                  include_indexes, chunk_size)
+
+    def _iter_encoded(self, encoding, eol, include_indexes, chunk_size):
+        # An incremental encoder writes a BOM (utf-16, utf-32) only once
+        encode = getincrementalencoder(encoding)().encode
+        buffer = StringIO()
+        self._write_header(buffer, eol)
         for item in self:
-            string_repr = str(item)
-            if output_eol != '\n':
-                string_repr = string_repr.replace('\n', output_eol)
-            if include_indexes:
-                output_file.write(str(item.index) + output_eol)
-            output_file.write(string_repr)
-            # Only add trailing eol if it's not already present.
-            # It was kept in the WebVTTItem's text before but it really
-            # belongs here. Existing applications might give us subtitles
-            # which already contain a trailing eol though.
-            if not string_repr.endswith(2 * output_eol):
-                output_file.write(output_eol)
+            self._write_item(buffer, item, eol, include_indexes)
+            if buffer.tell() >= chunk_size:
+                yield encode(buffer.getvalue())
+                buffer = StringIO()
+        yield encode(buffer.getvalue(), True)
+
+    def to_bytes(self, encoding=None, eol=None, include_indexes=False):
+        """
+        to_bytes([encoding][, eol][, include_indexes]) -> bytes
+
+        Serialize current state, encoded. Use initial encoding and eol if no
+        other provided.
+        """
+        return b''.join(self.iter_encoded(encoding, eol=eol,
+                                          include_indexes=include_indexes))
+
+    def write_to_buffer(self, buffer, offset=0, encoding=None, eol=None,
+                        include_indexes=False):
+        """
+        write_to_buffer(buffer[, offset][, encoding][, eol][, include_indexes])
+            -> int
+
+        Serialize current state, encoded, into `buffer` from `offset`, and
+        return the number of bytes written. A bytearray grows as needed. For
+        a fixed size buffer (memoryview, mmap), chunks are all encoded first
+        and ValueError is raised before writing anything if they do not fit.
+        """
+        chunks = self.iter_encoded(encoding, eol=eol,
+                                   include_indexes=include_indexes)
+        if not isinstance(buffer, bytearray):
+            chunks = list(chunks)
+            end = offset + sum(len(chunk) for chunk in chunks)
+            if end > len(buffer):
+                raise ValueError('Buffer too small: %d bytes needed' % end)
+        position = offset
+        for chunk in chunks:
+            end = position + len(chunk)
+            buffer[position:end] = chunk
+            position = end
+        return position - offset
+
+    @staticmethod
+    def _write_header(output_file, eol):
+        output_file.write("WEBVTT{0}{0}".format(eol))
+
+    @staticmethod
+    def _write_item(output_file, item, eol, include_indexes=False):
+        string_repr = str(item)
+        if eol != '\n':
+            string_repr = string_repr.replace('\n', eol)
+        if include_indexes:
+            output_file.write(str(item.index) + eol)
+        output_file.write(string_repr)
+        # Only add trailing eol if it's not already present.
+        # It was kept in the WebVTTItem's text before but it really
+        # belongs here. Existing applications might give us subtitles
+        # which already contain a trailing eol though.
+        if not string_repr.endswith(2 * eol):
+            output_file.write(eol)
 
     def _check_valid_len(self):
         if len(self) < 1:
@@ -318,7 +937,10 @@ class WebVTTFile(UserList, object):
         file_descriptor = open(path, 'rb')
         first_chars = file_descriptor.read(BIGGER_BOM)
         file_descriptor.close()
+        return cls._bom_encoding(first_chars)
 
+    @classmethod
+    def _bom_encoding(cls, first_chars):
         for bom, encoding in BOMS:
             if first_chars.startswith(bom):
                 return encoding
@@ -328,16 +950,44 @@ class WebVTTFile(UserList, object):
 
     @classmethod
     def _open_unicode_file(cls, path, claimed_encoding=None):
-        encoding = claimed_encoding or cls._detect_encoding(path)
-        source_file = copen(path, 'rU', encoding=encoding)
+        # Decoding the whole file at once is much faster than reading it
+        # line by line through a codecs StreamReader
+        with open(path, 'rb') as source_file:
+            data = source_file.read()
+        return cls._decode(data, claimed_encoding=claimed_encoding)
+
+    @classmethod
+    def _decode(cls, data, claimed_encoding=None):
+        encoding = claimed_encoding or cls._bom_encoding(data[:BIGGER_BOM])
 
         # get rid of BOM if any
-        possible_bom = CODECS_BOMS.get(encoding, None)
-        if possible_bom:
-            file_bom = source_file.read(len(possible_bom))
-            if not file_bom == possible_bom:
-                source_file.seek(0)  # if not rewind
-        return source_file, encoding
+        codec = lookup(encoding).name
+        for bom, bom_encoding in BOMS:
+            if lookup(bom_encoding).name == codec and data.startswith(bom):
+                data = data[len(bom):]
+                break
+        # Lines are split on '\n', '\r' and '\r\n' only, like bytes
+        return StringIO(data.decode(encoding), newline=''), encoding
+
+    @staticmethod
+    @contextmanager
+    def log_errors_to(error_file):
+        """
+        log_errors_to(error_file)
+
+        Context manager writing errors logged with ERROR_LOG by the current
+        thread to `error_file` rather than sys.stderr.
+
+        Example:
+            >>> with WebVTTFile.log_errors_to(messages):
+            ...     subs = pyvtt.open('movie.vtt', error_handling=ERROR_LOG)
+        """
+        previous = getattr(_error_log, 'file', None)
+        _error_log.file = error_file
+        try:
+            yield error_file
+        finally:
+            _error_log.file = previous
 
     @classmethod
     def _handle_error(cls, error, error_handling, index):
@@ -345,7 +995,8 @@ class WebVTTFile(UserList, object):
             error.args = (index, ) + error.args
             raise error
         if error_handling == cls.ERROR_LOG:
+            error_file = getattr(_error_log, 'file', None) or stderr
             name = type(error).__name__
-            stderr.write('PyVTT-%s(line %s): \n' % (name, index))
-            stderr.write(error.args[0])
-            stderr.write('\n')
+            error_file.write('PyVTT-%s(line %s): \n' % (name, index))
+            error_file.write(error.args[0])
+            error_file.write('\n')
@@ -2,6 +2,7 @@
 """
 WebVTT's subtitle parser
 """
+from bisect import bisect_right
 from re import compile
 
 from pyvtt.vttexc import InvalidItem
@@ -13,6 +14,12 @@ from pyvtt.compat import str, is_py2
 # Workaround to compare regex pattern object type
 PATTERN_TYPE = type(compile(''))
 
+# Compiled tag patterns by delimiters, see WebVTTItem._text_tag_cleaner
+TAG_PATTERNS = {}
+
+# Karaoke style timestamps: <00:00:05.000> or <00:05.000>
+RE_INLINE_TIMESTAMP = compile(r'<(?:(\d+):)?([0-5]\d):([0-5]\d)\.(\d{3})>')
+
 
 class WebVTTItem(ComparableMixin):
     """
@@ -24,6 +31,11 @@ class WebVTTItem(ComparableMixin):
     """
     ITEM_PATTERN = str('%s --> %s%s\n%s\n')
     TIMESTAMP_SEPARATOR = '-->'
+    RE_INLINE_TIMESTAMP = RE_INLINE_TIMESTAMP
+
+    # (source, first line, end line, index, start, end) of an item read from
+    # a file, reset when its text or position is set, see dirty
+    _source = None
 
     def __init__(self, index=0, start=None, end=None, text='', position=''):
         try:
@@ -37,10 +49,84 @@ class WebVTTItem(ComparableMixin):
         self.position = str(position)
         self.text = str(text)
 
+    def _get_text(self):
+        return self._text
+
+    def _set_text(self, text):
+        self._text = text
+        # Inline timestamps are parsed lazily, see `timestamps`
+        self._timestamps = None
+        if self._source is not None:
+            self._source = None
+
+    text = property(_get_text, _set_text)
+
+    def _get_position(self):
+        return self._position
+
+    def _set_position(self, position):
+        self._position = position
+        if self._source is not None:
+            self._source = None
+
+    position = property(_get_position, _set_position)
+
+    @property
+    def dirty(self):
+        """
+        dirty -> bool
+
+        Whether the item changed since it was read from a file, or was not
+        read from one. Times can be shifted in place, so they are compared
+        to the ones read rather than tracked by setters, like the index.
+        """
+        source = self._source
+        return source is None or source[3:] != (
+            self.index, self.start.ordinal, self.end.ordinal)
+
     @property
     def duration(self):
         return self.end - self.start
 
+    @property
+    def timestamps(self):
+        """
+        timestamps -> (ordinals, offsets)
+
+        Karaoke style inline timestamps found in text. `ordinals` is the
+        list of their times in milliseconds and `offsets` the position in
+        text where each timestamp tag starts. Out of order timestamps are
+        raised to the previous one so that `ordinals` is always sorted.
+
+        The result is parsed once and cached until text is modified.
+        """
+        if self._timestamps is None:
+            ordinals, offsets = [], []
+            for match in self.RE_INLINE_TIMESTAMP.finditer(self._text):
+                hours, minutes, seconds, milliseconds = (
+                    int(i or 0) for i in match.groups())
+                ordinal = WebVTTTime(hours, minutes, seconds,
+                                     milliseconds).ordinal
+                ordinals.append(max(ordinal, ordinals[-1])
+                                if ordinals else ordinal)
+                offsets.append(match.start())
+            self._timestamps = ordinals, offsets
+        return self._timestamps
+
+    def text_at(self, timestamp):
+        """
+        text_at(timestamp) -> unicode
+
+        Return the part of text already revealed at `timestamp` according to
+        its inline timestamps. The whole text is returned if it has none.
+        """
+        ordinals, offsets = self.timestamps
+        position = bisect_right(ordinals,
+                                WebVTTTime.coerce(timestamp).ordinal)
+        if position == len(ordinals):
+            return self._text
+        return self._text[:offsets[position]]
+
     @property
     def text_without_tags(self):
         return self._text_tag_cleaner('<', '>')
@@ -68,8 +154,11 @@ class WebVTTItem(ComparableMixin):
 
         # Pre process line by line to avoid some ugly corner cases
         text = '\n'.join([_line_tag_cleaner(i) for i in self.text.split('\n')])
-        return compile(r"{0}[^>]*?{1}".format(
-            before_delimiter, after_delimiter)).sub('', text)
+        delimiters = before_delimiter, after_delimiter
+        if delimiters not in TAG_PATTERNS:
+            TAG_PATTERNS[delimiters] = compile(
+                r"{0}[^>]*?{1}".format(*delimiters))
+        return TAG_PATTERNS[delimiters].sub('', text)
 
     @property
     def text_without_trailing_spaces(self):
@@ -106,6 +195,20 @@ class WebVTTItem(ComparableMixin):
     def _cmpkey(self):
         return self.start, self.end
 
+    def __reduce__(self):
+        # Pickle times as bare ordinals, cached inline timestamps are not
+        # worth shipping.
+        return self.__class__, (self.index, self.start.ordinal,
+                                self.end.ordinal, self.text, self.position)
+
+    def __copy__(self):
+        # Times are mutable: copies get their own, see WebVTTFile.view
+        clone = self.__class__.__new__(self.__class__)
+        clone.__dict__.update(self.__dict__)
+        clone.start = WebVTTTime.from_ordinal(self.start.ordinal)
+        clone.end = WebVTTTime.from_ordinal(self.end.ordinal)
+        return clone
+
     def shift(self, *args, **kwargs):
         """
         shift(hours, minutes, seconds, milliseconds, ratio)
@@ -60,10 +60,13 @@ class WebVTTTime(ComparableMixin):
         return self.TIME_REPR % tuple(self)
 
     def __str__(self):
-        if self.ordinal < 0:
-            # Represent negative times as zero
-            return str(WebVTTTime.from_ordinal(0))
-        return self.TIME_PATTERN % tuple(self)
+        # Represent negative times as zero. Split the ordinal directly, the
+        # descriptors being a large part of serialization time.
+        seconds, milliseconds = divmod(max(self.ordinal, 0),
+                                       self.SECONDS_RATIO)
+        minutes, seconds = divmod(seconds, 60)
+        hours, minutes = divmod(minutes, 60)
+        return self.TIME_PATTERN % (hours, minutes, seconds, milliseconds)
 
     def _compare(self, other, method):
         return super(WebVTTTime, self)._compare(self.coerce(other), method)
@@ -98,7 +101,7 @@ class WebVTTTime(ComparableMixin):
         Coerce many types to WebVTTTime instance.
         Supported types:
           - str/unicode
-          - int/long
+          - int/long/float (milliseconds)
           - datetime.time
           - any iterable
           - dict
@@ -107,7 +110,7 @@ class WebVTTTime(ComparableMixin):
             return other
         if isinstance(other, basestring):
             return cls.from_string(other)
-        if isinstance(other, int):
+        if isinstance(other, (int, float)):
             return cls.from_ordinal(other)
         if isinstance(other, time):
             return cls.from_time(other)
@@ -116,6 +119,10 @@ class WebVTTTime(ComparableMixin):
         except TypeError:
             return cls(*other)
 
+    def __reduce__(self):
+        # Pickle as a bare ordinal instead of a full __dict__
+        return self.__class__, (0, 0, 0, self.ordinal)
+
     def __iter__(self):
         yield self.hours
         yield self.minutes
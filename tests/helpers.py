@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+"""
+Helpers shared by test modules
+"""
+from pyvtt import WebVTTItem
+
+
+def item(start, end, text='', index=0):
+    # Cue from `start` to `end` seconds
+    return WebVTTItem(index, {'seconds': start}, {'seconds': end}, text)
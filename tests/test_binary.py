@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from codecs import open as copen
+from os import remove
+from os.path import dirname, exists, join
+from shutil import copyfile
+from unittest import main, TestCase
+
+from pyvtt import binary, from_string, vttfile, WebVTTFile, WebVTTItem
+from pyvtt.binary import (dumps, loads, read_header, source_digest,
+                          source_stat, CACHE_EXTENSION)
+from pyvtt.compat import str
+from pyvtt.vttexc import InvalidFile
+
+file_path = join(dirname(__file__), '..')
+
+
+class TestSerialization(TestCase):
+
+    def setUp(self):
+        self.file = WebVTTFile([
+            WebVTTItem(1, {'seconds': 1}, {'seconds': 2}, u'Héllo\nworld',
+                       'align:start'),
+            WebVTTItem('intro', {'hours': 3}, {'hours': 4}, 'Bye'),
+            WebVTTItem(None, 0, 1, ''),
+        ], eol='\r\n', encoding='windows-1252')
+
+    def test_round_trip(self):
+        loaded = loads(dumps(self.file), WebVTTFile)
+        self.assertEqual([str(i) for i in loaded],
+                         [str(i) for i in self.file])
+        self.assertEqual([i.index for i in loaded], [1, 'intro', None])
+        self.assertEqual(loaded.eol, '\r\n')
+        self.assertEqual(loaded.encoding, 'windows-1252')
+
+    def test_default_eol(self):
+        loaded = loads(dumps(WebVTTFile([WebVTTItem()])), WebVTTFile)
+        self.assertEqual(loaded._eol, None)
+
+    def test_float_ordinals(self):
+        item = WebVTTItem(1, 0, 1000)
+        item.start.ordinal, item.end.ordinal = 500.0, 1500.0
+        loaded = loads(dumps(WebVTTFile([item])), WebVTTFile)
+        self.assertEqual((loaded[0].start.ordinal, loaded[0].end.ordinal),
+                         (500, 1500))
+
+    def test_options(self):
+        data = dumps(self.file, options=('UTF8', 2))
+        self.assertEqual(read_header(data)[2], ('utf-8', 2))
+        self.assertEqual(read_header(dumps(self.file))[2], (None, 0))
+
+    def test_invalid(self):
+        self.assertRaises(InvalidFile, loads, b'WEBVTT\n\n', WebVTTFile)
+        self.assertRaises(InvalidFile, loads, dumps(self.file)[:-3],
+                          WebVTTFile)
+
+    def test_save_and_load(self):
+        temp_path = join(file_path, 'tests', 'static', 'temp.vttb')
+        self.file.save_binary(temp_path)
+        loaded = WebVTTFile.load_binary(temp_path)
+        remove(temp_path)
+        self.assertEqual(loaded.text, self.file.text)
+
+
+class TestCache(TestCase):
+
+    def setUp(self):
+        self.source_path = join(file_path, 'tests', 'static', 'utf-8.vtt')
+        self.path = join(file_path, 'tests', 'static', 'temp_cached.vtt')
+        self.cache_path = self.path + CACHE_EXTENSION
+        copyfile(self.source_path, self.path)
+        self.reference = from_string(
+            copen(self.source_path, encoding='utf_8').read())
+
+    def tearDown(self):
+        for temp_path in (self.path, self.cache_path):
+            if exists(temp_path):
+                remove(temp_path)
+
+    def write_cache(self, vtt_file, source):
+        with open(self.cache_path, 'wb') as cache_file:
+            cache_file.write(dumps(vtt_file, source))
+
+    def test_fresh_cache(self):
+        # A cache claiming to be fresh is trusted without parsing
+        self.write_cache(WebVTTFile([WebVTTItem(text='cached')]),
+                         source_stat(self.path) + (b'\0' * 20, ))
+        vtt_file = WebVTTFile.open_cached(self.path)
+        self.assertEqual(vtt_file.text, 'cached')
+        self.assertEqual(vtt_file.path, self.path)
+
+    def test_touched_source(self):
+        mtime, size = source_stat(self.path)
+        self.write_cache(WebVTTFile([WebVTTItem(text='cached')]),
+                         (mtime - 10 ** 9, size, source_digest(self.path)))
+        self.assertEqual(WebVTTFile.open_cached(self.path).text, 'cached')
+
+    def test_other_options(self):
+        # A cache written for another encoding or error handling is reparsed
+        source = source_stat(self.path) + (source_digest(self.path), )
+        self.write_cache(WebVTTFile([WebVTTItem(text='cached')]), source)
+        vtt_file = WebVTTFile.open_cached(self.path, encoding='utf-8')
+        self.assertEqual(vtt_file.text, self.reference.text)
+        self.assertEqual(
+            WebVTTFile.open_cached(self.path, encoding='UTF8').text,
+            self.reference.text)
+        with open(self.cache_path, 'wb') as cache_file:
+            cache_file.write(dumps(WebVTTFile([WebVTTItem(text='cached')]),
+                                   source, (None, WebVTTFile.ERROR_LOG)))
+        vtt_file = WebVTTFile.open_cached(self.path)
+        self.assertEqual(vtt_file.text, self.reference.text)
+
+    def test_stale_cache(self):
+        mtime, size = source_stat(self.path)
+        self.write_cache(WebVTTFile([WebVTTItem(text='cached')]),
+                         (mtime - 10 ** 9, size, b'\0' * 20))
+        vtt_file = WebVTTFile.open_cached(self.path)
+        self.assertEqual(len(vtt_file), len(self.reference))
+        self.assertEqual(WebVTTFile.open_cached(self.path).text,
+                         self.reference.text)
+
+    def test_source_read_once(self):
+        mtime, size = source_stat(self.path)
+        self.write_cache(WebVTTFile([WebVTTItem(text='cached')]),
+                         (mtime - 10 ** 9, size, b'\0' * 20))
+        opened = []
+
+        def counting_open(file_path, *args, **kwargs):
+            opened.append(file_path)
+            return open(file_path, *args, **kwargs)
+        binary.open = vttfile.open = counting_open
+        try:
+            vtt_file = WebVTTFile.open_cached(self.path)
+        finally:
+            del binary.open, vttfile.open
+        self.assertEqual(vtt_file.text, self.reference.text)
+        self.assertEqual(opened.count(self.path), 1)
+        with open(self.cache_path, 'rb') as cache_file:
+            self.assertEqual(read_header(cache_file.read())[1],
+                             (mtime, size, source_digest(self.path)))
+
+
+if __name__ == '__main__':
+    main()
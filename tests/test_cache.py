@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from codecs import open as copen
+from os import remove, utime
+from os.path import dirname, join
+from shutil import copyfile
+from threading import Thread
+from tracemalloc import get_traced_memory, start, stop
+from unittest import main, TestCase
+
+from pyvtt import from_string
+from pyvtt.binary import source_stat
+from pyvtt.cache import FileCache
+
+file_path = join(dirname(__file__), '..')
+
+
+def opener(path, encoding=None, error_handling=None):
+    return from_string(copen(path, encoding=encoding or 'utf_8').read(),
+                       path=path)
+
+
+class TestFileCache(TestCase):
+
+    def setUp(self):
+        self.paths = []
+        for name in ('utf-8.vtt', 'windows-1252.srt'):
+            temp_path = join(file_path, 'tests', 'static', 'temp_' + name)
+            copyfile(join(file_path, 'tests', 'static', name), temp_path)
+            self.paths.append(temp_path)
+        self.cache = FileCache(opener=opener)
+
+    def tearDown(self):
+        for temp_path in self.paths:
+            remove(temp_path)
+
+    def test_hits_and_misses(self):
+        first = self.cache.open(self.paths[0])
+        second = self.cache.open(self.paths[0])
+        self.assertEqual(first.text, second.text)
+        stats = self.cache.stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['entries']),
+                         (1, 1, 1))
+        self.assertEqual(stats['bytes'], source_stat(self.paths[0])[1])
+        self.assertTrue(self.paths[0] in self.cache)
+
+    def test_views_are_independent(self):
+        first = self.cache.open(self.paths[0])
+        text = first.text
+        first.shift(seconds=10)
+        first[0].text = 'Altered'
+        second = self.cache.open(self.paths[0])
+        self.assertEqual(second.text, text)
+        self.assertNotEqual(first[1].start, second[1].start)
+
+    def test_hit_allocations(self):
+        # A hit copies the list of cached items, nothing per item
+        with open(self.paths[0], 'w') as source_file:
+            source_file.write('WEBVTT\n\n' + ''.join(
+                '00:%02d:%02d.000 --> 00:%02d:%02d.500\nCue %d\n\n' % (
+                    index // 60, index % 60, index // 60, index % 60, index)
+                for index in range(3000)))
+        cached = self.cache.open(self.paths[0])
+        start()
+        try:
+            vtt_file = self.cache.open(self.paths[0])
+            allocated = get_traced_memory()[1]
+        finally:
+            stop()
+        self.assertEqual(len(vtt_file), len(cached))
+        self.assertTrue(allocated < 16 * len(cached) + 16 * 1024, allocated)
+        vtt_file[0].text = 'Altered'
+        self.assertEqual(self.cache.open(self.paths[0])[0].text, 'Cue 0')
+
+    def test_modified_source(self):
+        vtt_file = self.cache.open(self.paths[0])
+        with open(self.paths[0], 'a') as source_file:
+            source_file.write('\n99:00:00.000 --> 99:00:01.000\nAdded\n')
+        reloaded = self.cache.open(self.paths[0])
+        self.assertEqual(len(reloaded), len(vtt_file) + 1)
+        self.assertEqual(self.cache.stats()['misses'], 2)
+        self.assertEqual(len(self.cache), 1)
+
+    def test_touched_source(self):
+        self.cache.open(self.paths[0])
+        utime(self.paths[0], (0, 0))
+        self.cache.open(self.paths[0])
+        self.assertEqual(self.cache.stats()['misses'], 2)
+
+    def test_max_entries(self):
+        self.cache.max_entries = 1
+        self.cache.open(self.paths[0])
+        self.cache.open(self.paths[1], encoding='windows-1252')
+        self.assertEqual(len(self.cache), 1)
+        self.assertEqual(self.cache.stats()['evictions'], 1)
+        self.assertFalse(self.paths[0] in self.cache)
+
+    def test_max_bytes(self):
+        self.cache.max_bytes = source_stat(self.paths[0])[1]
+        self.cache.open(self.paths[1], encoding='windows-1252')
+        self.cache.open(self.paths[0])
+        self.assertEqual(self.cache.stats()['evictions'], 1)
+        self.cache.open(self.paths[0])
+        self.assertEqual(self.cache.stats()['hits'], 1)
+
+    def test_lru_order(self):
+        self.cache.max_entries = 2
+        self.cache.open(self.paths[0])
+        self.cache.open(self.paths[1], encoding='windows-1252')
+        self.cache.open(self.paths[0])
+        self.cache.open(self.paths[0], encoding='utf_8')
+        self.assertTrue(self.paths[0] in self.cache)
+        self.assertEqual(len(self.cache), 2)
+        self.cache.open(self.paths[0])
+        self.assertEqual(self.cache.stats()['hits'], 2)
+
+    def test_invalidate(self):
+        self.cache.open(self.paths[0])
+        self.cache.invalidate(self.paths[0])
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.stats()['bytes'], 0)
+
+    def test_threads(self):
+        reference = self.cache.open(self.paths[0]).text
+        texts = []
+
+        def read():
+            for _ in range(20):
+                vtt_file = self.cache.open(self.paths[0])
+                vtt_file.shift(seconds=1)
+                texts.append(vtt_file.text)
+        threads = [Thread(target=read) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(texts, [reference] * 80)
+        self.assertEqual(self.cache.stats()['hits'], 80)
+
+
+if __name__ == '__main__':
+    main()
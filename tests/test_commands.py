@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from codecs import open as copen
+from os import close, listdir, rmdir, remove
+from os.path import join
+from tempfile import mkdtemp, mkstemp
+from unittest import main, TestCase
+
+from pyvtt import WebVTTFile, WebVTTItem
+from pyvtt.commands import WebVTTShifter
+from pyvtt.vttexc import InvalidFile
+
+
+class TestTimeAwareArgumentParser(TestCase):
+
+    def parse(self, *args):
+        shifter = WebVTTShifter()
+        shifter.parser = shifter.build_parser(args[0])
+        return shifter.parser.parse_args(args)
+
+    def test_negative_time(self):
+        arguments = self.parse('shift', '-2s', 'movie.vtt')
+        self.assertEqual((arguments.time_offset, arguments.file),
+                         (-2000, 'movie.vtt'))
+
+    def test_positive_time_option(self):
+        arguments = self.parse('merge', '-d', '200ms', 'a.vtt', 'b.vtt')
+        self.assertEqual(arguments.delta, 200)
+        self.assertEqual(arguments.file, 'b.vtt')
+
+    def test_dash_positionals(self):
+        # Not times: left to argparse, '-' and '--' included
+        self.assertEqual(self.parse('shift', '2s', '-').file, '-')
+        self.assertEqual(self.parse('shift', '2s', '--', '-a.vtt').file,
+                         '-a.vtt')
+        self.assertEqual(self.parse('shift', '-2s', '-a.vtt').file, '-a.vtt')
+        self.assertRaises(SystemExit, self.parse, 'shift', '2s', '-a.vtt')
+
+    def test_arguments_not_modified(self):
+        args = ['shift', '-2s', 'movie.vtt']
+        WebVTTShifter().build_parser('shift').parse_args(args)
+        self.assertEqual(args, ['shift', '-2s', 'movie.vtt'])
+
+
+class TestSplit(TestCase):
+
+    def setUp(self):
+        self.directory = mkdtemp()
+        self.path = join(self.directory, 'movie.vtt')
+
+    def tearDown(self):
+        for name in listdir(self.directory):
+            remove(join(self.directory, name))
+        rmdir(self.directory)
+
+    def split(self, items, *limits):
+        shifter = WebVTTShifter()
+        shifter.parser = shifter.build_parser('split')
+        shifter.arguments = shifter.parser.parse_args(
+            ['split'] + list(limits) + [self.path])
+        shifter._source_file = WebVTTFile(items, eol='\n')
+        shifter.split()
+
+    def read_part(self, number):
+        part_path = join(self.directory, 'movie.%d.vtt' % number)
+        with copen(part_path, encoding='utf-8') as part_file:
+            return WebVTTFile.from_string(part_file.read())
+
+    def test_parts(self):
+        items = [WebVTTItem(None, 9000, 11000, 'Across'),
+                 WebVTTItem(None, 1000, 2000, 'First'),
+                 WebVTTItem(None, 12000, 13000, 'Second'),
+                 WebVTTItem(None, 21000, 22000, 'Third')]
+        self.split(items, '10s', '10s')
+        parts = [self.read_part(number) for number in (1, 2, 3)]
+        self.assertEqual([[(i.start.ordinal, i.end.ordinal, i.text)
+                           for i in part] for part in parts],
+                         [[(1000, 2000, 'First'), (9000, 11000, 'Across')],
+                          [(0, 1000, 'Across'), (2000, 3000, 'Second')],
+                          [(1000, 2000, 'Third')]])
+
+    def test_empty_part(self):
+        items = [WebVTTItem(None, 1000, 2000, 'First'),
+                 WebVTTItem(None, 21000, 22000, 'Third')]
+        self.assertRaises(InvalidFile, self.split, items, '10s', '10s')
+
+    def test_last_cue_not_ending_last(self):
+        items = [WebVTTItem(None, 0, 10000, 'A'),
+                 WebVTTItem(None, 20000, 30000, 'B'),
+                 WebVTTItem(None, 5000, 8000, 'C')]
+        self.split(items, '2s')
+        self.assertEqual(sorted(listdir(self.directory)),
+                         ['movie.1.vtt', 'movie.2.vtt'])
+        self.assertEqual([i.text for i in self.read_part(2)],
+                         ['A', 'C', 'B'])
+        self.assertEqual(self.read_part(2)[-1].end.ordinal, 28000)
+
+    def test_durations(self):
+        # Like `vtt split 20m 20m movie.vtt`, limits are parts durations
+        items = [WebVTTItem(None, index * 1000, index * 1000 + 500, str(index))
+                 for index in range(30)]
+        self.split(items, '10s', '10s')
+        self.assertEqual([[i.text for i in self.read_part(number)]
+                          for number in (1, 2, 3)],
+                         [[str(index) for index in range(start, start + 10)]
+                          for start in (0, 10, 20)])
+        self.assertRaises(SystemExit, self.split, items, '10s', '0s')
+
+
+class TestRemap(TestCase):
+
+    def setUp(self):
+        handle, self.edl_path = mkstemp(suffix='.edl')
+        close(handle)
+
+    def tearDown(self):
+        remove(self.edl_path)
+
+    def remap(self, items, edl):
+        with open(self.edl_path, 'w') as edl_file:
+            edl_file.write(edl)
+        shifter = WebVTTShifter()
+        shifter.parser = shifter.build_parser('remap')
+        shifter.arguments = shifter.parser.parse_args(
+            ['remap', self.edl_path, 'movie.vtt'])
+        shifter._source_file = WebVTTFile(items, eol='\n')
+        shifter.remap_file(shifter.arguments)
+        return shifter.input_file
+
+    def test_repeated_source(self):
+        vtt_file = self.remap([WebVTTItem(None, 6000, 7000, 'Again')],
+                              '001  AX  V  C  00:00:00:00 00:00:10:00 '
+                              '00:00:00:00\n'
+                              '002  AX  V  C  00:00:05:00 00:00:10:00 '
+                              '00:00:10:00\n')
+        self.assertEqual([(i.start.ordinal, i.text) for i in vtt_file],
+                         [(6000, 'Again'), (11000, 'Again')])
+
+    def test_invalid(self):
+        self.assertRaises(SystemExit, self.remap, [],
+                          '001  AX  V  C  00:00:10:00 00:00:05:00 '
+                          '00:00:00:00\n')
+
+
+if __name__ == '__main__':
+    main()
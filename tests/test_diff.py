@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+from unittest import main, TestCase
+
+from pyvtt import WebVTTFile
+from pyvtt.diff import (diff, Change, INSERTED, REMOVED, RETIMED, RETEXTED,
+                        MODIFIED)
+from tests.helpers import item
+
+
+def kinds(changes):
+    return [(c.kind, c.old and c.old.text, c.new and c.new.text)
+            for c in changes]
+
+
+class TestDiff(TestCase):
+
+    def setUp(self):
+        self.file = WebVTTFile([item(0, 1, 'One'), item(2, 3, 'Two'),
+                                item(4, 5, 'Three'), item(6, 7, 'Four')])
+
+    def test_identical(self):
+        self.assertEqual(diff(self.file, self.file[:]), [])
+        self.assertEqual(self.file.diff(self.file.view()), [])
+
+    def test_inserted_and_removed(self):
+        other = WebVTTFile([item(0, 1, 'One'), item(2, 3, 'Two'),
+                            item(6, 7, 'Four'), item(8, 9, 'Five')])
+        self.assertEqual(kinds(self.file.diff(other)),
+                         [(REMOVED, 'Three', None),
+                          (INSERTED, None, 'Five')])
+
+    def test_retimed(self):
+        other = self.file.view()
+        other.shift(seconds=10)
+        changes = self.file.diff(other)
+        self.assertEqual(len(changes), 4)
+        self.assertTrue(all(c.kind == RETIMED and c.old.text == c.new.text
+                            for c in changes))
+
+    def test_retexted(self):
+        other = self.file.view()
+        other[1].text = 'Deux'
+        self.assertEqual(kinds(self.file.diff(other)),
+                         [(RETEXTED, 'Two', 'Deux')])
+
+    def test_modified(self):
+        other = WebVTTFile([item(0, 1, 'One'), item(2.5, 3.5, 'Deux'),
+                            item(4, 5, 'Three'), item(6, 7, 'Four')])
+        self.assertEqual(kinds(self.file.diff(other)),
+                         [(MODIFIED, 'Two', 'Deux')])
+
+    def test_repeated_texts(self):
+        # Texts appearing a different number of times are aligned by time
+        old = WebVTTFile([item(0, 1, 'Yes'), item(2, 3, 'No'),
+                          item(4, 5, 'Yes'), item(6, 7, 'Yes')])
+        new = WebVTTFile([item(2, 3, 'No'), item(4.5, 5.5, 'Yes'),
+                          item(8, 9, 'Yes')])
+        self.assertEqual(kinds(old.diff(new)),
+                         [(REMOVED, 'Yes', None), (RETIMED, 'Yes', 'Yes'),
+                          (REMOVED, 'Yes', None), (INSERTED, None, 'Yes')])
+
+    def test_unsorted_files(self):
+        other = WebVTTFile(reversed(self.file[:]))
+        self.assertEqual(self.file.diff(other), [])
+
+    def test_changes_hold_cues(self):
+        new_file = self.file.view()
+        new_file.shift(seconds=1)
+        new_file.append(item(9, 10, 'Five'))
+        changes = diff(self.file, new_file)
+        self.assertEqual(len(changes), 5)
+        for change in changes:
+            self.assertTrue(any(change.new is i for i in new_file.data))
+            if change.old is not None:
+                self.assertTrue(any(change.old is i for i in self.file.data))
+        self.assertTrue(diff(list(self.file), self.file.data[1:])[0].old
+                        is self.file.data[0])
+
+    def test_str(self):
+        change = Change(RETIMED, item(0, 1, 'One', 1), item(1, 2, 'One', 1))
+        self.assertEqual(str(Change(INSERTED, None, change.new)),
+                         "+ #1 00:00:01.000 --> 00:00:02.000 'One'")
+        self.assertEqual(str(change).split('\n')[0],
+                         "~ #1 00:00:00.000 --> 00:00:01.000 'One'")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from codecs import open as copen
+from io import StringIO
+from os import remove
+from os.path import dirname, join
+from unittest import main, TestCase
+
+from pyvtt import from_string, open as vttopen, WebVTTFile, WebVTTItem
+from pyvtt.compat import str
+from pyvtt.formats import (convert, convert_file, format_timestamp, get_format,
+                           SBVFormat, SubRipFormat, TTMLFormat, WebVTTFormat,
+                           xml_encoding)
+from pyvtt.vttexc import InvalidTimeString
+
+file_path = join(dirname(__file__), '..')
+
+
+class TestTimestamp(TestCase):
+
+    def test_format_timestamp(self):
+        self.assertEqual(format_timestamp(3723004), '01:02:03.004')
+        self.assertEqual(format_timestamp(3723004, SubRipFormat.TIME_PATTERN),
+                         '01:02:03,004')
+        self.assertEqual(format_timestamp(-10), '00:00:00.000')
+
+    def test_same_as_vtttime(self):
+        for item in self.items():
+            self.assertEqual(format_timestamp(item.start.ordinal),
+                             str(item.start))
+
+    def items(self):
+        return [WebVTTItem(1, 7654321, 7654322), WebVTTItem(2, 0, 59999)]
+
+
+class TestGetFormat(TestCase):
+
+    def test_by_name(self):
+        self.assertEqual(get_format('SRT'), SubRipFormat)
+
+    def test_by_extension(self):
+        self.assertEqual(get_format(path='movie.vtt'), WebVTTFormat)
+        self.assertEqual(get_format(path='movie.dfxp'), TTMLFormat)
+        self.assertEqual(get_format(None, 'movie.sbv'), SBVFormat)
+
+    def test_unknown(self):
+        self.assertRaises(ValueError, get_format, 'foo')
+        self.assertRaises(ValueError, get_format, path='movie.txt')
+
+
+class TestConversion(TestCase):
+
+    def setUp(self):
+        utf8_path = join(file_path, 'tests', 'static', 'utf-8.vtt')
+        self.content = copen(utf8_path, encoding='utf_8').read()
+        self.vtt_file = from_string(self.content)
+
+    def convert(self, content, source_format, output_format):
+        output = StringIO()
+        convert_file(StringIO(content), output, source_format, output_format)
+        return output.getvalue()
+
+    def assertSameItems(self, items, others):
+        self.assertEqual([(i.start, i.end, i.text) for i in items],
+                         [(i.start, i.end, i.text) for i in others])
+
+    def test_vtt_to_vtt(self):
+        converted = self.convert(self.content, 'vtt', 'vtt')
+        self.assertEqual(converted, self.content)
+
+    def test_srt_round_trip(self):
+        srt = self.convert(self.content, 'vtt', 'srt')
+        self.assertTrue(srt.startswith('1\n00:00:01,000 --> 00:00:04,000\n'))
+        self.assertSameItems(from_string(srt), self.vtt_file)
+        self.assertEqual(self.convert(srt, 'srt', 'vtt'), self.content)
+
+    def test_sbv_round_trip(self):
+        sbv = self.convert(self.content, 'vtt', SBVFormat)
+        self.assertTrue(sbv.startswith('0:00:01.000,0:00:04.000\n'))
+        self.assertEqual(self.convert(sbv, SBVFormat, 'vtt'), self.content)
+
+    def test_ttml_round_trip(self):
+        ttml = self.convert(self.content, 'vtt', 'ttml')
+        items = list(TTMLFormat.read(StringIO(ttml)))
+        self.assertSameItems(items, [
+            WebVTTItem(i.index, i.start, i.end, i.text_without_tags)
+            for i in self.vtt_file])
+
+    def test_ttml_times(self):
+        ttml = ('<tt xmlns="http://www.w3.org/ns/ttml"><body><div>'
+                '<p begin="1.5s" dur="500ms">Hello<br/><span>world</span>'
+                '</p><p begin="00:00:03.000" end="00:00:04.000">!</p>'
+                '</div></body></tt>')
+        items = list(TTMLFormat.read(StringIO(ttml)))
+        self.assertEqual([(i.start.ordinal, i.end.ordinal, i.text)
+                          for i in items],
+                         [(1500, 2000, 'Hello\nworld'), (3000, 4000, '!')])
+
+    def test_ttml_encoding(self):
+        self.assertTrue(TTMLFormat.header().startswith(
+            '<?xml version="1.0" encoding="UTF-8"?>'))
+        source_path = join(file_path, 'tests', 'static', 'utf-8.vtt')
+        temp_path = join(file_path, 'tests', 'static', 'temp_utf16.ttml')
+        convert(source_path, temp_path, output_encoding='UTF16')
+        try:
+            ttml = copen(temp_path, encoding='utf_16').read()
+            self.assertTrue(ttml.startswith(
+                '<?xml version="1.0" encoding="UTF-16"?>'))
+            with open(temp_path, 'rb') as binary_file:
+                items = list(TTMLFormat.read(binary_file))
+        finally:
+            remove(temp_path)
+        self.assertEqual(len(items), len(self.vtt_file))
+
+    def test_xml_encoding(self):
+        self.assertEqual(xml_encoding('latin-1'), 'ISO-8859-1')
+        self.assertEqual(xml_encoding('cp1252'), 'windows-1252')
+        self.assertEqual(xml_encoding('utf_16_le'), 'UTF-16LE')
+        self.assertRaises(ValueError, xml_encoding, 'cp437')
+
+    def test_ttml_declared_encoding(self):
+        static_path = join(file_path, 'tests', 'static')
+        source_path = join(static_path, 'windows-1252.srt')
+        ttml_path = join(static_path, 'temp_latin-1.ttml')
+        srt_path = join(static_path, 'temp_latin-1.srt')
+        try:
+            convert(source_path, ttml_path, encoding='windows-1252',
+                    output_encoding='latin-1')
+            with open(ttml_path, 'rb') as ttml_file:
+                self.assertTrue(ttml_file.read().startswith(
+                    b'<?xml version="1.0" encoding="ISO-8859-1"?>'))
+            convert(ttml_path, srt_path)
+            converted = vttopen(srt_path, encoding='latin-1')
+        finally:
+            for temp_path in (ttml_path, srt_path):
+                try:
+                    remove(temp_path)
+                except OSError:
+                    pass
+        source = vttopen(source_path, encoding='windows-1252')
+        self.assertSameItems(converted, [
+            WebVTTItem(i.index, i.start, i.end, i.text_without_tags)
+            for i in source])
+
+    def test_ttml_whitespace(self):
+        ttml = ('<tt xmlns="http://www.w3.org/ns/ttml"><body><div>\n'
+                '<p begin="1s" end="2s">\n  Hello\t  <span> big </span>\n'
+                '  world <br/> again\n</p>\n'
+                '<p begin="3s" end="4s" xml:space="preserve">a  b<br/> c</p>'
+                '</div></body></tt>')
+        items = list(TTMLFormat.read(StringIO(ttml)))
+        self.assertEqual([i.text for i in items],
+                         ['Hello big world\nagain', 'a  b\n c'])
+
+    def test_ttml_error_line(self):
+        ttml = ('<tt xmlns="http://www.w3.org/ns/ttml"><body><div>\n'
+                '<p begin="1s" end="2s">ok</p>\n\n'
+                '<p begin="3s"\n   end="bad">ko</p>\n'
+                '</div></body></tt>')
+        messages = StringIO()
+        with WebVTTFile.log_errors_to(messages):
+            items = list(TTMLFormat.read(StringIO(ttml),
+                                         WebVTTFile.ERROR_LOG))
+        self.assertEqual(len(items), 1)
+        self.assertTrue('(line 4)' in messages.getvalue())
+        try:
+            list(TTMLFormat.read(StringIO(ttml), WebVTTFile.ERROR_RAISE))
+        except InvalidTimeString as error:
+            self.assertEqual(error.args[0], 4)
+        else:
+            self.fail('InvalidTimeString not raised')
+
+    def test_eol(self):
+        output = StringIO()
+        SubRipFormat.write(self.vtt_file[:1], output, eol='\r\n')
+        self.assertEqual(output.getvalue(),
+                         '1\r\n00:00:01,000 --> 00:00:04,000\r\n'
+                         + self.vtt_file[0].text.replace('\n', '\r\n')
+                         + '\r\n\r\n')
+
+
+if __name__ == '__main__':
+    main()
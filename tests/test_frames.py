@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+from fractions import Fraction
+from unittest import main, TestCase
+
+from pyvtt import WebVTTFile, WebVTTItem
+from pyvtt.frames import (parse_rate, to_frames, from_frames, snap_ordinal,
+                          to_timecode, from_timecode, snap, convert_rate,
+                          snapper, rate_converter)
+
+
+NTSC = Fraction(30000, 1001)
+
+
+class TestRates(TestCase):
+
+    def test_parse_rate(self):
+        self.assertEqual(parse_rate(25), 25)
+        self.assertEqual(parse_rate('23.976'), Fraction(24000, 1001))
+        self.assertEqual(parse_rate(23.976), Fraction(24000, 1001))
+        self.assertEqual(parse_rate('29.97'), NTSC)
+        self.assertEqual(parse_rate('60000/1001'), Fraction(60000, 1001))
+        self.assertEqual(parse_rate('12.5'), Fraction(25, 2))
+        self.assertRaises(ValueError, parse_rate, '0')
+        self.assertRaises(ValueError, parse_rate, 'fast')
+
+    def test_frames(self):
+        self.assertEqual(to_frames(1000, 25), 25)
+        self.assertEqual(to_frames(1019, 25), 25)
+        self.assertEqual(to_frames(1021, 25), 26)
+        self.assertEqual(from_frames(1, '23.976'), 42)
+        self.assertEqual(from_frames(24000, '23.976'), 1001000)
+        self.assertEqual(snap_ordinal(1030, 25), 1040)
+        self.assertEqual(snapper(25)(1030), 1040)
+        self.assertEqual(rate_converter('23.976', 25)(7200000), 7507500)
+
+    def test_no_drift(self):
+        # One hour of 29.97 is 107892 frames, not 107892.107...
+        self.assertEqual(to_frames(3600000, NTSC), 107892)
+        self.assertEqual(from_frames(10 ** 7, NTSC), 333666667)
+
+
+class TestTimecodes(TestCase):
+
+    def test_non_drop(self):
+        self.assertEqual(to_timecode(3723040, 25), '01:02:03:01')
+        self.assertEqual(from_timecode('01:02:03:01', 25), 3723040)
+        self.assertEqual(to_timecode(3600000, NTSC, drop_frame=False),
+                         '00:59:56:12')
+
+    def test_drop_frame(self):
+        frames = [0, 1799, 1800, 17981, 17982, 107892]
+        timecodes = [to_timecode(from_frames(f, NTSC), NTSC) for f in frames]
+        self.assertEqual(timecodes, ['00:00:00;00', '00:00:59;29',
+                                     '00:01:00;02', '00:09:59;29',
+                                     '00:10:00;00', '01:00:00;00'])
+        self.assertEqual([to_frames(from_timecode(t, NTSC), NTSC)
+                          for t in timecodes], frames)
+        self.assertEqual(to_timecode(3600000, '59.94'), '01:00:00;00')
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, from_timecode, '01:02:03', 25)
+        self.assertRaises(ValueError, to_timecode, 0, 25, drop_frame=True)
+
+
+class TestFiles(TestCase):
+
+    def setUp(self):
+        self.file = WebVTTFile([WebVTTItem(1, 1030, 2010, 'Hello'),
+                                WebVTTItem(2, 7200000, 7201001, 'Bye')])
+
+    def test_snap(self):
+        snap(self.file, 25)
+        self.assertEqual([(i.start.ordinal, i.end.ordinal)
+                          for i in self.file],
+                         [(1040, 2000), (7200000, 7201000)])
+
+    def test_convert_rate(self):
+        convert_rate(self.file, '23.976', 25)
+        # 7200000 * 25 * 1001 / 24000 = 7507500 exactly
+        self.assertEqual(self.file[1].start.ordinal, 7507500)
+        self.assertEqual(self.file[0].start.ordinal, 1074)
+        convert_rate(self.file, 25, '23.976')
+        self.assertEqual(self.file[1].start.ordinal, 7200000)
+
+    def test_view(self):
+        view = self.file.view()
+        convert_rate(view, 25, 50)
+        self.assertEqual(view[0].start.ordinal, 2060)
+        self.assertEqual(self.file[0].start.ordinal, 1030)
+
+
+if __name__ == '__main__':
+    main()
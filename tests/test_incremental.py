@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from io import open as iopen
+from os import close, remove
+from tempfile import mkstemp
+from unittest import main, TestCase
+
+from pyvtt import WebVTTFile, WebVTTItem
+from pyvtt.incremental import common_prefix
+
+
+# Spacing which a full save would normalize
+CONTENT = (u'WEBVTT\r\n\r\nNOTE kept as is\r\n\r\n'
+           u'1\r\n00:00:01.000  -->  00:00:02.000\r\nFirst\r\n\r\n'
+           u'2\r\n00:00:03.000  -->  00:00:04.000 align:start\r\n'
+           u'Second\r\n\r\n'
+           u'3\r\n00:00:05.000  -->  00:00:06.000\r\nThird\r\nline\r\n\r\n'
+           u'4\r\n00:00:07.000  -->  00:00:08.000\r\nFourth é\r\n\r\n')
+
+
+class TestIncrementalSave(TestCase):
+
+    def setUp(self):
+        handle, self.path = mkstemp(suffix='.vtt')
+        close(handle)
+        self.write(CONTENT)
+
+    def tearDown(self):
+        remove(self.path)
+
+    def write(self, content):
+        with iopen(self.path, 'w', encoding='utf_8', newline='') as vtt_file:
+            vtt_file.write(content)
+
+    def read(self):
+        with iopen(self.path, encoding='utf_8', newline='') as vtt_file:
+            return vtt_file.read()
+
+    def open(self):
+        vtt_file = WebVTTFile(path=self.path, encoding='utf_8')
+        with iopen(self.path, encoding='utf_8', newline='') as source_file:
+            vtt_file.read(source_file, track_source=True)
+        return vtt_file
+
+    def test_untouched(self):
+        vtt_file = self.open()
+        self.assertFalse(any(item.dirty for item in vtt_file))
+        vtt_file.save(incremental=True)
+        self.assertEqual(self.read(), CONTENT)
+
+    def test_opened(self):
+        vtt_file = WebVTTFile.open(self.path)
+        vtt_file[1].text = u'Changed'
+        vtt_file.save(incremental=True)
+        self.assertEqual(self.read(), CONTENT.replace(
+            u'2\r\n00:00:03.000  -->  00:00:04.000 align:start\r\nSecond',
+            u'00:00:03.000 --> 00:00:04.000 align:start\r\nChanged'))
+
+    def test_separators(self):
+        self.write(CONTENT.replace(u'Second\r\n', u'Second\r\n\r\n')[:-2])
+        self.open().save(incremental=True)
+        self.assertEqual(self.read(), CONTENT)
+
+    def test_edited(self):
+        vtt_file = self.open()
+        vtt_file[2].text = u'Changed'
+        vtt_file.save(incremental=True)
+        self.assertEqual(self.read(), CONTENT.replace(
+            u'3\r\n00:00:05.000  -->  00:00:06.000\r\nThird\r\nline\r\n',
+            u'00:00:05.000 --> 00:00:06.000\r\nChanged\r\n'))
+
+    def test_successive_saves(self):
+        vtt_file = self.open()
+        vtt_file[3].shift(seconds=1)
+        vtt_file.save(incremental=True)
+        del vtt_file[1]
+        vtt_file[0].position = u'line:0'
+        vtt_file.add(WebVTTItem(None, 6500, 6800, u'New'))
+        vtt_file.save(incremental=True)
+        self.assertFalse(any(item.dirty for item in vtt_file))
+        vtt_file.save(incremental=True)
+        self.assertEqual(self.read(), (
+            u'WEBVTT\r\n\r\nNOTE kept as is\r\n\r\n'
+            u'00:00:01.000 --> 00:00:02.000 line:0\r\nFirst\r\n\r\n'
+            u'3\r\n00:00:05.000  -->  00:00:06.000\r\nThird\r\nline\r\n\r\n'
+            u'00:00:06.500 --> 00:00:06.800\r\nNew\r\n\r\n'
+            u'00:00:08.000 --> 00:00:09.000\r\nFourth é\r\n\r\n'))
+        self.assertEqual([item.text for item in self.open()],
+                         [u'First', u'Third\nline', u'New', u'Fourth é'])
+
+    def test_blank_lines_in_text(self):
+        vtt_file = self.open()
+        vtt_file[0].text = u'First\n\nsplit'
+        vtt_file.save(incremental=True)
+        self.assertTrue(vtt_file[0].dirty)
+        vtt_file[3].text = u'Last'
+        vtt_file.save(incremental=True)
+        self.assertTrue(self.read().endswith(
+            u'\r\n00:00:07.000 --> 00:00:08.000\r\nLast\r\n\r\n'))
+
+    def test_changed_on_disk(self):
+        vtt_file = self.open()
+        self.write(CONTENT + u'\r\nNOTE appended\r\n')
+        vtt_file.save(incremental=True)
+        self.assertTrue(self.read().startswith(
+            u'WEBVTT\r\n\r\n00:00:01.000 --> 00:00:02.000\r\nFirst\r\n'))
+
+    def test_full_save(self):
+        vtt_file = self.open()
+        vtt_file.save()
+        vtt_file[0].text = u'Changed'
+        vtt_file.save(incremental=True)
+        self.assertFalse(u'NOTE' in self.read())
+
+
+class TestDirty(TestCase):
+
+    def test_not_read(self):
+        self.assertTrue(WebVTTItem(1, 0, 1000, u'Hello').dirty)
+
+    def test_read(self):
+        vtt_file = WebVTTFile.from_string(CONTENT)
+        self.assertTrue(all(item.dirty for item in vtt_file))
+
+
+class TestCommonPrefix(TestCase):
+
+    def test_common_prefix(self):
+        old = b'a' * 100000 + b'bc'
+        self.assertEqual(common_prefix(old, old), len(old))
+        self.assertEqual(common_prefix(old, old[:-1] + b'd'), len(old) - 1)
+        self.assertEqual(common_prefix(old, b'a' * 70000), 70000)
+        self.assertEqual(common_prefix(old, b'b'), 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+from unittest import main, TestCase
+
+from pyvtt import WebVTTFile, WebVTTItem
+from pyvtt.linebreak import break_text, GREEDY, BALANCED
+
+
+class TestGreedy(TestCase):
+
+    def test_short_text(self):
+        self.assertEqual(break_text('Hello world !', 42), 'Hello world !')
+
+    def test_break(self):
+        self.assertEqual(break_text('aaa bb cc dddd', 6), 'aaa bb\ncc\ndddd')
+
+    def test_reflow(self):
+        self.assertEqual(break_text('Hello\nworld  !', 42), 'Hello world !')
+
+    def test_empty(self):
+        self.assertEqual(break_text('', 10), '')
+        self.assertEqual(break_text(' \n ', 10), '')
+
+    def test_long_word(self):
+        # Nothing is lost when a word does not fit in a line
+        self.assertEqual(break_text('a supercalifragilistic word', 10),
+                         'a\nsupercalifragilistic\nword')
+
+    def test_tags(self):
+        self.assertEqual(break_text('<i>Hello</i> <b>world</b> !', 11),
+                         '<i>Hello</i> <b>world</b>\n!')
+        self.assertEqual(break_text('<v Roger Bingham>Hi there', 8),
+                         '<v Roger Bingham>Hi there')
+
+    def test_lone_lower_than(self):
+        self.assertEqual(break_text('a < b and c', 5), 'a < b\nand c')
+
+    def test_unknown_mode(self):
+        self.assertRaises(ValueError, break_text, 'Hello', 10, 'foo')
+
+
+class TestBalanced(TestCase):
+
+    def test_balanced(self):
+        text = 'The quick brown fox jumps over the lazy dog'
+        self.assertEqual(break_text(text, 36, GREEDY),
+                         'The quick brown fox jumps over the\nlazy dog')
+        self.assertEqual(break_text(text, 36, BALANCED),
+                         'The quick brown fox\njumps over the lazy dog')
+
+    def test_same_line_count_as_greedy(self):
+        text = ' '.join(['word'] * 7 + ['longerword'] * 5)
+        for length in range(10, 40):
+            self.assertEqual(
+                break_text(text, length, BALANCED).count('\n'),
+                break_text(text, length, GREEDY).count('\n'))
+
+    def test_long_word(self):
+        self.assertEqual(break_text('a supercalifragilistic b', 10, BALANCED),
+                         'a\nsupercalifragilistic\nb')
+
+    def test_empty(self):
+        self.assertEqual(break_text('', 10, BALANCED), '')
+
+
+class TestFileBreakLines(TestCase):
+
+    def test_break_lines(self):
+        vtt_file = WebVTTFile([WebVTTItem(1, text='aaa bb cc dddd'),
+                               WebVTTItem(2, text='Hello')])
+        vtt_file.break_lines(6)
+        self.assertEqual(vtt_file.text, 'aaa bb\ncc\ndddd\nHello')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from codecs import open as copen
+from os.path import dirname, join
+from unittest import main, TestCase
+
+from pyvtt import from_string, WebVTTFile, WebVTTItem
+from pyvtt.compat import str
+from pyvtt.merge import merge
+
+file_path = join(dirname(__file__), '..')
+
+
+def vtt_from_path(file_name):
+    return from_string(copen(join(file_path, 'tests', 'vtt_test', file_name),
+                             encoding='utf_8').read())
+
+
+class TestMergeWithReference(TestCase):
+
+    def setUp(self):
+        self.track_a = vtt_from_path('merge_a.vtt')
+        self.track_b = vtt_from_path('merge_b.vtt')
+        # Output of examples/mvyskoc_merge.py with its default delta
+        self.ref = vtt_from_path('ref_merge.vtt')
+
+    def test_compare_with_ref(self):
+        merged = merge([self.track_a, self.track_b], delta=500)
+        self.assertEqual([str(i) for i in merged], [str(i) for i in self.ref])
+
+    def test_indexes(self):
+        merged = merge([self.track_a, self.track_b])
+        self.assertEqual([i.index for i in merged],
+                         list(range(1, len(merged) + 1)))
+
+    def test_no_delta(self):
+        merged = merge([self.track_a, self.track_b], delta=0)
+        self.assertEqual(len(merged), 11)
+        self.assertEqual(merged[0].text, 'Hello, my name is Ana.')
+        self.assertEqual(merged[0].end, {'milliseconds': 1500})
+
+
+class TestMerge(TestCase):
+
+    def setUp(self):
+        self.tracks = [
+            WebVTTFile([WebVTTItem(1, {'seconds': 0}, {'seconds': 4}, 'A')]),
+            WebVTTFile([WebVTTItem(1, {'seconds': 2}, {'seconds': 4}, 'B')]),
+            WebVTTFile([WebVTTItem(1, {'seconds': 0}, {'seconds': 2}, 'C')]),
+        ]
+
+    def test_several_tracks(self):
+        merged = merge(self.tracks, delta=0)
+        self.assertEqual([i.text for i in merged], ['A\nC', 'A\nB'])
+
+    def test_separator(self):
+        merged = merge(self.tracks, delta=0, separator=' / ')
+        self.assertEqual(merged[0].text, 'A / C')
+
+    def test_delta(self):
+        merged = merge(self.tracks, delta={'seconds': 2})
+        self.assertEqual(len(merged), 0)
+
+    def test_overlapping_cues(self):
+        track = WebVTTFile([
+            WebVTTItem(1, {'seconds': 0}, {'seconds': 2}, 'first'),
+            WebVTTItem(2, {'seconds': 1}, {'seconds': 3}, 'second'),
+        ])
+        merged = merge([track], delta=0)
+        self.assertEqual([i.text for i in merged],
+                         ['first', 'first', 'second'])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from io import BytesIO
+from os import close, remove
+from tempfile import mkstemp
+from unittest import main, TestCase
+
+from pyvtt import WebVTTFile, InvalidItem
+from pyvtt.parallel import open_parallel, split_points
+from pyvtt.vttfile import _splittable
+
+
+def build_source(count, eol='\n', broken=()):
+    blocks = []
+    for index in range(count):
+        if index in broken:
+            blocks.append('%d%sNot a cue' % (index + 1, eol))
+        else:
+            blocks.append('%d%s00:00:%02d.000 --> 00:00:%02d.500%s'
+                          u'Cue %d, é%s' % (index + 1, eol, index % 60,
+                                            index % 60, eol, index, eol))
+    return (eol * 2).join(blocks) + eol
+
+
+class TestSplitPoints(TestCase):
+
+    def test_blank_lines(self):
+        data = build_source(100).encode('utf-8')
+        points = split_points(BytesIO(data), len(data), 4)
+        self.assertEqual(len(points), 4)
+        for point in points[1:]:
+            self.assertEqual(data[point - 1:point + 1], b'\n\n')
+
+    def test_no_blank_line(self):
+        data = b'a\n' * 1000
+        self.assertEqual(split_points(BytesIO(data), len(data), 4), [0])
+
+
+class TestOpenParallel(TestCase):
+
+    def setUp(self):
+        handle, self.path = mkstemp(suffix='.vtt')
+        close(handle)
+
+    def tearDown(self):
+        remove(self.path)
+
+    def write(self, source, encoding='utf-8', bom=b''):
+        with open(self.path, 'wb') as vtt_file:
+            vtt_file.write(bom + source.encode(encoding))
+
+    def check(self, source, workers=3, **kwargs):
+        expected = WebVTTFile.from_string(source)
+        vtt_file = open_parallel(WebVTTFile, self.path, workers=workers,
+                                 min_chunk_size=1, **kwargs)
+        self.assertEqual([(i.index, i.start, i.end, i.text) for i in vtt_file],
+                         [(i.index, i.start, i.end, i.text)
+                          for i in expected])
+        self.assertEqual(vtt_file.eol, expected.eol)
+        return vtt_file
+
+    def test_same_as_serial(self):
+        source = build_source(500)
+        self.write(source)
+        self.check(source)
+        self.check(source, workers=1)
+
+    def test_windows_eol(self):
+        source = build_source(200, eol='\r\n')
+        self.write(source)
+        self.check(source)
+
+    def test_bom_and_legacy_encoding(self):
+        source = build_source(200)
+        self.write(source, bom=b'\xef\xbb\xbf')
+        self.assertEqual(self.check(source).encoding, 'utf_8')
+        self.write(source, encoding='windows-1252')
+        self.check(source, encoding='windows-1252')
+        self.write(source, encoding='utf_16')
+        self.check(source, encoding='utf_16')
+
+    def test_stateful_encodings(self):
+        # Escape sequences switch character sets: never split on bytes
+        for encoding in ('iso2022_jp', 'utf-7', 'hz'):
+            self.assertFalse(_splittable(encoding))
+        self.assertTrue(_splittable('shift_jis'))
+        source = build_source(200).replace(u'é', u'日本')
+        self.write(source, encoding='iso2022_jp')
+        self.check(source, encoding='iso2022_jp')
+
+    def test_claimed_encoding_alias(self):
+        source = build_source(200)
+        self.write(source, bom=b'\xef\xbb\xbf')
+        vtt_file = self.check(source, encoding='UTF-8')
+        self.assertEqual(vtt_file[0].text, u'Cue 0, é')
+
+    def test_unicode_line_breaks(self):
+        # Only '\n', '\r' and '\r\n' end lines, as in WebVTTFile.open
+        source = build_source(200).replace(u'é', u'\u2028\x85\x0c\x1c')
+        self.write(source)
+        vtt_file = open_parallel(WebVTTFile, self.path, workers=3,
+                                 min_chunk_size=1)
+        self.assertEqual(len(vtt_file), 200)
+        self.assertEqual(vtt_file[199].text, u'Cue 199, \u2028\x85\x0c\x1c')
+        self.assertEqual(vtt_file.text, WebVTTFile.open(self.path).text)
+
+    def raised_index(self, function, *args, **kwargs):
+        try:
+            function(*args, error_handling=WebVTTFile.ERROR_RAISE, **kwargs)
+        except InvalidItem as error:
+            return error.args[0]
+        self.fail('InvalidItem not raised')
+
+    def test_error_indexes(self):
+        for broken in (10, 150, 290):
+            source = build_source(300, broken=(broken, ))
+            self.write(source)
+            self.check(source)
+            self.assertEqual(
+                self.raised_index(open_parallel, WebVTTFile, self.path,
+                                  workers=3, min_chunk_size=1),
+                self.raised_index(WebVTTFile.from_string, source))
+
+
+if __name__ == '__main__':
+    main()
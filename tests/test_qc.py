@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+from unittest import main, TestCase
+
+from pyvtt import WebVTTFile, WebVTTItem
+from pyvtt import qc
+
+
+class TestCheck(TestCase):
+
+    def setUp(self):
+        self.file = WebVTTFile([
+            WebVTTItem(1, {'seconds': 0}, {'seconds': 20}, 'Hello world !'),
+            WebVTTItem(2, {'seconds': 20}, {'seconds': 21},
+                       '<b>Way too many characters</b>\nfor a second'),
+            WebVTTItem(3, {'seconds': 21}, {'seconds': 21}, 'a\nb\nc'),
+            WebVTTItem(4, {'seconds': 21}, {'seconds': 40}, 'x' * 50),
+        ])
+
+    def check(self):
+        return self.file.qc()
+
+    def test_metrics(self):
+        report = self.check()
+        self.assertEqual(len(report), 4)
+        self.assertEqual(list(report.durations), [20000, 1000, 0, 19000])
+        self.assertEqual(list(report.line_counts), [1, 2, 3, 1])
+        self.assertEqual(list(report.line_lengths), [13, 23, 1, 50])
+
+    def test_same_cps_as_items(self):
+        self.assertEqual(list(self.check().characters_per_second),
+                         [i.characters_per_second for i in self.file])
+
+    def test_violations(self):
+        report = self.check()
+        self.assertFalse(report.ok)
+        self.assertEqual(report.violations, {
+            'max_cps': [1],
+            'max_line_length': [3],
+            'max_lines': [2],
+            'min_duration': [2],
+            'max_duration': [0, 3],
+        })
+
+    def test_disabled_checks(self):
+        report = self.file.qc(max_cps=None, max_line_length=None,
+                              max_lines=None, min_duration=None,
+                              max_duration=None)
+        self.assertTrue(report.ok)
+        self.assertEqual(report.summary(), '4 cues checked')
+
+    def test_summary(self):
+        report = self.file.qc(max_line_length=None, max_lines=None,
+                              min_duration=None, max_duration=None)
+        self.assertEqual(report.summary(), '4 cues checked\n'
+                                           'characters per second > 20: 1 '
+                                           '(#2)')
+
+
+class TestCheckWithoutNumpy(TestCheck):
+
+    def check(self):
+        numpy, qc.numpy = qc.numpy, None
+        try:
+            return self.file.qc()
+        finally:
+            qc.numpy = numpy
+
+
+if __name__ == '__main__':
+    main()
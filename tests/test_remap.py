@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+from unittest import main, TestCase
+
+from pyvtt import WebVTTFile
+from pyvtt.remap import TimeMap, remap
+from tests.helpers import item
+
+
+def bounds(vtt_file):
+    return [(i.start.ordinal, i.end.ordinal) for i in vtt_file]
+
+
+class TestTimeMap(TestCase):
+
+    def test_anchors(self):
+        time_map = TimeMap.from_anchors([(1000, 2000), (11000, 7000)])
+        self.assertEqual(time_map.map(0), 1000)
+        self.assertEqual(time_map.map(1000), 2000)
+        self.assertEqual(time_map.map(6000), 4500)
+        self.assertEqual(time_map.map({'seconds': 21}), 17000)
+
+    def test_no_anchors(self):
+        self.assertEqual(TimeMap.from_anchors([]).map(1234), 1234)
+
+    def test_cuts(self):
+        time_map = TimeMap.from_cuts([(5000, 7000), (1000, 2000)])
+        self.assertEqual([time_map.map(t) for t in (500, 1500, 3000, 6000,
+                                                    8000)],
+                         [500, None, 2000, None, 5000])
+
+    def test_overlapping_cuts(self):
+        time_map = TimeMap.from_cuts([(1000, 3000), (2000, 4000)])
+        self.assertEqual(time_map.map(5000), 2000)
+
+    def test_overlapping_segments(self):
+        # A source range used twice has two targets
+        time_map = TimeMap([(0, 2000, 0, 2000), (1000, 3000, 5000, 7000)])
+        self.assertEqual(len(time_map.layers), 2)
+        self.assertEqual(time_map.map(1500), 1500)
+        self.assertEqual(time_map.map(2500), 6500)
+        self.assertEqual(time_map.map_ranges(500, 1500),
+                         [(500, 1500), (5000, 5500)])
+        self.assertRaises(ValueError, TimeMap, [(1000, 1000, 0, 0)])
+
+    def test_map_range(self):
+        time_map = TimeMap.from_cuts([(2000, 4000)])
+        self.assertEqual(time_map.map_range(0, 1000), (0, 1000))
+        self.assertEqual(time_map.map_range(1000, 3000), (1000, 2000))
+        self.assertEqual(time_map.map_range(3000, 5000), (2000, 3000))
+        self.assertEqual(time_map.map_range(1000, 5000), (1000, 3000))
+        self.assertEqual(time_map.map_range(2500, 3500), None)
+
+    def test_edl(self):
+        edl = [
+            'TITLE: Cut\n',
+            'FCM: NON-DROP FRAME\n',
+            '001  AX  V  C  01:00:00:00 01:00:10:00 01:00:00:00 '
+            '01:00:10:00\n',
+            '* FROM CLIP NAME: movie.mov\n',
+            '002  AX  V  C  01:00:20:12 01:00:30:00 01:00:10:00 '
+            '01:00:19:12\n',
+        ]
+        time_map = TimeMap.from_edl(edl, frame_rate=24, start={'hours': 1})
+        self.assertEqual(len(time_map), 2)
+        self.assertEqual(time_map.map(5000), 5000)
+        self.assertEqual(time_map.map(15000), None)
+        self.assertEqual(time_map.map(20500), 10000)
+        self.assertEqual(time_map.map(29000), 18500)
+
+    def test_edl_repeated_source(self):
+        time_map = TimeMap.from_edl([
+            '001  AX  V  C  00:00:00:00 00:00:10:00 00:00:00:00\n',
+            '002  AX  V  C  00:00:05:00 00:00:10:00 00:00:10:00\n',
+        ])
+        self.assertEqual(len(time_map), 2)
+        self.assertEqual(time_map.map_ranges(6000, 7000),
+                         [(6000, 7000), (11000, 12000)])
+
+    def test_edl_times(self):
+        time_map = TimeMap.from_edl(['00:00:05.500 00:00:08.000 '
+                                     '00:00:01.000'])
+        self.assertEqual(time_map.map(6000), 1500)
+        self.assertEqual(time_map.map(8000), None)
+
+
+class TestRemap(TestCase):
+
+    def setUp(self):
+        self.file = WebVTTFile([item(0, 1, 'a'), item(2, 3, 'b'),
+                                item(3.5, 4.5, 'c'), item(6, 7, 'd')])
+
+    def test_cut(self):
+        removed = self.file.remap(TimeMap.from_cuts([(1500, 4000)]))
+        self.assertEqual([i.text for i in removed], ['b'])
+        self.assertEqual(bounds(self.file),
+                         [(0, 1000), (1500, 2000), (3500, 4500)])
+
+    def test_anchors(self):
+        self.file.remap([(0, 0), (10000, 20000)])
+        self.assertEqual(bounds(self.file)[1], (4000, 6000))
+
+    def test_repeated_source(self):
+        removed = self.file.remap(TimeMap([(0, 8000, 0, 8000),
+                                           (2000, 4000, 10000, 12000)]))
+        self.assertEqual(removed, [])
+        self.assertEqual([i.text for i in self.file],
+                         ['a', 'b', 'b', 'c', 'c', 'd'])
+        self.assertEqual(bounds(self.file),
+                         [(0, 1000), (2000, 3000), (10000, 11000),
+                          (3500, 4500), (11500, 12000), (6000, 7000)])
+        self.file[2].text = 'copy'
+        self.assertEqual(self.file[1].text, 'b')
+
+    def test_view(self):
+        view = self.file.slice(starts_after=(0, 0, 1, 0))
+        remap(view, [(0, 1000)])
+        self.assertEqual(bounds(self.file)[1], (2000, 3000))
+        self.assertEqual(bounds(view)[0], (3000, 4000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+from unittest import main, TestCase
+
+from pyvtt import WebVTTFile
+from pyvtt.repair import (analyze, repair, Issue, OVERLAP, SHORT_GAP, EMPTY,
+                          NEGATIVE, OUT_OF_ORDER, TRIM, MERGE, STACK)
+from tests.helpers import item
+
+
+class TestAnalyze(TestCase):
+
+    def test_clean_file(self):
+        vtt_file = WebVTTFile([item(0, 1), item(1, 2), item(3, 4)])
+        self.assertEqual(analyze(vtt_file), [])
+
+    def test_durations(self):
+        vtt_file = WebVTTFile([item(0, 1), item(2, 2), item(4, 3)])
+        self.assertEqual(analyze(vtt_file), [Issue(EMPTY, 1, None),
+                                             Issue(NEGATIVE, 2, None)])
+
+    def test_out_of_order(self):
+        vtt_file = WebVTTFile([item(2, 3), item(0, 1)])
+        self.assertEqual(analyze(vtt_file), [Issue(OUT_OF_ORDER, 1, 0)])
+
+    def test_overlap(self):
+        # The first cue covers both following ones
+        vtt_file = WebVTTFile([item(0, 10), item(2, 3), item(5, 6)])
+        self.assertEqual(analyze(vtt_file), [Issue(OVERLAP, 1, 0),
+                                             Issue(OVERLAP, 2, 0)])
+
+    def test_short_gap(self):
+        vtt_file = WebVTTFile([item(0, 1), item(1.1, 2), item(3, 4)])
+        self.assertEqual(analyze(vtt_file, min_gap={'milliseconds': 200}),
+                         [Issue(SHORT_GAP, 1, 0)])
+        self.assertEqual(analyze(vtt_file), [])
+
+
+class TestRepair(TestCase):
+
+    def setUp(self):
+        self.file = WebVTTFile([item(5, 7, 'c'), item(0, 3, 'a'),
+                                item(2, 4, 'b'), item(8, 8, 'empty')])
+
+    def test_trim(self):
+        repair(self.file, overlaps=TRIM)
+        self.assertEqual([(i.start.ordinal, i.end.ordinal, i.text)
+                          for i in self.file],
+                         [(0, 2000, 'a'), (2000, 4000, 'b'),
+                          (5000, 7000, 'c')])
+        self.assertEqual([i.index for i in self.file], [1, 2, 3])
+        self.assertEqual(analyze(self.file), [])
+
+    def test_trim_same_start(self):
+        self.file.append(item(5, 6, 'd'))
+        repair(self.file, overlaps=TRIM)
+        self.assertEqual([(i.start.ordinal, i.end.ordinal, i.text)
+                          for i in self.file],
+                         [(0, 2000, 'a'), (2000, 4000, 'b'),
+                          (5000, 7000, 'd\nc')])
+
+    def test_merge(self):
+        repair(self.file, overlaps=MERGE)
+        self.assertEqual([(i.start.ordinal, i.end.ordinal, i.text)
+                          for i in self.file],
+                         [(0, 4000, 'a\nb'), (5000, 7000, 'c')])
+
+    def test_stack(self):
+        self.file[2].position = 'align:start line:0'
+        repair(self.file, overlaps=STACK)
+        self.assertEqual([i.position for i in self.file],
+                         ['', 'align:start line:-2', ''])
+
+    def test_keep_empty(self):
+        repair(self.file, overlaps=None, drop_empty=False)
+        self.assertEqual(len(self.file), 4)
+        self.assertEqual([i.text for i in self.file], ['a', 'b', 'c', 'empty'])
+
+    def test_close_gaps(self):
+        repair(self.file, min_gap={'seconds': 2})
+        self.assertEqual(self.file[1].end, {'seconds': 5})
+
+    def test_unknown_strategy(self):
+        self.assertRaises(ValueError, repair, self.file, overlaps='foo')
+
+
+if __name__ == '__main__':
+    main()
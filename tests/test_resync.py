@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+from random import Random
+from unittest import main, TestCase
+
+from pyvtt import WebVTTFile, WebVTTItem
+from pyvtt import resync
+
+
+def build_reference(count=300, seed=1):
+    random = Random(seed)
+    items, start = [], 0
+    for index in range(count):
+        start += random.randint(1500, 6000)
+        items.append(WebVTTItem(index + 1, start, start + 1200, 'Reference'))
+    return WebVTTFile(items)
+
+
+def mistime(reference, offset, ratio, jitter=0, keep=1.0, seed=2):
+    # Inverse of the alignment resync should find
+    random = Random(seed)
+    return WebVTTFile([
+        WebVTTItem(item.index,
+                   int((item.start.ordinal - offset) / ratio) +
+                   random.randint(-jitter, jitter),
+                   int((item.end.ordinal - offset) / ratio), 'Mistimed')
+        for item in reference if random.random() < keep])
+
+
+class TestEstimate(TestCase):
+
+    def setUp(self):
+        self.reference = build_reference()
+
+    def estimate(self, vtt_file, **kwargs):
+        return resync.estimate(vtt_file, self.reference, **kwargs)
+
+    def test_aligned(self):
+        alignment = self.estimate(self.reference)
+        self.assertEqual(alignment, resync.Alignment(0, 1.0, 1.0))
+
+    def test_offset(self):
+        for offset in (3270, -12480):
+            alignment = self.estimate(mistime(self.reference, offset, 1.0))
+            self.assertEqual(alignment.ratio, 1.0)
+            self.assertTrue(abs(alignment.offset - offset) <= 1)
+            # Cues moved before 0 are clamped
+            self.assertTrue(alignment.score > 0.99)
+
+    def test_frame_rate(self):
+        ratio = 25 / (24000 / 1001.0)
+        alignment = self.estimate(mistime(self.reference, 1500, ratio))
+        self.assertEqual(alignment.ratio, ratio)
+        self.assertTrue(abs(alignment.offset - 1500) <= 1)
+
+    def test_speech_recognition(self):
+        # Missing cues and start times off by up to 150ms
+        vtt_file = mistime(self.reference, -4200, 1.0, jitter=150, keep=0.7)
+        alignment = self.estimate(vtt_file)
+        self.assertEqual(alignment.ratio, 1.0)
+        self.assertTrue(abs(alignment.offset + 4200) <= 50)
+        self.assertTrue(alignment.score > 0.9)
+
+    def test_max_offset(self):
+        vtt_file = mistime(self.reference, 30000, 1.0)
+        alignment = self.estimate(vtt_file, max_offset=10000, ratios=(1, ))
+        self.assertNotEqual(alignment.offset, 30000)
+
+    def test_empty(self):
+        self.assertEqual(self.estimate(WebVTTFile()),
+                         resync.Alignment(0, 1.0, 0.0))
+
+    def test_resync(self):
+        vtt_file = mistime(self.reference, 2000, 1.0)
+        alignment = vtt_file.resync(self.reference)
+        self.assertEqual(alignment.offset, 2000)
+        self.assertEqual([i.start for i in vtt_file],
+                         [i.start for i in self.reference])
+
+
+class TestEstimateWithoutNumpy(TestEstimate):
+
+    def estimate(self, vtt_file, **kwargs):
+        numpy, resync.numpy = resync.numpy, None
+        try:
+            return resync.estimate(vtt_file, self.reference, **kwargs)
+        finally:
+            resync.numpy = numpy
+
+
+if __name__ == '__main__':
+    main()
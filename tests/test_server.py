@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from io import StringIO
+from json import dumps, loads
+from multiprocessing import active_children
+from os import remove, rmdir
+from os.path import dirname, exists, join
+from socket import AF_UNIX, SOCK_STREAM, socket
+from tempfile import mkdtemp
+from threading import Thread
+from unittest import main, TestCase
+
+from pyvtt.server import Client, Server, handle, handle_line, serve
+
+file_path = join(dirname(__file__), '..')
+
+CONTENT = u"""WEBVTT
+
+1
+00:00:01.000 --> 00:00:02.000
+Hello
+
+2
+00:00:03.000 --> 00:00:04.000
+World
+"""
+
+
+class TestHandle(TestCase):
+
+    def test_shift(self):
+        response = handle({'id': 7, 'args': ['shift', '1s', 'movie.vtt'],
+                           'content': CONTENT})
+        self.assertEqual(response['id'], 7)
+        self.assertTrue('00:00:02.000 --> 00:00:03.000' in
+                        response['output'])
+        self.assertTrue('00:00:04.000 --> 00:00:05.000' in
+                        response['output'])
+
+    def test_numeric_args(self):
+        response = handle({'args': ['rate', 50, 25, 'movie.vtt'],
+                           'content': CONTENT})
+        self.assertTrue('00:00:00.500 --> 00:00:01.000' in
+                        response['output'])
+
+    def test_convert(self):
+        response = handle({'args': ['convert', 'srt', 'movie.vtt'],
+                           'content': CONTENT})
+        self.assertTrue(response['output'].startswith(
+            '1\n00:00:01,000 --> 00:00:02,000\nHello\n'))
+
+    def test_pipe(self):
+        response = handle({'args': ['pipe', 'shift', '-1s', ',', 'rate', '25',
+                                    '50', ',', 'break', '3', 'movie.vtt'],
+                           'content': CONTENT})
+        self.assertTrue('00:00:00.000 --> 00:00:02.000\nHello' in
+                        response['output'])
+        self.assertTrue('00:00:04.000 --> 00:00:06.000\nWorld' in
+                        response['output'])
+        for args in (['pipe', 'movie.vtt'], ['pipe', 'qc', 'movie.vtt'],
+                     ['pipe', 'shift', '1s', ',', 'movie.vtt']):
+            self.assertTrue('error' in handle({'args': args,
+                                               'content': CONTENT}))
+
+    def test_version(self):
+        response = handle({'args': ['--version']})
+        self.assertFalse('error' in response)
+        self.assertTrue(response['output'].strip())
+
+    def test_errors(self):
+        self.assertTrue('parse_rate' in handle(
+            {'args': ['rate', 'abc', '25', 'movie.vtt']})['error'])
+        self.assertTrue('file' in handle({'args': ['shift', '1s']})['error'])
+        self.assertTrue('error' in handle({'args': 'shift 1s movie.vtt'}))
+        self.assertTrue('error' in handle(['shift']))
+        self.assertTrue('error' in handle({'args': ['serve']}))
+        self.assertTrue('error' in handle({'args': ['split', '1s', 'a.vtt'],
+                                           'content': CONTENT}))
+        self.assertTrue('error' in handle({'args': ['-i', 'shift', '1s',
+                                                    'a.vtt'],
+                                           'content': CONTENT}))
+
+    def test_parse_errors(self):
+        content = CONTENT + u'\n3\nnot a timestamp\nLost\n'
+        for command in (['shift', '1s'], ['convert', 'srt']):
+            response = handle({'args': command + ['movie.vtt'],
+                               'content': content})
+            self.assertTrue('PyVTT-InvalidItem' in response['messages'])
+            self.assertTrue('Hello' in response['output'])
+
+    def test_invalid_json(self):
+        response = loads(handle_line('{"args": '))
+        self.assertTrue(response['error'].startswith('Invalid JSON'))
+
+
+class TestServe(TestCase):
+
+    def requests(self):
+        return [dumps({'id': index, 'args': ['shift', '%ss' % index, 'a.vtt'],
+                       'content': CONTENT}) + '\n' for index in range(5)]
+
+    def check_responses(self, lines):
+        responses = [loads(line) for line in lines]
+        self.assertEqual([r['id'] for r in responses], list(range(5)))
+        self.assertTrue('00:00:05.000 --> 00:00:06.000' in
+                        responses[4]['output'])
+
+    def test_stream(self):
+        output = StringIO()
+        serve(input_file=StringIO(u'\n'.join(self.requests())),
+              output_file=output, workers=0)
+        self.check_responses(output.getvalue().splitlines())
+
+    def test_stream_with_workers(self):
+        output = StringIO()
+        serve(input_file=StringIO(u''.join(self.requests())),
+              output_file=output, workers=2)
+        self.check_responses(output.getvalue().splitlines())
+
+
+class TestServer(TestCase):
+
+    def setUp(self):
+        self.directory = mkdtemp()
+        self.socket_path = join(self.directory, 'vtt.sock')
+
+    def tearDown(self):
+        rmdir(self.directory)
+
+    def run_server(self, workers):
+        server = Server(self.socket_path, workers=workers)
+        thread = Thread(target=server.serve_forever)
+        thread.start()
+        try:
+            with Client(self.socket_path) as client:
+                for index in range(3):
+                    response = client.request(['shift', '1s', 'a.vtt'],
+                                              content=CONTENT, id=index)
+                    self.assertEqual(response['id'], index)
+                    self.assertTrue('00:00:02.000 --> 00:00:03.000' in
+                                    response['output'])
+                response = client.request(['shift', 'abc'])
+                self.assertTrue('error' in response)
+        finally:
+            server.shutdown()
+            thread.join()
+            server.server_close()
+        self.assertFalse(exists(self.socket_path))
+
+    def test_inline(self):
+        self.run_server(0)
+
+    def test_workers(self):
+        self.run_server(2)
+
+    def test_stale_socket(self):
+        # Left by a server which did not exit cleanly: nothing listens
+        stale = socket(AF_UNIX, SOCK_STREAM)
+        stale.bind(self.socket_path)
+        stale.close()
+        self.assertTrue(exists(self.socket_path))
+        self.run_server(0)
+
+    def test_socket_in_use(self):
+        server = Server(self.socket_path, workers=0)
+        try:
+            children = len(active_children())
+            self.assertRaises(EnvironmentError, Server, self.socket_path,
+                              workers=2)
+            self.assertEqual(len(active_children()), children)
+            self.assertTrue(exists(self.socket_path))
+        finally:
+            server.server_close()
+        self.assertFalse(exists(self.socket_path))
+
+    def test_other_file(self):
+        open(self.socket_path, 'w').close()
+        try:
+            self.assertRaises(EnvironmentError, Server, self.socket_path,
+                              workers=0)
+            self.assertTrue(exists(self.socket_path))
+        finally:
+            remove(self.socket_path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from codecs import open as copen
+from multiprocessing import Pool
+from os.path import dirname, join
+from unittest import main, skipIf, TestCase
+
+from pyvtt import from_string, WebVTTFile, WebVTTItem
+from pyvtt.compat import str
+from pyvtt.shared import shared_memory, SharedTimeline
+
+file_path = join(dirname(__file__), '..')
+
+
+def count_at(name, seconds):
+    timeline = SharedTimeline.attach(name)
+    try:
+        return len(timeline.at(seconds=seconds))
+    finally:
+        timeline.close()
+
+
+@skipIf(shared_memory is None, 'multiprocessing.shared_memory unavailable')
+class TestSharedTimeline(TestCase):
+
+    def setUp(self):
+        self.file = from_string(copen(
+            join(file_path, 'tests', 'static', 'utf-8.vtt'),
+            encoding='utf_8').read())
+        self.timeline = SharedTimeline.publish(self.file)
+
+    def tearDown(self):
+        self.timeline.close()
+        self.timeline.unlink()
+
+    def assertSameItems(self, items, others):
+        self.assertEqual([str(i) for i in items], [str(i) for i in others])
+
+    def test_items(self):
+        self.assertEqual(len(self.timeline), len(self.file))
+        self.assertSameItems([self.timeline.item(p)
+                              for p in range(len(self.timeline))], self.file)
+
+    def test_at(self):
+        for seconds in (0, 31, 1000, 3600, 10 ** 6):
+            self.assertSameItems(self.timeline.at(seconds=seconds),
+                                 self.file.at(seconds=seconds))
+
+    def test_slice(self):
+        for constraint in ('ends_before', 'ends_after', 'starts_before',
+                           'starts_after'):
+            kwargs = {constraint: (1, 2, 3, 4)}
+            self.assertSameItems(self.timeline.slice(**kwargs),
+                                 self.file.slice(**kwargs))
+
+    def test_attach(self):
+        timeline = SharedTimeline.attach(self.timeline.name)
+        try:
+            self.assertSameItems(timeline.at(seconds=31),
+                                 self.file.at(seconds=31))
+            self.assertRaises(TypeError, timeline.starts.__setitem__, 0, 1)
+        finally:
+            timeline.close()
+
+    def test_other_processes(self):
+        pool = Pool(2)
+        try:
+            counts = pool.starmap(count_at, [(self.timeline.name, 31)] * 2)
+        finally:
+            pool.close()
+            pool.join()
+        self.assertEqual(counts, [1, 1])
+
+    def test_unsorted_file(self):
+        vtt_file = WebVTTFile([
+            WebVTTItem(1, {'seconds': 5}, {'seconds': 6}, u'second'),
+            WebVTTItem(2, {'seconds': 1}, {'seconds': 9}, u'first'),
+        ])
+        with SharedTimeline.publish(vtt_file) as timeline:
+            self.assertEqual([i.text for i in timeline.at(seconds=5.5)],
+                             ['first', 'second'])
+            self.assertEqual([i.index for i in timeline.at(seconds=5.5)],
+                             [2, 1])
+
+    def test_settings_and_indexes(self):
+        vtt_file = WebVTTFile([
+            WebVTTItem(7, {'seconds': 5}, {'seconds': 6}, u'b',
+                       u'align:start line:0'),
+            WebVTTItem(u'intro', {'seconds': 1}, {'seconds': 2}, u'é'),
+            WebVTTItem(None, {'seconds': 3}, {'seconds': 4}, u''),
+        ])
+        with SharedTimeline.publish(vtt_file) as timeline:
+            items = [timeline.item(p) for p in range(len(timeline))]
+            self.assertEqual([i.index for i in items], ['intro', None, 7])
+            self.assertEqual([i.position for i in items],
+                             ['', '', 'align:start line:0'])
+            self.assertEqual([i.text for i in items], [u'é', u'', u'b'])
+            self.assertSameItems(timeline.at(seconds=5.5), vtt_file[:1])
+
+
+if __name__ == '__main__':
+    main()
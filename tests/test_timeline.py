@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from random import Random
+from unittest import main, TestCase
+
+from pyvtt import WebVTTFile, WebVTTItem
+from pyvtt.timeline import Timeline
+
+
+def key(item):
+    return item.start.ordinal, item.end.ordinal
+
+
+class TestTimeline(TestCase):
+
+    def setUp(self):
+        self.random = Random(42)
+
+    def make_item(self, text):
+        start = self.random.randrange(0, 100) * 100
+        return WebVTTItem(None, start, start + self.random.randrange(1, 30),
+                          text)
+
+    def check(self, timeline, expected):
+        expected = sorted(expected, key=key)
+        self.assertEqual(len(timeline), len(expected))
+        self.assertEqual([key(item) for item in timeline],
+                         [key(item) for item in expected])
+        for position in (0, len(expected) // 2, -1):
+            if expected:
+                self.assertEqual(key(timeline[position]),
+                                 key(expected[position]))
+
+    def test_random_edits(self):
+        items = [self.make_item(str(index)) for index in range(50)]
+        timeline = Timeline(items, load_factor=4)
+        expected = list(items)
+        for step in range(500):
+            action = self.random.randrange(3)
+            if action == 0 or not expected:
+                item = self.make_item('new %d' % step)
+                timeline.add(item)
+                expected.append(item)
+            elif action == 1:
+                item = self.random.choice(expected)
+                timeline.remove(item)
+                expected = [other for other in expected if other is not item]
+            else:
+                item = self.random.choice(expected)
+                timeline.retime(item, start=item.start.ordinal + 250,
+                                end=item.end.ordinal + 300)
+            self.check(timeline, expected)
+        for item in expected:
+            self.assertTrue(timeline[timeline.position(item)] is item)
+
+    def test_same_times(self):
+        items = [WebVTTItem(None, 1000, 2000, str(index))
+                 for index in range(10)]
+        timeline = Timeline(items, load_factor=2)
+        timeline.remove(items[7])
+        self.assertEqual([item.text for item in timeline],
+                         [str(index) for index in range(10) if index != 7])
+        self.assertEqual(timeline.position(items[9]), 8)
+        self.assertRaises(ValueError, timeline.remove, items[7])
+
+    def test_positions(self):
+        items = [WebVTTItem(None, index * 1000, index * 1000 + 500, '')
+                 for index in range(20)]
+        timeline = Timeline(items, load_factor=3)
+        del timeline[5]
+        del timeline[-1]
+        self.assertEqual(len(timeline), 18)
+        self.assertTrue(timeline[5] is items[6])
+        self.assertTrue(timeline[-1] is items[18])
+        self.assertRaises(IndexError, timeline.__getitem__, 18)
+        timeline.update([WebVTTItem(None, 5000, 5500, 'back')])
+        self.assertEqual(timeline[5].text, 'back')
+
+    def test_between(self):
+        items = [WebVTTItem(None, index * 1000, index * 1000 + 500, '')
+                 for index in range(20)]
+        timeline = Timeline(items, load_factor=3)
+        self.assertEqual(timeline.between(4000, 9000), items[4:9])
+        self.assertEqual(timeline.between({'seconds': 18}, 99000),
+                         items[18:])
+        self.assertEqual(Timeline().between(0, 1000), [])
+
+    def test_to_file(self):
+        vtt_file = WebVTTFile([WebVTTItem(None, 3000, 4000, 'b'),
+                               WebVTTItem(None, 1000, 2000, 'a')])
+        timeline = vtt_file.timeline()
+        timeline.add(WebVTTItem(None, 2000, 3000, 'ab'))
+        new_file = timeline.to_file(eol='\n')
+        self.assertTrue(new_file.is_sorted)
+        self.assertEqual([(item.index, item.text) for item in new_file],
+                         [(1, 'a'), (2, 'ab'), (3, 'b')])
+        self.assertEqual(new_file.eol, '\n')
+
+    def test_empty(self):
+        timeline = Timeline()
+        item = WebVTTItem(None, 0, 1000, 'only')
+        timeline.add(item)
+        timeline.remove(item)
+        self.assertEqual(len(timeline), 0)
+        self.assertEqual(list(timeline), [])
+        timeline.add(item)
+        self.assertTrue(timeline[0] is item)
+
+
+if __name__ == '__main__':
+    main()
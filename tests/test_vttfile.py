@@ -1,16 +1,20 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 from codecs import open as copen
+from copy import copy
+from io import StringIO
 from os import linesep, remove
 from os.path import abspath, dirname, join
+from pickle import dumps, loads
 from random import randint, shuffle
 from sys import path
 from unittest import main, TestCase
 
 from pyvtt import (from_string, open as vttopen, Error as vttError, stream,
-                   WebVTTFile, WebVTTItem)
+                   WebVTTFile, WebVTTItem, WebVTTTime)
 from pyvtt.compat import str, open
 from pyvtt.vttexc import InvalidFile
+from tests.helpers import item
 
 file_path = join(dirname(__file__), '..')
 path.insert(0, abspath(file_path))
@@ -260,14 +264,14 @@ class TestSerialization(TestCase):
                 " {0} TestEOLConvertion + {0}".format(eols).encode())
             input_eol.close()
 
-            input_file = open(self.temp_eol_path, 'rU', encoding=enc)
+            input_file = open(self.temp_eol_path, 'r', encoding=enc)
             input_file.read()
             self.assertEqual(input_file.newlines, eols)
 
             vtt_file = vttopen(self.temp_eol_path, encoding=enc)
             vtt_file.save(self.temp_eol_path, eol='\n')
 
-            output_file = open(self.temp_eol_path, 'rU', encoding=enc)
+            output_file = open(self.temp_eol_path, 'r', encoding=enc)
             output_file.read()
             self.assertEqual(output_file.newlines, '\n')
 
@@ -289,20 +293,67 @@ class TestSerialization(TestCase):
                 " {0} TestEOLPreservation + {0}".format(eols).encode())
             input_eol.close()
 
-            input_file = open(self.temp_eol_path, 'rU', encoding=enc)
+            input_file = open(self.temp_eol_path, 'r', encoding=enc)
             input_file.read()
             self.assertEqual(eols, input_file.newlines)
 
             vtt_file = vttopen(self.temp_eol_path, encoding=enc)
             vtt_file.save(self.temp_eol_path, eol=input_file.newlines)
 
-            output_file = open(self.temp_eol_path, 'rU', encoding=enc)
+            output_file = open(self.temp_eol_path, 'r', encoding=enc)
             output_file.read()
             self.assertEqual(output_file.newlines, input_file.newlines)
 
             remove(self.temp_eol_path)
 
 
+class TestEncoded(TestCase):
+
+    def setUp(self):
+        self.file = WebVTTFile([
+            WebVTTItem(index, {'seconds': index}, {'seconds': index + 1},
+                       u'Line number %d\nwith é' % index)
+            for index in range(1, 101)], eol='\n', encoding='utf_8')
+
+    def text(self, **kwargs):
+        output = StringIO()
+        self.file.write_into(output, **kwargs)
+        return output.getvalue()
+
+    def test_to_bytes(self):
+        self.assertEqual(self.file.to_bytes(), self.text().encode('utf_8'))
+        self.assertEqual(
+            self.file.to_bytes('cp1252', eol='\r\n', include_indexes=True),
+            self.text(eol='\r\n', include_indexes=True).encode('cp1252'))
+
+    def test_chunks(self):
+        chunks = list(self.file.iter_encoded('utf_16', chunk_size=100))
+        self.assertTrue(len(chunks) > 10)
+        data = b''.join(chunks)
+        self.assertEqual(data.count(u'\ufeff'.encode('utf_16_le')), 1)
+        self.assertEqual(data.decode('utf_16'), self.text())
+
+    def test_write_to_buffer(self):
+        data = self.file.to_bytes()
+        buffer = bytearray(b'head')
+        self.assertEqual(self.file.write_to_buffer(buffer, offset=4),
+                         len(data))
+        self.assertEqual(bytes(buffer), b'head' + data)
+
+        buffer = bytearray(len(data) + 2)
+        self.assertEqual(self.file.write_to_buffer(memoryview(buffer), 2),
+                         len(data))
+        self.assertEqual(bytes(buffer[2:]), data)
+        buffer[:] = bytearray(len(buffer))
+        self.assertRaises(ValueError, self.file.write_to_buffer,
+                          memoryview(buffer), 3)
+        # Nothing written when the file does not fit
+        self.assertEqual(bytes(buffer), bytes(bytearray(len(buffer))))
+
+    def test_empty(self):
+        self.assertRaises(InvalidFile, WebVTTFile().to_bytes)
+
+
 class TestSlice(TestCase):
 
     def setUp(self):
@@ -320,6 +371,47 @@ class TestSlice(TestCase):
         self.assertEqual(len(self.file.at(seconds=31)), 1)
 
 
+class TestTextAt(TestCase):
+
+    def setUp(self):
+        self.file = WebVTTFile([
+            item(0, 3, 'Hello', 1),
+            item(1, 4, 'One <00:00:02.000>two <00:00:03.000>three', 2),
+        ])
+
+    def test_text_at(self):
+        self.assertEqual([text for _, text in self.file.text_at(seconds=1.5)],
+                         ['Hello', 'One '])
+        self.assertEqual([text for _, text in self.file.text_at(seconds=3.5)],
+                         ['One <00:00:02.000>two <00:00:03.000>three'])
+
+    def test_items(self):
+        items = [item for item, _ in self.file.text_at((0, 0, 2, 0))]
+        self.assertEqual(items, list(self.file))
+
+    def test_timestamps_parsed_once(self):
+        pattern = WebVTTItem.RE_INLINE_TIMESTAMP
+        parsed = []
+
+        class Counting(object):
+            def finditer(self, text):
+                parsed.append(text)
+                return pattern.finditer(text)
+        WebVTTItem.RE_INLINE_TIMESTAMP = Counting()
+        try:
+            for milliseconds in range(1500, 3000, 100):
+                self.file.text_at(milliseconds=milliseconds)
+        finally:
+            WebVTTItem.RE_INLINE_TIMESTAMP = pattern
+        self.assertEqual(sorted(parsed), sorted(i.text for i in self.file))
+        self.assertEqual(self.file._shared, None)
+
+    def test_unsorted(self):
+        self.file.reverse()
+        self.assertEqual([text for _, text in self.file.text_at(seconds=1.5)],
+                         ['One ', 'Hello'])
+
+
 class TestShifting(TestCase):
 
     def test_shift(self):
@@ -330,6 +422,35 @@ class TestShifting(TestCase):
         self.assertEqual(vtt_file[0].end, (2, 2, 2, 2))
 
 
+class TestPickling(TestCase):
+
+    def setUp(self):
+        self.file = WebVTTFile([
+            WebVTTItem(1, {'seconds': 1}, {'seconds': 2}, 'Hello'),
+            WebVTTItem('two', {'seconds': 3}, {'seconds': 4}, 'World !',
+                       'align:start'),
+        ], eol='\r\n', path='movie.vtt', encoding='latin-1')
+
+    def test_round_trip(self):
+        for protocol in (0, 2, -1):
+            vtt_file = loads(dumps(self.file, protocol))
+            self.assertEqual([str(i) for i in vtt_file],
+                             [str(i) for i in self.file])
+            self.assertEqual([i.index for i in vtt_file], [1, 'two'])
+            self.assertEqual((vtt_file.eol, vtt_file.path, vtt_file.encoding),
+                             ('\r\n', 'movie.vtt', 'latin-1'))
+
+    def test_default_eol(self):
+        vtt_file = loads(dumps(WebVTTFile([WebVTTItem()])))
+        self.assertEqual(vtt_file._eol, None)
+
+    def test_copy_shares_items(self):
+        clone = copy(self.file)
+        self.assertTrue(clone[0] is self.file[0])
+        clone.append(WebVTTItem())
+        self.assertEqual(len(self.file), 2)
+
+
 class TestText(TestCase):
 
     def test_single_item(self):
@@ -367,6 +488,128 @@ class TestDuckTyping(TestCase):
         self.assertTrue(hasattr(self.duck, '__delitem__'))
 
 
+class TestView(TestCase):
+
+    def setUp(self):
+        self.file = WebVTTFile([item(i, i + 1, str(i), i + 1)
+                                for i in range(3)])
+        self.view = self.file.view()
+
+    def test_shift_view(self):
+        self.view.shift(seconds=10)
+        self.assertEqual([i.start.ordinal for i in self.file],
+                         [0, 1000, 2000])
+        self.assertEqual([i.start.ordinal for i in self.view],
+                         [10000, 11000, 12000])
+
+    def test_alter_original(self):
+        self.file[1].text = 'Altered'
+        self.file.shift(seconds=1)
+        self.assertEqual(self.view.text, '0\n1\n2')
+        self.assertEqual(self.view[0].start.ordinal, 0)
+
+    def test_items_copied_once(self):
+        item = self.view[0]
+        self.assertTrue(self.view[0] is item)
+        self.assertFalse(self.file[0] is item)
+        self.assertTrue(self.file[0] is self.file[0])
+
+    def test_reading_does_not_copy(self):
+        items = list(self.file.data)
+        self.assertEqual(self.view.text, '0\n1\n2')
+        self.assertEqual(self.view.at(seconds=1.5).text, '1')
+        self.view.write_into(StringIO())
+        self.assertTrue(all(a is b for a, b in zip(self.view, items)))
+        self.assertTrue(all(a is b for a, b in zip(self.file, items)))
+
+    def test_edit_methods(self):
+        self.view.break_lines(10)
+        self.view.clean_indexes()
+        # Nothing changed, nothing copied
+        self.assertTrue(self.view.data[0] is self.file.data[0])
+        self.view.apply_replacements([('1', 'one')])
+        self.assertEqual(self.file.text, '0\n1\n2')
+        self.assertEqual(self.view.text, '0\none\n2')
+
+    def test_extend(self):
+        other = WebVTTFile([WebVTTItem(9, 2000, 3000, 'b')])
+        self.file += other
+        self.file[-1].shift(seconds=1)
+        self.file.extend(other)
+        self.file[-1].text = 'changed'
+        self.assertEqual(other[0].start.ordinal, 2000)
+        self.assertEqual(other.text, 'b')
+        self.file.extend(self.view)
+        self.file.shift(seconds=1)
+        self.assertEqual(len(set(id(item) for item in self.file)), 8)
+        self.assertEqual([i.start.ordinal for i in self.view],
+                         [0, 1000, 2000])
+
+    def test_new_items_not_copied(self):
+        item = WebVTTItem(4, text='new')
+        self.view.append(item)
+        self.assertTrue(self.view[-1] is item)
+
+    def test_list_slice(self):
+        head = self.view[:2]
+        head.shift(seconds=1)
+        self.assertEqual(self.file[0].start.ordinal, 0)
+        self.assertEqual(self.view[0].start.ordinal, 0)
+
+    def test_slice_without_view(self):
+        vtt_file = WebVTTFile([WebVTTItem(1, 0, 1000, 'a')])
+        vtt_file[:1][0].shift(seconds=10)
+        self.assertEqual(vtt_file[0].start.ordinal, 0)
+        vtt_file[:1].shift(seconds=10)
+        self.assertEqual(vtt_file[0].start.ordinal, 0)
+
+    def test_pop(self):
+        self.file.pop(0).shift(seconds=10)
+        self.assertEqual(self.view[0].start.ordinal, 0)
+        self.assertEqual(len(self.file), 2)
+
+    def test_add(self):
+        (self.view + WebVTTFile())[0].shift(seconds=10)
+        self.assertEqual(self.file[0].start.ordinal, 0)
+        (WebVTTFile() + self.view)[0].shift(seconds=10)
+        ([] + self.view)[1].shift(seconds=10)
+        self.assertEqual([i.start.ordinal for i in self.view],
+                         [0, 1000, 2000])
+        both = self.file + self.view
+        both.shift(seconds=10)
+        self.assertEqual(len(both), 6)
+        self.assertEqual(len(set(id(item) for item in both)), 6)
+        self.assertEqual([i.start.ordinal for i in self.file],
+                         [0, 1000, 2000])
+
+    def test_mul_and_copy(self):
+        repeated = self.view * 2
+        repeated.shift(seconds=10)
+        self.assertEqual([i.start.ordinal for i in repeated],
+                         [10000, 11000, 12000] * 2)
+        self.view.copy().shift(seconds=10)
+        self.assertEqual([i.start.ordinal for i in self.file],
+                         [0, 1000, 2000])
+        self.assertEqual([i.start.ordinal for i in self.view],
+                         [0, 1000, 2000])
+
+    def test_shift_slice(self):
+        self.file.slice(starts_after={'seconds': 0}).shift(seconds=10)
+        self.file.at(seconds=0.5)[0].text = 'Altered'
+        self.assertEqual([i.start.ordinal for i in self.file],
+                         [0, 1000, 2000])
+        self.assertEqual(self.file.text, '0\n1\n2')
+
+    def test_overlapping_slices(self):
+        # Like `vtt split`: cues on a limit belong to both parts
+        first = self.file.slice(starts_before={'seconds': 1.5})
+        second = self.file.slice(ends_after={'seconds': 1.5})
+        first.shift(seconds=1)
+        second.shift(seconds=-1)
+        self.assertEqual([i.start.ordinal for i in first], [1000, 2000])
+        self.assertEqual([i.start.ordinal for i in second], [0, 1000])
+
+
 class TestEOLProperty(TestCase):
 
     def setUp(self):
@@ -398,6 +641,92 @@ class TestCleanIndexes(TestCase):
             self.assertTrue(first <= second)
 
 
+class TestSorted(TestCase):
+
+    def setUp(self):
+        self.file = WebVTTFile([WebVTTItem(i, i * 1000, i * 1000 + 500, str(i))
+                                for i in range(20)])
+
+    def check(self):
+        keys = [(i.start.ordinal, i.end.ordinal) for i in self.file]
+        self.assertEqual(self.file.is_sorted, keys == sorted(keys))
+
+    def test_list_operations(self):
+        self.assertTrue(self.file.is_sorted)
+        self.file.append(WebVTTItem(None, 30000, 31000))
+        self.assertTrue(self.file.is_sorted)
+        self.file.insert(0, WebVTTItem(None, 40000, 41000))
+        self.check()
+        self.file.sort()
+        self.assertTrue(self.file.is_sorted)
+        self.file += [WebVTTItem(None, 50000, 51000),
+                      WebVTTItem(None, 45000, 46000)]
+        self.check()
+        self.file.sort()
+        self.file[3] = WebVTTItem(None, 3000, 3200)
+        self.check()
+        self.file[3] = WebVTTItem(None, 2000, 2100)
+        self.check()
+        self.file.sort()
+        del self.file[5]
+        self.file.pop()
+        self.assertTrue(self.file.is_sorted)
+        self.file.reverse()
+        self.check()
+        self.file.sort()
+        shuffle(self.file)
+        self.check()
+
+    def test_shift(self):
+        self.file.shift(seconds=-5)
+        self.assertTrue(self.file.is_sorted)
+        self.file.shift(ratio=1.5)
+        self.check()
+        self.file.shift(ratio=-1)
+        self.check()
+
+    def test_add(self):
+        self.file.add(WebVTTItem(None, 5000, 5500, 'After 5'))
+        self.file.add(WebVTTItem(None, 4999, 5100, 'Before 5'))
+        self.assertTrue(self.file.is_sorted)
+        self.assertEqual([i.text for i in self.file[4:8]],
+                         ['4', 'Before 5', '5', 'After 5'])
+
+    def test_sorted_slice(self):
+        reference = WebVTTFile(list(self.file))
+        reference._sorted = False
+        for time in (0, 2500, 3000, 19000, 30000):
+            for key in ('starts_before', 'starts_after'):
+                self.assertEqual(
+                    list(self.file.slice(**{key: time, 'ends_after': 1000})),
+                    list(reference.slice(**{key: time, 'ends_after': 1000})))
+        self.assertTrue(self.file[2:8].is_sorted)
+
+    def test_clean_indexes(self):
+        items = list(self.file)
+        self.file.clean_indexes()
+        self.assertEqual(list(self.file), items)
+        self.assertEqual(self.file[0].index, 1)
+
+    def test_retimed_item(self):
+        # Times changed through items are not tracked by the sorted flag
+        self.file.sort()
+        self.file[4].start = WebVTTTime.coerce({'seconds': 40})
+        self.file[4].end = WebVTTTime.coerce({'seconds': 41})
+        self.assertEqual(
+            [i.text for i in self.file.slice(starts_before={'seconds': 5})],
+            ['0', '1', '2', '3'])
+        self.file[4].shift(seconds=-40)
+        self.assertEqual(
+            [i.text for i in self.file.slice(starts_before={'seconds': 5})],
+            ['0', '1', '2', '3', '4'])
+        self.file[4].shift(seconds=45)
+        self.file.clean_indexes()
+        self.assertTrue(self.file.is_sorted)
+        self.assertEqual(self.file[-1].text, '4')
+        self.assertEqual([i.index for i in self.file], list(range(1, 21)))
+
+
 class TestBOM(TestCase):
     """
     In response of issue #6 https://github.com/byroot/pysrt/issues/6
@@ -426,6 +755,12 @@ class TestBOM(TestCase):
     def test_utf32be(self):
         self.__test_encoding('bom-utf-32-be.srt')
 
+    def test_claimed_encoding(self):
+        for encoding in ('utf-8', 'UTF8', 'utf_8_sig'):
+            vtt_file = vttopen(join(self.base_path, 'bom-utf-8.srt'),
+                               encoding=encoding)
+            self.assertEqual(vtt_file[0].index, 1)
+
 
 class TestIntegration(TestCase):
     """
@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 from codecs import encode as cencode
+from pickle import dumps, loads
 from os.path import abspath, dirname, join
 from re import compile
 from sys import path
@@ -129,6 +130,38 @@ class TestTagRemoval(TestCase):
             'This is a test!')
 
 
+class TestInlineTimestamps(TestCase):
+
+    def setUp(self):
+        self.item = WebVTTItem(1, {'seconds': 1}, {'seconds': 5},
+                               'Never <00:00:02.000>drink '
+                               '<00:03.000>liquid nitrogen.')
+
+    def test_timestamps(self):
+        self.assertEqual(self.item.timestamps, ([2000, 3000], [6, 26]))
+
+    def test_text_at(self):
+        self.assertEqual(self.item.text_at({'seconds': 1}), 'Never ')
+        self.assertEqual(self.item.text_at({'seconds': 2}),
+                         'Never <00:00:02.000>drink ')
+        self.assertEqual(self.item.text_at({'seconds': 4}), self.item.text)
+
+    def test_no_timestamps(self):
+        self.item.text = 'Hello world !'
+        self.assertEqual(self.item.timestamps, ([], []))
+        self.assertEqual(self.item.text_at(0), 'Hello world !')
+
+    def test_cache_invalidation(self):
+        self.assertEqual(len(self.item.timestamps[0]), 2)
+        self.item.text = '<00:00:04.000>Hello'
+        self.assertEqual(self.item.timestamps, ([4000], [0]))
+
+    def test_out_of_order(self):
+        self.item.text = 'a<00:00:03.000>b<00:00:02.000>c'
+        self.assertEqual(self.item.timestamps[0], [3000, 3000])
+        self.assertEqual(self.item.text_at({'milliseconds': 2500}), 'a')
+
+
 class TestShifting(TestCase):
 
     def setUp(self):
@@ -263,5 +296,22 @@ class TestSerialAndParsing(TestCase):
                               self.no_unicode_item)
 
 
+class TestPickling(TestCase):
+
+    def setUp(self):
+        self.item = WebVTTItem('intro', {'seconds': 1}, {'seconds': 2.5},
+                               'Hello <00:00:02.000>world', 'align:start')
+
+    def test_round_trip(self):
+        for protocol in (0, 2, -1):
+            item = loads(dumps(self.item, protocol))
+            self.assertEqual(str(item), str(self.item))
+            self.assertEqual(item.index, 'intro')
+            self.assertEqual(item.text_at({'seconds': 1}), 'Hello ')
+
+    def test_compact(self):
+        self.assertNotIn(b'ordinal', dumps(self.item, 2))
+
+
 if __name__ == '__main__':
     main()
@@ -1,5 +1,7 @@
 #!/usr/bin/env python
+from copy import copy
 from datetime import time
+from pickle import dumps, loads
 from os.path import abspath, dirname, join
 from random import choice, uniform
 from sys import maxsize
@@ -197,5 +199,19 @@ class TestOperators(TestCase):
         self.assertEqual(self.time, (1, 2, 3, 4))
 
 
+class TestPickling(TestCase):
+
+    def test_round_trip(self):
+        time = WebVTTTime(1, 2, 3, 4)
+        self.assertEqual(loads(dumps(time)), time)
+        self.assertEqual(loads(dumps(time, 2)), (1, 2, 3, 4))
+
+    def test_copy(self):
+        time = WebVTTTime(1, 2, 3, 4)
+        clone = copy(time)
+        clone.shift(seconds=1)
+        self.assertEqual(time, (1, 2, 3, 4))
+
+
 if __name__ == '__main__':
     main()